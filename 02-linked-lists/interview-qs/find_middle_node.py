@@ -1,8 +1,11 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        
+import os
+import sys
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from dsa.node import SinglyNode as Node  # noqa: E402
+
 
 class LinkedList:
     def __init__(self, value):
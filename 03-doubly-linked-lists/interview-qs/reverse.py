@@ -1,9 +1,11 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        self.prev = None
-        
+import os
+import sys
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from dsa.node import DoublyNode as Node  # noqa: E402
+
 
 class DoublyLinkedList:
     def __init__(self, value):
@@ -1,60 +1,47 @@
-def funcOne():
-    """
-    Entry function in the call chain.
+# ============================================================
+# Recursion - Example Usage
+# ============================================================
+#
+# The implementation lives in dsa/recursion.py so it can be
+# imported without running this demo.
 
-    Logic:
-    1. Calls funcTwo(), transferring control to the next stack frame.
-    2. Prints "One" after funcTwo() completes and returns.
-    """
-    funcTwo()
-    print("One")
+import os
+import sys
 
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def funcTwo():
-    """
-    Intermediate function in the call chain.
+from dsa.cache import memoize  # noqa: E402
+from dsa.recursion import factorial, funcOne  # noqa: E402
 
-    Logic:
-    1. Calls funcThree(), pushing a new stack frame.
-    2. Prints "Two" after funcThree() completes and returns.
-    """
-    funcThree()
-    print("Two")
-
-
-def funcThree():
-    """
-    Leaf function in the call chain.
-
-    Logic:
-    1. Executes a print statement.
-    2. Returns implicitly (None).
-    """
-    print("Three")
 
+@memoize(max_entries=128)
+def memo_factorial(n):
+    # Same as factorial, but the recursive call goes through the
+    # decorated name, so every level is cached
+    if n == 1:
+        return n
+    return n * memo_factorial(n - 1)
 
-# ---------------------------
-# Function Call Stack Demo
-# ---------------------------
 
-funcOne()
+if __name__ == "__main__":
 
+    # ---------------------------
+    # Function Call Stack Demo
+    # ---------------------------
 
-def factorial(n):
-    """
-    Compute factorial of a positive integer using recursion.
+    funcOne()
 
-    Logic:
-    1. Base case: if n == 1, return 1.
-    2. Recursive case: n * factorial(n - 1).
-    """
-    if n == 1:
-        return n
-    return n * factorial(n - 1)
+    # ---------------------------
+    # Recursion Demo
+    # ---------------------------
 
+    print(factorial(4))
 
-# ---------------------------
-# Recursion Demo
-# ---------------------------
+    # ---------------------------
+    # Memoized Recursion Demo
+    # ---------------------------
 
-print(factorial(4))
+    print(memo_factorial(10))     # 10 misses: computes 10, 9, ..., 1
+    print(memo_factorial(12))     # 2 misses (12, 11), then a hit on 10
+    print(memo_factorial.cache.stats())
@@ -0,0 +1,94 @@
+# ============================================================
+# Benchmark: ArrayStack vs linked Stack vs list
+# ============================================================
+#
+# Each workload runs --ops pushes followed by --ops pops:
+#   single : one push / pop call per value
+#   batch  : push_many / pop_many in blocks of --batch
+#            (list uses extend and a slice + del)
+# ArrayStack is measured in object mode and in typed mode ('q').
+#
+# Usage:
+#     python benchmarks/bench_array_stack.py --ops 1000000 --batch 1024
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.array_stack import ArrayStack  # noqa: E402
+from dsa.stacks_and_queues import Stack  # noqa: E402
+
+
+def single(stack, push_name, pop_name, ops):
+    push = getattr(stack, push_name)
+    pop = getattr(stack, pop_name)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        push(i)
+    for _ in range(ops):
+        pop()
+    return time.perf_counter() - start
+
+
+def array_batch(stack, ops, batch):
+    block = list(range(batch))
+    rounds = ops // batch
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        stack.push_many(block)
+    for _ in range(rounds):
+        stack.pop_many(batch)
+    return time.perf_counter() - start
+
+
+def list_batch(ops, batch):
+    stack = []
+    block = list(range(batch))
+    rounds = ops // batch
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        stack.extend(block)
+    for _ in range(rounds):
+        values = stack[-batch:]
+        del stack[-batch:]
+        values.reverse()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ArrayStack push/pop benchmark")
+    parser.add_argument("--ops", type=int, default=10**6)
+    parser.add_argument("--batch", type=int, default=1024)
+    args = parser.parse_args()
+
+    ops, batch = args.ops, args.batch
+    rows = [
+        ("Stack single", lambda: single(Stack(), "push", "pop", ops)),
+        ("ArrayStack single", lambda: single(ArrayStack(), "push", "pop", ops)),
+        ("ArrayStack[q] single", lambda: single(ArrayStack(typecode="q"), "push", "pop", ops)),
+        ("list single", lambda: single([], "append", "pop", ops)),
+        ("ArrayStack batch", lambda: array_batch(ArrayStack(), ops, batch)),
+        ("ArrayStack[q] batch", lambda: array_batch(ArrayStack(typecode="q"), ops, batch)),
+        ("list batch", lambda: list_batch(ops, batch)),
+    ]
+
+    print(f"{ops} pushes then {ops} pops (seconds)")
+    for name, run in rows:
+        gc.disable()
+        try:
+            elapsed = run()
+        finally:
+            gc.enable()
+        print(f"{name:>22} {elapsed:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# ============================================================
+# Benchmark: plain vs AVL vs red-black BinarySearchTree
+# ============================================================
+#
+# Inserts --keys keys in sorted order and in random order into each
+# balance mode, then looks every key up with contains. Reports
+# seconds for both phases and the final tree height (log2(n) is the
+# best any binary tree can do).
+#
+# Sorted input turns the plain tree into a linked list (height n and
+# O(n^2) inserts), so that run is skipped above --plain-sorted-max
+# keys.
+#
+# Usage:
+#     python benchmarks/bench_balanced_tree.py --keys 1000000
+
+import argparse
+import gc
+import math
+import os
+import random
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.tree import BinarySearchTree  # noqa: E402
+
+
+def run(balance, keys):
+    tree = BinarySearchTree(balance)
+    insert = tree.insert
+    contains = tree.contains
+
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for key in keys:
+            insert(key)
+        inserted = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            contains(key)
+        searched = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    return inserted, searched, tree.height()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Balanced BST benchmark")
+    parser.add_argument("--keys", type=int, default=10**6)
+    parser.add_argument("--plain-sorted-max", type=int, default=10**4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sorted_keys = list(range(args.keys))
+    random_keys = sorted_keys[:]
+    random.Random(args.seed).shuffle(random_keys)
+
+    print(f"{args.keys} keys (seconds; log2(n) = {math.log2(args.keys):.1f})")
+    print(f"{'order':>7} {'balance':>10} {'insert':>8} {'contains':>9} {'height':>7}")
+
+    for order, keys in (("sorted", sorted_keys), ("random", random_keys)):
+        for balance in (None, "avl", "red-black"):
+            name = balance or "plain"
+            if balance is None and order == "sorted" and args.keys > args.plain_sorted_max:
+                print(f"{order:>7} {name:>10} {'skipped':>8} {'skipped':>9} {args.keys:>7}")
+                continue
+            inserted, searched, height = run(balance, keys)
+            print(f"{order:>7} {name:>10} {inserted:8.3f} {searched:9.3f} {height:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# ============================================================
+# Benchmark: one call per value vs extend / from_iterable
+# ============================================================
+#
+# Builds each linked structure from --values integers twice: once
+# with a loop of append / push / enqueue calls, once with
+# from_iterable (a single-pass extend). The garbage collector is
+# paused while timing so collections of earlier chains do not skew
+# later runs.
+#
+# Usage:
+#     python benchmarks/bench_bulk_build.py --values 1000000
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.doubly_linked_list import DoublyLinkedList  # noqa: E402
+from dsa.linked_list import LinkedList  # noqa: E402
+from dsa.stacks_and_queues import Queue, Stack  # noqa: E402
+
+# name -> (class, per-value method name)
+STRUCTURES = {
+    "LinkedList": (LinkedList, "append"),
+    "DoublyLinkedList": (DoublyLinkedList, "append"),
+    "Stack": (Stack, "push"),
+    "Queue": (Queue, "enqueue"),
+}
+
+
+def timed(build):
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = build()
+        return time.perf_counter() - start, result
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Linked structure bulk build benchmark")
+    parser.add_argument("--values", type=int, default=10**6)
+    args = parser.parse_args()
+
+    values = list(range(args.values))
+    print(f"building from {args.values} values (seconds)")
+    print(f"{'structure':>18} {'loop':>10} {'bulk':>10} {'speedup':>8}")
+
+    for name, (cls, method) in STRUCTURES.items():
+        def build_loop():
+            container = cls()
+            add = getattr(container, method)
+            for value in values:
+                add(value)
+            return container
+
+        loop_time, looped = timed(build_loop)
+        del looped
+        bulk_time, bulk = timed(lambda: cls.from_iterable(values))
+        del bulk
+
+        print(f"{name:>18} {loop_time:10.3f} {bulk_time:10.3f} {loop_time / bulk_time:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
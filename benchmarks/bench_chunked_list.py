@@ -0,0 +1,85 @@
+# ============================================================
+# Benchmark: ChunkedList vs collections.deque vs LinkedList
+# ============================================================
+#
+# Each workload runs --ops operations split evenly between pushes and
+# pops:
+#   stack-tail : append n/2, then pop n/2 from the tail
+#   queue      : append n/2, then pop_first n/2
+#   stack-head : prepend n/2, then pop_first n/2
+#
+# LinkedList.pop walks the whole list, so its stack-tail run is
+# O(n^2) and is skipped above --linked-tail-max operations.
+#
+# Usage:
+#     python benchmarks/bench_chunked_list.py --ops 1000000
+
+import argparse
+import collections
+import os
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.chunked_list import ChunkedList  # noqa: E402
+from dsa.linked_list import LinkedList  # noqa: E402
+
+
+# name -> (constructor, push method, pop method) per workload
+STRUCTURES = {
+    "deque": (collections.deque, {
+        "stack-tail": ("append", "pop"),
+        "queue": ("append", "popleft"),
+        "stack-head": ("appendleft", "popleft"),
+    }),
+    "ChunkedList": (ChunkedList, {
+        "stack-tail": ("append", "pop"),
+        "queue": ("append", "pop_first"),
+        "stack-head": ("prepend", "pop_first"),
+    }),
+    "LinkedList": (LinkedList, {
+        "stack-tail": ("append", "pop"),
+        "queue": ("append", "pop_first"),
+        "stack-head": ("prepend", "pop_first"),
+    }),
+}
+
+
+def run(make, push_name, pop_name, half):
+    container = make()
+    push = getattr(container, push_name)
+    pop = getattr(container, pop_name)
+
+    start = time.perf_counter()
+    for i in range(half):
+        push(i)
+    for _ in range(half):
+        pop()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ChunkedList push/pop benchmark")
+    parser.add_argument("--ops", type=int, default=10**6)
+    parser.add_argument("--linked-tail-max", type=int, default=2 * 10**4)
+    args = parser.parse_args()
+
+    half = args.ops // 2
+    print(f"{args.ops} operations per workload (seconds)")
+    print(f"{'workload':>12} {'deque':>10} {'ChunkedList':>12} {'LinkedList':>12}")
+
+    for workload in ("stack-tail", "queue", "stack-head"):
+        row = []
+        for name, (make, methods) in STRUCTURES.items():
+            if name == "LinkedList" and workload == "stack-tail" and args.ops > args.linked_tail_max:
+                row.append("skipped")
+                continue
+            push_name, pop_name = methods[workload]
+            row.append(f"{run(make, push_name, pop_name, half):.3f}")
+        print(f"{workload:>12} {row[0]:>10} {row[1]:>12} {row[2]:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# ============================================================
+# Benchmark: chained HashTable vs OpenAddressingHashTable
+# ============================================================
+#
+# Times n inserts followed by n lookups for n = 10^3 .. 10^max.
+# The chained table has a fixed 7 buckets, so its lookups are O(n);
+# it is only run up to --chained-max keys to keep the run finite.
+#
+# Usage:
+#     python benchmarks/bench_hash_table.py --max-exp 7
+
+import argparse
+import os
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.hash_table import HashTable  # noqa: E402
+from dsa.open_hash_table import OpenAddressingHashTable  # noqa: E402
+
+
+def run(table, keys):
+    start = time.perf_counter()
+    for key in keys:
+        table.set_item(key, 1)
+    inserted = time.perf_counter()
+    for key in keys:
+        table.get_item(key)
+    done = time.perf_counter()
+    return inserted - start, done - inserted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chained vs open-addressing HashTable")
+    parser.add_argument("--max-exp", type=int, default=6)
+    parser.add_argument("--chained-max", type=int, default=10**4)
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'table':>12} {'insert s':>10} {'lookup s':>10}")
+    for exp in range(3, args.max_exp + 1):
+        n = 10**exp
+        keys = [f"key{i}" for i in range(n)]
+
+        if n <= args.chained_max:
+            insert_s, lookup_s = run(HashTable(), keys)
+            print(f"{n:>10} {'chained':>12} {insert_s:>10.3f} {lookup_s:>10.3f}")
+        else:
+            print(f"{n:>10} {'chained':>12} {'skipped':>10} {'skipped':>10}")
+
+        insert_s, lookup_s = run(OpenAddressingHashTable(), keys)
+        print(f"{n:>10} {'open':>12} {insert_s:>10.3f} {lookup_s:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
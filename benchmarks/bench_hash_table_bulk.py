@@ -0,0 +1,79 @@
+# ============================================================
+# Benchmark: HashTable bulk APIs vs one call per key
+# ============================================================
+#
+# Compares a loop of set_item / get_item against from_items,
+# set_many and get_many, and reports seconds per million keys.
+# Both tables get the same number of buckets so only the call
+# pattern differs. The garbage collector is paused while timing,
+# as timeit does, so GC passes over earlier tables do not skew the
+# later measurements.
+#
+# Usage:
+#     python benchmarks/bench_hash_table_bulk.py --keys 1000000 --hasher fnv
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.hash_table import HashTable  # noqa: E402
+from dsa.hashers import BuiltinHasher, FNV1aHasher, SipHasher  # noqa: E402
+
+HASHERS = {
+    "builtin": BuiltinHasher,
+    "fnv": FNV1aHasher,
+    "sip": lambda: SipHasher(seed=0),
+}
+
+
+def per_million(seconds, n):
+    return seconds * 1_000_000 / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HashTable bulk load benchmark")
+    parser.add_argument("--keys", type=int, default=10**6)
+    parser.add_argument("--hasher", choices=sorted(HASHERS), default="builtin")
+    args = parser.parse_args()
+
+    n = args.keys
+    items = [(f"key{i}", i) for i in range(n)]
+    keys = [key for key, _ in items]
+    make_hasher = HASHERS[args.hasher]
+
+    gc.disable()
+    start = time.perf_counter()
+    looped = HashTable(size=n, hasher=make_hasher())
+    for key, value in items:
+        looped.set_item(key, value)
+    loop_set = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in keys:
+        looped.get_item(key)
+    loop_get = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = HashTable.from_items(items, expected_size=n, hasher=make_hasher())
+    bulk_set = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk.get_many(keys)
+    bulk_get = time.perf_counter() - start
+    gc.enable()
+
+    print(f"{n} keys, {args.hasher} hasher (seconds per million keys)")
+    print(f"{'':>12} {'loop':>10} {'bulk':>10} {'speedup':>8}")
+    print(f"{'insert':>12} {per_million(loop_set, n):>10.3f} "
+          f"{per_million(bulk_set, n):>10.3f} {loop_set / bulk_set:>7.2f}x")
+    print(f"{'lookup':>12} {per_million(loop_get, n):>10.3f} "
+          f"{per_million(bulk_get, n):>10.3f} {loop_get / bulk_get:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
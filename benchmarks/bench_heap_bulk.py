@@ -0,0 +1,77 @@
+# ============================================================
+# Benchmark: MaxHeap bulk build and top-k
+# ============================================================
+#
+# Builds a heap of --size random scores:
+#   insert loop   : one insert (bubble up) per score, O(n log n)
+#   from_iterable : one bottom-up heapify pass, O(n)
+# then reads the top --k scores:
+#   remove loop   : k remove calls (changes the heap)
+#   pop_many(k)   : same result in one call
+#   nlargest(k)   : O(k log k) walk, heap left unchanged
+#
+# Usage:
+#     python benchmarks/bench_heap_bulk.py --size 1000000 --k 100
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.heap import MaxHeap  # noqa: E402
+
+
+def timed(run):
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = run()
+        return time.perf_counter() - start, result
+    finally:
+        gc.enable()
+
+
+def insert_loop(scores):
+    heap = MaxHeap()
+    for score in scores:
+        heap.insert(score)
+    return heap
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MaxHeap bulk benchmark")
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--k", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    scores = [rng.random() for _ in range(args.size)]
+    k = args.k
+
+    print(f"{args.size} scores, top {k} (seconds)")
+
+    elapsed, _ = timed(lambda: insert_loop(scores))
+    print(f"{'insert loop':>14} {elapsed:9.4f}")
+    elapsed, heap = timed(lambda: MaxHeap.from_iterable(scores))
+    print(f"{'from_iterable':>14} {elapsed:9.4f}")
+
+    elapsed, top = timed(lambda: heap.nlargest(k))
+    print(f"{'nlargest':>14} {elapsed:9.4f}")
+    assert top == sorted(scores, reverse=True)[:k]
+
+    elapsed, _ = timed(lambda: heap.pop_many(k))
+    print(f"{'pop_many':>14} {elapsed:9.4f}")
+
+    other = MaxHeap.from_iterable(scores)
+    elapsed, _ = timed(lambda: [other.remove() for _ in range(k)])
+    print(f"{'remove loop':>14} {elapsed:9.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# ============================================================
+# Benchmark: IndexedMaxHeap.update_priority vs remove + reinsert
+# ============================================================
+#
+# Queues --jobs jobs, then changes the priority of --updates random
+# jobs:
+#   MaxHeap        : (priority, job) pairs; find the job with a linear
+#                    scan, take it out, insert the new pair
+#   IndexedMaxHeap : position map lookup + one bubble up / sink down
+#
+# Usage:
+#     python benchmarks/bench_indexed_heap.py --jobs 100000 --updates 1000
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.heap import IndexedMaxHeap, MaxHeap  # noqa: E402
+
+
+def reinsert(heap, job, priority):
+    entries = heap.heap
+    index = next(i for i, entry in enumerate(entries) if entry[1] == job)
+
+    # Fill the hole with the last entry and restore the heap around it
+    last = entries.pop()
+    if index < len(entries):
+        entries[index] = last
+        while index > 0 and entries[index] > entries[heap._parent(index)]:
+            heap._swap(index, heap._parent(index))
+            index = heap._parent(index)
+        heap._sink_down(index)
+
+    heap.insert((priority, job))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Indexed heap benchmark")
+    parser.add_argument("--jobs", type=int, default=10**5)
+    parser.add_argument("--updates", type=int, default=10**3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    priorities = [rng.random() for _ in range(args.jobs)]
+    updates = [(rng.randrange(args.jobs), rng.random()) for _ in range(args.updates)]
+
+    plain = MaxHeap()
+    indexed = IndexedMaxHeap()
+    for job, priority in enumerate(priorities):
+        plain.insert((priority, job))
+        indexed.insert(job, priority)
+
+    print(f"{args.updates} priority updates on {args.jobs} jobs (seconds)")
+
+    start = time.perf_counter()
+    for job, priority in updates:
+        reinsert(plain, job, priority)
+    print(f"{'MaxHeap':>16} {time.perf_counter() - start:9.4f}")
+
+    start = time.perf_counter()
+    for job, priority in updates:
+        indexed.update_priority(job, priority)
+    print(f"{'IndexedMaxHeap':>16} {time.perf_counter() - start:9.4f}")
+
+
+if __name__ == "__main__":
+    main()
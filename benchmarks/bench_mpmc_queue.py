@@ -0,0 +1,109 @@
+# ============================================================
+# Benchmark: multi-producer / multi-consumer queue throughput
+# ============================================================
+#
+# --producers threads each put --items values, --consumers threads take
+# them until they see a stop marker. Compares:
+#   ConcurrentQueue   : two-lock queue, blocking get
+#   queue.Queue       : the standard library's single-lock queue
+#   Queue+global lock : the linked Queue with every call wrapped in
+#                       one lock (consumers poll when it is empty)
+#
+# Under the GIL only one thread runs Python code at a time, so this
+# measures locking and hand-off overhead rather than parallel speedup.
+# ConcurrentQueue also prints its contention counters.
+#
+# Usage:
+#     python benchmarks/bench_mpmc_queue.py --producers 4 --consumers 4 --items 100000
+
+import argparse
+import os
+import queue
+import sys
+import threading
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.concurrent_queues import ConcurrentQueue  # noqa: E402
+from dsa.stacks_and_queues import Queue  # noqa: E402
+
+_STOP = object()
+
+
+class GlobalLockQueue:
+    """
+    The pattern ConcurrentQueue replaces: one lock around a plain Queue.
+    """
+
+    def __init__(self):
+        self._queue = Queue()
+        self._lock = threading.Lock()
+
+    def put(self, value):
+        with self._lock:
+            self._queue.enqueue(value)
+
+    def get(self):
+        while True:
+            with self._lock:
+                node = self._queue.dequeue()
+            if node is not None:
+                return node.value
+            time.sleep(0)
+
+
+def run(shared, producers, consumers, items):
+    put, get = shared.put, shared.get
+
+    def produce():
+        for i in range(items):
+            put(i)
+
+    def consume():
+        while get() is not _STOP:
+            pass
+
+    consumer_threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+
+    start = time.perf_counter()
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    for _ in range(consumers):
+        put(_STOP)
+    for thread in consumer_threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MPMC queue throughput benchmark")
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--consumers", type=int, default=4)
+    parser.add_argument("--items", type=int, default=10**5, help="values per producer")
+    parser.add_argument("--maxsize", type=int, default=0, help="bound for ConcurrentQueue / queue.Queue")
+    args = parser.parse_args()
+
+    total = args.producers * args.items
+    print(f"{args.producers} producers x {args.items} values, {args.consumers} consumers")
+    print("(thousand values / second)")
+
+    concurrent = ConcurrentQueue(args.maxsize)
+    rows = [
+        ("ConcurrentQueue", concurrent),
+        ("queue.Queue", queue.Queue(args.maxsize)),
+        ("Queue+global lock", GlobalLockQueue()),
+    ]
+    for name, shared in rows:
+        elapsed = run(shared, args.producers, args.consumers, args.items)
+        print(f"{name:>18} {total / elapsed / 1e3:10.1f}")
+
+    print("ConcurrentQueue stats:", concurrent.stats())
+
+
+if __name__ == "__main__":
+    main()
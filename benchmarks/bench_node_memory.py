@@ -0,0 +1,127 @@
+# ============================================================
+# Benchmark: bytes per element with dict vs __slots__ nodes
+# ============================================================
+#
+# Builds each linked structure with --size elements under tracemalloc
+# and reports the traced bytes per element. "before" swaps each
+# module's Node for an equivalent class without __slots__ (the
+# original course definition); "after" uses the shared dsa.node types.
+# Values are created before tracing starts, so only the structure's
+# own allocations are counted.
+#
+# Usage:
+#     python benchmarks/bench_node_memory.py --size 100000
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa import doubly_linked_list, linked_list, stacks_and_queues, tree  # noqa: E402
+
+
+class DictSinglyNode:
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+
+
+class DictDoublyNode:
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+        self.prev = None
+
+
+class DictTreeNode:
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+def build_linked_list(values):
+    structure = linked_list.LinkedList(values[0])
+    for value in values[1:]:
+        structure.append(value)
+    return structure
+
+
+def build_doubly_linked_list(values):
+    structure = doubly_linked_list.DoublyLinkedList(values[0])
+    for value in values[1:]:
+        structure.append(value)
+    return structure
+
+
+def build_stack(values):
+    structure = stacks_and_queues.Stack(values[0])
+    for value in values[1:]:
+        structure.push(value)
+    return structure
+
+
+def build_queue(values):
+    structure = stacks_and_queues.Queue(values[0])
+    for value in values[1:]:
+        structure.enqueue(value)
+    return structure
+
+
+def build_tree(values):
+    structure = tree.BinarySearchTree()
+    for value in values:
+        structure.insert(value)
+    return structure
+
+
+# name -> (module whose Node is swapped, dict-based Node, builder)
+STRUCTURES = [
+    ("LinkedList", linked_list, DictSinglyNode, build_linked_list),
+    ("DoublyLinkedList", doubly_linked_list, DictDoublyNode, build_doubly_linked_list),
+    ("Stack", stacks_and_queues, DictSinglyNode, build_stack),
+    ("Queue", stacks_and_queues, DictSinglyNode, build_queue),
+    ("BinarySearchTree", tree, DictTreeNode, build_tree),
+]
+
+
+def bytes_per_element(build, values):
+    tracemalloc.start()
+    structure = build(values)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return used / len(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Node memory benchmark")
+    parser.add_argument("--size", type=int, default=10**5)
+    args = parser.parse_args()
+
+    values = list(range(args.size))
+    random.shuffle(values)   # keeps the BST from degenerating
+
+    print(f"{args.size} elements (bytes per element)")
+    print(f"{'structure':>18} {'before':>8} {'after':>8} {'saved':>7}")
+
+    for name, module, dict_node, build in STRUCTURES:
+        slots_node = module.Node
+
+        module.Node = dict_node
+        try:
+            before = bytes_per_element(build, values)
+        finally:
+            module.Node = slots_node
+        after = bytes_per_element(build, values)
+
+        print(f"{name:>18} {before:>8.1f} {after:>8.1f} {1 - after / before:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# ============================================================
+# Benchmark: lock-free readers on ConcurrentTree vs a locked BST
+# ============================================================
+#
+# --readers threads call contains on random keys while one writer
+# thread keeps inserting and deleting keys, for --seconds seconds:
+#   locked BST     : red-black BinarySearchTree, one lock around
+#                    every read and every write
+#   ConcurrentTree : readers search the current immutable version
+#                    without locking; the writer publishes new
+#                    versions by swapping one reference
+# Reports total reads and writes per second.
+#
+# Usage:
+#     python benchmarks/bench_persistent_tree.py --keys 100000 --readers 8
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.persistent_tree import ConcurrentTree  # noqa: E402
+from dsa.tree import BinarySearchTree  # noqa: E402
+
+
+class LockedTree:
+    """
+    BinarySearchTree with every call serialized behind one lock.
+    """
+
+    def __init__(self):
+        self._tree = BinarySearchTree("red-black")
+        self._lock = threading.Lock()
+
+    def insert(self, value):
+        with self._lock:
+            return self._tree.insert(value)
+
+    def delete(self, value):
+        with self._lock:
+            return self._tree.delete(value)
+
+    def contains(self, value):
+        with self._lock:
+            return self._tree.contains(value)
+
+
+def run(tree, keys, readers, seconds):
+    for key in keys[::2]:
+        tree.insert(key)
+
+    stop = threading.Event()
+    reads = [0] * readers
+    writes = [0]
+
+    def reader(slot):
+        rng = random.Random(slot)
+        contains = tree.contains
+        count = 0
+        while not stop.is_set():
+            for key in rng.choices(keys, k=256):
+                contains(key)
+            count += 256
+        reads[slot] = count
+
+    def writer():
+        rng = random.Random(-1)
+        count = 0
+        while not stop.is_set():
+            key = rng.choice(keys)
+            if not tree.insert(key):
+                tree.delete(key)
+            count += 1
+        writes[0] = count
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return sum(reads) / seconds, writes[0] / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent tree reader benchmark")
+    parser.add_argument("--keys", type=int, default=10**5)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    keys = list(range(args.keys))
+    print(f"{args.readers} readers + 1 writer, {args.keys} keys, {args.seconds}s")
+    print(f"{'tree':>16} {'reads/s':>12} {'writes/s':>10}")
+    for name, make in (("locked BST", LockedTree), ("ConcurrentTree", ConcurrentTree)):
+        reads, writes = run(make(), keys, args.readers, args.seconds)
+        print(f"{name:>16} {reads:12.0f} {writes:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# ============================================================
+# Benchmark: RingQueue vs linked Queue vs collections.deque
+# ============================================================
+#
+# Simulates a pipeline stage handing items to the next one: --items
+# values are pushed through a queue in rounds of --batch (enqueue a
+# round, then dequeue it). Reports items per second for
+#   single : one enqueue / dequeue call per item
+#   batch  : one enqueue_many / dequeue_many call per round
+#            (RingQueue only; deque uses extend + popleft)
+#
+# Usage:
+#     python benchmarks/bench_ring_queue.py --items 1000000 --batch 256
+
+import argparse
+import collections
+import gc
+import os
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.ring_queue import RingQueue  # noqa: E402
+from dsa.stacks_and_queues import Queue  # noqa: E402
+
+
+def single(container, put_name, get_name, items, batch):
+    put = getattr(container, put_name)
+    get = getattr(container, get_name)
+    rounds = items // batch
+    block = range(batch)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for i in block:
+            put(i)
+        for _ in block:
+            get()
+    return time.perf_counter() - start
+
+
+def ring_batch(items, batch):
+    ring = RingQueue(batch, on_full="raise")
+    rounds = items // batch
+    block = list(range(batch))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        ring.enqueue_many(block)
+        ring.dequeue_many(batch)
+    return time.perf_counter() - start
+
+
+def deque_batch(items, batch):
+    queue = collections.deque()
+    rounds = items // batch
+    block = list(range(batch))
+    popleft = queue.popleft
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        queue.extend(block)
+        [popleft() for _ in block]
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RingQueue throughput benchmark")
+    parser.add_argument("--items", type=int, default=10**6)
+    parser.add_argument("--batch", type=int, default=256)
+    args = parser.parse_args()
+
+    n, batch = args.items, args.batch
+    rows = [
+        ("Queue single", lambda: single(Queue(), "enqueue", "dequeue", n, batch)),
+        ("RingQueue single", lambda: single(RingQueue(batch), "enqueue", "dequeue", n, batch)),
+        ("deque single", lambda: single(collections.deque(), "append", "popleft", n, batch)),
+        ("RingQueue batch", lambda: ring_batch(n, batch)),
+        ("deque batch", lambda: deque_batch(n, batch)),
+    ]
+
+    print(f"{n} items in rounds of {batch} (million items / second)")
+    for name, run in rows:
+        gc.disable()
+        try:
+            elapsed = run()
+        finally:
+            gc.enable()
+        print(f"{name:>18} {n / elapsed / 1e6:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
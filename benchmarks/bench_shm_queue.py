@@ -0,0 +1,83 @@
+# ============================================================
+# Benchmark: shared-memory ring queues vs multiprocessing.Queue
+# ============================================================
+#
+# A parent process sends --messages small byte strings (--size bytes
+# each) to one child process, which reads them all and exits. Reports
+# messages per second for:
+#   SPSCQueue             : lock-free ring in shared memory
+#   MPMCQueue             : same ring with a lock per end
+#   multiprocessing.Queue : pipe + feeder thread + pickling
+#
+# On a single-core machine the two processes take turns, so the
+# numbers mostly measure per-message overhead.
+#
+# Usage:
+#     python benchmarks/bench_shm_queue.py --messages 1000000 --size 32
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.shm_queue import MPMCQueue, SPSCQueue  # noqa: E402
+
+
+def drain_ring(ring, count):
+    dequeue = ring.dequeue
+    for _ in range(count):
+        dequeue()
+    ring.close()
+
+
+def drain_pipe(pipe_queue, count):
+    get = pipe_queue.get
+    for _ in range(count):
+        get()
+
+
+def run(make_queue, drain, count, payload):
+    shared = make_queue()
+    child = multiprocessing.Process(target=drain, args=(shared, count))
+    child.start()
+
+    put = shared.enqueue if hasattr(shared, "enqueue") else shared.put
+    start = time.perf_counter()
+    for _ in range(count):
+        put(payload)
+    child.join()
+    elapsed = time.perf_counter() - start
+
+    if hasattr(shared, "unlink"):
+        shared.unlink()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared-memory queue benchmark")
+    parser.add_argument("--messages", type=int, default=10**6)
+    parser.add_argument("--size", type=int, default=32)
+    parser.add_argument("--capacity", type=int, default=4096)
+    args = parser.parse_args()
+
+    payload = b"x" * args.size
+    slot_size = max(64, args.size + 8)
+    rows = [
+        ("SPSCQueue", lambda: SPSCQueue(args.capacity, slot_size), drain_ring),
+        ("MPMCQueue", lambda: MPMCQueue(args.capacity, slot_size), drain_ring),
+        ("multiprocessing.Queue", multiprocessing.Queue, drain_pipe),
+    ]
+
+    print(f"{args.messages} messages of {args.size} bytes, 1 producer -> 1 consumer")
+    print("(thousand messages / second)")
+    for name, make_queue, drain in rows:
+        elapsed = run(make_queue, drain, args.messages, payload)
+        print(f"{name:>22} {args.messages / elapsed / 1e3:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# ============================================================
+# Benchmark: SkipList vs LinkedList random-position inserts
+# ============================================================
+#
+# Builds a list of --ops values, inserting each one at a uniformly
+# random index in [0, current length]. Every structure sees the same
+# index sequence. Python's list is included as a reference point: its
+# insert is an O(n) memmove, but done in C.
+#
+# LinkedList.insert walks from the head, so the run is O(n^2); at the
+# default 10^5 inserts it takes a couple of minutes. Use --skip-linked
+# (or a smaller --ops) for a quick run.
+#
+# Usage:
+#     python benchmarks/bench_skip_list.py --ops 100000
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.linked_list import LinkedList  # noqa: E402
+from dsa.skip_list import SkipList  # noqa: E402
+
+
+def run(make, indexes):
+    container = make()
+    insert = container.insert
+
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for value, index in enumerate(indexes):
+            insert(index, value)
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    return elapsed, container
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SkipList random insert benchmark")
+    parser.add_argument("--ops", type=int, default=10**5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-linked", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    indexes = [rng.randint(0, i) for i in range(args.ops)]
+
+    structures = [("list", list), ("SkipList", SkipList)]
+    if not args.skip_linked:
+        structures.append(("LinkedList", LinkedList))
+
+    print(f"{args.ops} random-position inserts (seconds)")
+    results = {}
+    for name, make in structures:
+        elapsed, container = run(make, indexes)
+        results[name] = list(container)
+        print(f"{name:>12} {elapsed:10.3f}")
+
+    # Every structure must end up with the same contents
+    expected = results["list"]
+    for name, values in results.items():
+        if values != expected:
+            raise SystemExit(f"{name} contents differ from list")
+
+
+if __name__ == "__main__":
+    main()
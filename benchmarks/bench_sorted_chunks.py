@@ -0,0 +1,104 @@
+# ============================================================
+# Benchmark: SortedChunks vs node-based BinarySearchTree
+# ============================================================
+#
+# Inserts --keys random integer keys, then looks each one up and
+# reads one range of --range-size keys per 1000 keys. Reports seconds
+# per phase and container memory in bytes per key (tracemalloc,
+# measured in a separate build of --memory-keys keys; the key ints
+# themselves are shared and not counted).
+#
+# Usage:
+#     python benchmarks/bench_sorted_chunks.py --keys 1000000 --fanout 1000
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.sorted_chunks import SortedChunks  # noqa: E402
+from dsa.tree import BinarySearchTree  # noqa: E402
+
+
+def build(make, keys):
+    container = make()
+    insert = container.insert
+    for key in keys:
+        insert(key)
+    return container
+
+
+def bytes_per_key(make, keys):
+    tracemalloc.start()
+    container = build(make, keys)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return used / len(keys)
+
+
+def timed(make, keys, range_size):
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        container = build(make, keys)
+        inserted = time.perf_counter() - start
+
+        contains = container.contains
+        start = time.perf_counter()
+        for key in keys:
+            contains(key)
+        searched = time.perf_counter() - start
+
+        # SortedChunks.items(lo, hi); the tree has no range query, so
+        # it checks each key of the range with contains
+        start = time.perf_counter()
+        for lo in keys[::1000]:
+            if isinstance(container, SortedChunks):
+                for _ in container.items(lo, lo + range_size):
+                    pass
+            else:
+                for key in range(lo, lo + range_size):
+                    contains(key)
+        ranged = time.perf_counter() - start
+    finally:
+        gc.enable()
+    return inserted, searched, ranged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SortedChunks benchmark")
+    parser.add_argument("--keys", type=int, default=10**6)
+    parser.add_argument("--memory-keys", type=int, default=10**5)
+    parser.add_argument("--fanout", type=int, default=1000)
+    parser.add_argument("--range-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keys = rng.sample(range(args.keys * 4), args.keys)
+    memory_keys = keys[:args.memory_keys]
+
+    rows = [
+        ("SortedChunks", lambda: SortedChunks(args.fanout)),
+        ("SortedChunks[q]", lambda: SortedChunks(args.fanout, typecode="q")),
+        ("BST plain", BinarySearchTree),
+        ("BST red-black", lambda: BinarySearchTree("red-black")),
+    ]
+
+    print(f"{args.keys} random keys (seconds), memory at {args.memory_keys} keys")
+    print(f"{'container':>16} {'insert':>8} {'contains':>9} {'range':>7} {'bytes/key':>10}")
+    for name, make in rows:
+        inserted, searched, ranged = timed(make, keys, args.range_size)
+        memory = bytes_per_key(make, memory_keys)
+        print(f"{name:>16} {inserted:8.3f} {searched:9.3f} {ranged:7.3f} {memory:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
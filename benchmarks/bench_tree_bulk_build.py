@@ -0,0 +1,85 @@
+# ============================================================
+# Benchmark: BinarySearchTree bulk build and set operations
+# ============================================================
+#
+# Loads --keys sorted keys into a tree:
+#   insert loop       : one insert per key, in random order (sorted
+#                       order would degenerate the plain tree)
+#   from_sorted       : one balanced build in O(n)
+# then merges two trees of --keys / 2 keys each:
+#   insert loop       : insert every key of one tree into a copy of
+#                       the other
+#   union             : linear merge + from_sorted
+#
+# Usage:
+#     python benchmarks/bench_tree_bulk_build.py --keys 1000000
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.tree import BinarySearchTree  # noqa: E402
+
+
+def timed(run):
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        run()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def insert_all(balance, keys):
+    tree = BinarySearchTree(balance)
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BST bulk build benchmark")
+    parser.add_argument("--keys", type=int, default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keys = list(range(args.keys))
+    shuffled = keys[:]
+    rng.shuffle(shuffled)
+    evens, odds = keys[::2], keys[1::2]
+
+    print(f"{args.keys} keys (seconds)")
+    print(f"{'balance':>10} {'insert loop':>12} {'from_sorted':>12} {'merge loop':>11} {'union':>7}")
+
+    for balance in (None, "avl", "red-black"):
+        build_loop = timed(lambda: insert_all(balance, shuffled))
+        build_bulk = timed(lambda: BinarySearchTree.from_sorted(keys, balance))
+
+        left = BinarySearchTree.from_sorted(evens, balance)
+        right = BinarySearchTree.from_sorted(odds, balance)
+        # shuffled so the plain tree does not degenerate
+        right_keys = list(right)
+        rng.shuffle(right_keys)
+
+        def merge_loop():
+            merged = BinarySearchTree.from_sorted(left, balance)
+            for key in right_keys:
+                merged.insert(key)
+
+        merge_time = timed(merge_loop)
+        union_time = timed(lambda: left.union(right))
+
+        name = balance or "plain"
+        print(f"{name:>10} {build_loop:12.3f} {build_bulk:12.3f} {merge_time:11.3f} {union_time:7.3f}")
+
+
+if __name__ == "__main__":
+    main()
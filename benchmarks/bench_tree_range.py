@@ -0,0 +1,62 @@
+# ============================================================
+# Benchmark: BinarySearchTree range queries vs dumping the tree
+# ============================================================
+#
+# Builds a red-black tree of --keys keys, then answers --queries
+# random [lo, hi) questions three ways:
+#   dump + filter : list(tree), then keep the values in range
+#   range         : tree.range(lo, hi), only visits the answer
+#   count_range   : tree.count_range(lo, hi), O(log n) via sizes
+#
+# Usage:
+#     python benchmarks/bench_tree_range.py --keys 1000000 --queries 100
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Make the top-level dsa package importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa.tree import BinarySearchTree  # noqa: E402
+
+
+def dump_and_filter(tree, lo, hi):
+    return sum(1 for value in list(tree) if lo <= value < hi)
+
+
+def iterate_range(tree, lo, hi):
+    return sum(1 for _ in tree.range(lo, hi))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BST range query benchmark")
+    parser.add_argument("--keys", type=int, default=10**6)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tree = BinarySearchTree.from_sorted(range(args.keys), "red-black")
+    queries = []
+    for _ in range(args.queries):
+        lo = rng.randrange(args.keys)
+        queries.append((lo, lo + args.width))
+
+    print(f"{args.queries} queries of width {args.width} over {args.keys} keys (seconds)")
+    for name, answer in (
+        ("dump + filter", dump_and_filter),
+        ("range", iterate_range),
+        ("count_range", BinarySearchTree.count_range),
+    ):
+        start = time.perf_counter()
+        for lo, hi in queries:
+            answer(tree, lo, hi)
+        print(f"{name:>14} {time.perf_counter() - start:9.4f}")
+
+
+if __name__ == "__main__":
+    main()
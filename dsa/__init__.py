@@ -0,0 +1,101 @@
+# ============================================================
+# dsa - importable versions of the course data structures
+# ============================================================
+#
+# Each structure lives in its own submodule and none of them run demo
+# code on import. Submodules (and the classes they export) are loaded
+# lazily on first attribute access, so
+#
+#     import dsa
+#     table = dsa.HashTable()
+#
+# only imports dsa.hash_table and never touches the other structures.
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "LinkedList": "linked_list",
+    "DoublyLinkedList": "doubly_linked_list",
+    "ChunkedList": "chunked_list",
+    "ArrayLinkedList": "array_linked_list",
+    "SkipList": "skip_list",
+    "SortedSkipList": "skip_list",
+    "ListView": "list_view",
+    "Stack": "stacks_and_queues",
+    "Queue": "stacks_and_queues",
+    "RingQueue": "ring_queue",
+    "ConcurrentQueue": "concurrent_queues",
+    "AsyncQueue": "concurrent_queues",
+    "ArrayStack": "array_stack",
+    "SPSCQueue": "shm_queue",
+    "MPMCQueue": "shm_queue",
+    "BinarySearchTree": "tree",
+    "SortedChunks": "sorted_chunks",
+    "PersistentTree": "persistent_tree",
+    "ConcurrentTree": "persistent_tree",
+    "HashTable": "hash_table",
+    "OpenAddressingHashTable": "open_hash_table",
+    "MmapHashTable": "mmap_hash_table",
+    "BuiltinHasher": "hashers",
+    "FNV1aHasher": "hashers",
+    "SipHasher": "hashers",
+    "Graph": "graph",
+    "MaxHeap": "heap",
+    "IndexedMaxHeap": "heap",
+    "LRUCache": "cache",
+    "LFUCache": "cache",
+    "TTLCache": "cache",
+    "memoize": "cache",
+}
+
+_SUBMODULES = {
+    "node",
+    "linked_list",
+    "doubly_linked_list",
+    "chunked_list",
+    "array_linked_list",
+    "skip_list",
+    "list_view",
+    "stacks_and_queues",
+    "ring_queue",
+    "concurrent_queues",
+    "array_stack",
+    "shm_queue",
+    "tree",
+    "sorted_chunks",
+    "persistent_tree",
+    "hash_table",
+    "open_hash_table",
+    "mmap_hash_table",
+    "hashers",
+    "graph",
+    "heap",
+    "recursion",
+    "cache",
+}
+
+__all__ = sorted(_EXPORTS) + sorted(_SUBMODULES)
+
+
+def __getattr__(name):
+    """
+    Import submodules and exported classes on first access (PEP 562).
+
+    The result is cached in the package namespace so later lookups
+    never reach this function again.
+    """
+    if name in _SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    elif name in _EXPORTS:
+        module = importlib.import_module("." + _EXPORTS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,271 @@
+# ============================================================
+# Array-Backed Linked List (struct-of-arrays storage)
+# ============================================================
+#
+# Same index-based methods as LinkedList / DoublyLinkedList, but there
+# are no Node objects. Each element is a slot number, and its value and
+# links live in three parallel typed arrays:
+#
+#   slot:    0     1     2     3
+#   value: [ 10 | 30  | 20  |  0 ]     array(typecode)
+#   next:  [ 2  | -1  | 1   | -1 ]     array('q'), -1 = no node
+#   prev:  [ -1 | 2   | 0   | -1 ]     array('q')
+#
+# That is 24 bytes per element for int64 values, versus a full Python
+# object per node. Removed slots go on a free list (threaded through
+# the next column) and are reused by later inserts.
+#
+# Values must fit the array typecode: 'q' (int64, default) or 'd'
+# (float64). Since there are no nodes, pop, pop_first, get and remove
+# return values. insert accepts index == length (append), like
+# LinkedList.
+
+from array import array
+
+# "No node" marker in the next / prev columns
+NIL = -1
+
+_NO_VALUE = object()
+
+
+class ArrayLinkedList:
+    def __init__(self, value=_NO_VALUE, typecode="q"):
+        self._value = array(typecode)
+        self._next = array("q")
+        self._prev = array("q")
+
+        self._head = NIL        # slot of the first element
+        self._tail = NIL        # slot of the last element
+        self._free = NIL        # first recycled slot
+        self.length = 0
+
+        if value is not _NO_VALUE:
+            self.append(value)
+
+    # --------------------------------------------------------
+    # Slot management
+    def _alloc(self, value):
+        """
+        Returns a slot holding value with no links, reusing a freed
+        slot when there is one.
+        """
+        slot = self._free
+        if slot != NIL:
+            # Store first: if value does not fit the typecode the slot
+            # is still on the free list
+            self._value[slot] = value
+            self._free = self._next[slot]
+            self._next[slot] = NIL
+            self._prev[slot] = NIL
+            return slot
+
+        self._value.append(value)
+        self._next.append(NIL)
+        self._prev.append(NIL)
+        return len(self._value) - 1
+
+    def _release(self, slot):
+        self._value[slot] = 0
+        self._prev[slot] = NIL
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _slot_at(self, index):
+        """
+        Walks from whichever end is closer (like DoublyLinkedList.get).
+        """
+        if index < self.length // 2:
+            slot = self._head
+            nxt = self._next
+            for _ in range(index):
+                slot = nxt[slot]
+        else:
+            slot = self._tail
+            prev = self._prev
+            for _ in range(self.length - 1, index, -1):
+                slot = prev[slot]
+        return slot
+
+    def _unlink(self, slot):
+        nxt, prev = self._next, self._prev
+        before, after = prev[slot], nxt[slot]
+
+        if before == NIL:
+            self._head = after
+        else:
+            nxt[before] = after
+
+        if after == NIL:
+            self._tail = before
+        else:
+            prev[after] = before
+
+        self.length -= 1
+        value = self._value[slot]
+        self._release(slot)
+        return value
+
+    # --------------------------------------------------------
+    # Print all values in the list
+    def print_list(self):
+        for value in self:
+            print(value)
+
+    # --------------------------------------------------------
+    # Add value at the end
+    def append(self, value):
+        slot = self._alloc(value)
+
+        if self._tail == NIL:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+            self._prev[slot] = self._tail
+        self._tail = slot
+
+        self.length += 1
+        return True
+
+    # --------------------------------------------------------
+    # Add value at the beginning
+    def prepend(self, value):
+        slot = self._alloc(value)
+
+        if self._head == NIL:
+            self._tail = slot
+        else:
+            self._prev[self._head] = slot
+            self._next[slot] = self._head
+        self._head = slot
+
+        self.length += 1
+        return True
+
+    # --------------------------------------------------------
+    # Remove last value (pop)
+    def pop(self):
+        if self.length == 0:
+            return None
+        return self._unlink(self._tail)
+
+    # --------------------------------------------------------
+    # Remove first value
+    def pop_first(self):
+        if self.length == 0:
+            return None
+        return self._unlink(self._head)
+
+    # --------------------------------------------------------
+    # Get value at specific index
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        return self._value[self._slot_at(index)]
+
+    # --------------------------------------------------------
+    # Update value at specific index
+    def set_value(self, index, value):
+        if index < 0 or index >= self.length:
+            return False
+        self._value[self._slot_at(index)] = value
+        return True
+
+    # --------------------------------------------------------
+    # Insert value at specific index
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:
+            return self.append(value)
+
+        after = self._slot_at(index)
+        before = self._prev[after]
+        slot = self._alloc(value)
+
+        self._prev[slot] = before
+        self._next[slot] = after
+        self._next[before] = slot
+        self._prev[after] = slot
+
+        self.length += 1
+        return True
+
+    # --------------------------------------------------------
+    # Remove value at specific index
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        return self._unlink(self._slot_at(index))
+
+    # --------------------------------------------------------
+    # Reverse the list (swap every slot's next and prev)
+    def reverse(self):
+        nxt, prev = self._next, self._prev
+        slot = self._head
+
+        while slot != NIL:
+            after = nxt[slot]
+            nxt[slot] = prev[slot]
+            prev[slot] = after
+            slot = after
+
+        self._head, self._tail = self._tail, self._head
+
+    # --------------------------------------------------------
+    # Storage operations
+    def compact(self):
+        """
+        Rewrites the columns in list order and drops free slots, so
+        slot i holds element i and traversal reads memory sequentially.
+        """
+        values = array(self._value.typecode, self)
+        n = len(values)
+
+        self._value = values
+        self._next = array("q", range(1, n + 1))
+        self._prev = array("q", range(-1, n - 1))
+        if n:
+            self._next[n - 1] = NIL
+
+        self._head = 0 if n else NIL
+        self._tail = n - 1 if n else NIL
+        self._free = NIL
+
+    def snapshot(self):
+        """
+        Returns an independent copy of the list. Each column is copied
+        as one buffer, with no per-element work.
+        """
+        copy = type(self).__new__(type(self))
+        copy._value = self._value[:]
+        copy._next = self._next[:]
+        copy._prev = self._prev[:]
+        copy._head = self._head
+        copy._tail = self._tail
+        copy._free = self._free
+        copy.length = self.length
+        return copy
+
+    def nbytes(self):
+        """
+        Bytes used by the three columns (including free slots).
+        """
+        return sum(
+            column.itemsize * len(column)
+            for column in (self._value, self._next, self._prev)
+        )
+
+    # --------------------------------------------------------
+    # Python protocol
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        values, nxt = self._value, self._next
+        slot = self._head
+        while slot != NIL:
+            yield values[slot]
+            slot = nxt[slot]
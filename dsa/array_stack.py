@@ -0,0 +1,156 @@
+# ============================================================
+# Array-Backed Stack (contiguous storage)
+# ============================================================
+#
+# Same push / pop / print_stack as Stack, but values sit in one
+# contiguous buffer instead of one Node per value:
+#
+#   buffer: [ a | b | c | . | . | . | . | . ]   capacity 8
+#                     ^ top (height 3)
+#
+# The buffer is a list, or an array.array when a typecode is given
+# (typed mode: 'q', 'd', ... for numeric payloads, 8 bytes per value
+# instead of a pointer to a boxed object).
+#
+# Growth and shrinking with hysteresis:
+#   - full           -> capacity doubles (amortized O(1) push)
+#   - height <= 1/4  -> capacity halves
+# After a resize the stack is half full, so it takes a whole
+# capacity's worth of pushes or pops to trigger the next one; a
+# push/pop pair at a boundary never resizes twice.
+#
+# pop returns the value (not a node); push_many / pop_many move a
+# whole batch with one slice copy.
+
+from array import array
+
+MIN_CAPACITY = 8
+
+
+class ArrayStack:
+    def __init__(self, capacity=MIN_CAPACITY, typecode=None):
+        capacity = max(capacity, MIN_CAPACITY)
+        self.typecode = typecode
+        self._buffer = self._new_buffer(capacity)
+        self.height = 0
+
+    def _new_buffer(self, capacity):
+        if self.typecode is None:
+            return [None] * capacity
+        return array(self.typecode, bytes(capacity * array(self.typecode).itemsize))
+
+    @property
+    def capacity(self):
+        return len(self._buffer)
+
+    def _resize(self, capacity):
+        buffer = self._new_buffer(capacity)
+        buffer[:self.height] = self._buffer[:self.height]
+        self._buffer = buffer
+
+    def _shrink_if_sparse(self):
+        capacity = len(self._buffer)
+        while capacity > MIN_CAPACITY and self.height * 4 <= capacity:
+            capacity //= 2
+        if capacity != len(self._buffer):
+            self._resize(max(MIN_CAPACITY, capacity))
+
+    # --------------------------------------------------------
+    # Print all values, top first
+    def print_stack(self):
+        for i in range(self.height - 1, -1, -1):
+            print(self._buffer[i])
+
+    # --------------------------------------------------------
+    # Push (add on top)
+    def push(self, value):
+        height = self.height
+        if height == len(self._buffer):
+            self._resize(height * 2)
+        self._buffer[height] = value
+        self.height = height + 1
+
+    # --------------------------------------------------------
+    # Pop (remove from the top)
+    def pop(self):
+        """
+        Removes and returns the top value, or None if empty.
+        """
+        height = self.height
+        if height == 0:
+            return None
+
+        height -= 1
+        buffer = self._buffer
+        value = buffer[height]
+        if self.typecode is None:
+            buffer[height] = None      # drop the reference
+        self.height = height
+
+        if height * 4 <= len(buffer) and len(buffer) > MIN_CAPACITY:
+            self._shrink_if_sparse()
+        return value
+
+    # --------------------------------------------------------
+    # Peek (read the top without removing it)
+    def peek(self):
+        if self.height == 0:
+            return None
+        return self._buffer[self.height - 1]
+
+    def is_empty(self):
+        return self.height == 0
+
+    # --------------------------------------------------------
+    # Batch operations
+    def push_many(self, values):
+        """
+        Pushes every value in order (the last one ends up on top).
+        """
+        if self.typecode is None:
+            values = list(values)
+        else:
+            values = array(self.typecode, values)
+
+        height = self.height
+        needed = height + len(values)
+        if needed > len(self._buffer):
+            capacity = len(self._buffer)
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+
+        self._buffer[height:needed] = values
+        self.height = needed
+
+    def pop_many(self, n):
+        """
+        Pops up to n values and returns them in pop order (top first),
+        as a list (or an array in typed mode).
+        """
+        n = min(n, self.height)
+        if n <= 0:
+            return [] if self.typecode is None else array(self.typecode)
+
+        buffer = self._buffer
+        height = self.height
+        start = height - n
+        values = buffer[start:height]
+        values.reverse()
+        if self.typecode is None:
+            buffer[start:height] = [None] * n
+        self.height = start
+
+        self._shrink_if_sparse()
+        return values
+
+    # --------------------------------------------------------
+    # Python protocol
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        # Top to bottom, the order pop would return them
+        buffer = self._buffer
+        for i in range(self.height - 1, -1, -1):
+            yield buffer[i]
@@ -0,0 +1,405 @@
+# ============================================================
+# Caches (LRU / LFU / TTL) built on HashTable + DoublyLinkedList
+# ============================================================
+#
+# Every cache keeps a hash table from key -> entry, and each entry
+# holds the DoublyLinkedList node whose position encodes the eviction
+# order. Because the entry hands back the node itself, get, put and
+# evict all go through the list's O(1) node-handle operations
+# (unlink, move_to_front, insert_after) instead of index walks.
+#
+# Limits: max_entries (number of keys) and/or max_bytes (sum of
+# sizeof(value), sys.getsizeof by default). Each cache counts hits,
+# misses and evictions.
+
+import functools
+import sys
+import time
+from abc import ABC, abstractmethod
+
+from .doubly_linked_list import DoublyLinkedList
+from .open_hash_table import OpenAddressingHashTable
+
+# Returned by get() lookups in memoize to tell a miss from a cached None
+_MISSING = object()
+
+# Separates positional from keyword arguments in memoize keys
+_KWARGS_MARK = object()
+
+
+class _Entry:
+    __slots__ = ("key", "value", "size", "node", "expires", "group")
+
+    def __init__(self, key, value, size):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.node = None      # this entry's node in the policy's list
+        self.expires = None   # TTL only
+        self.group = None     # LFU only: node of its _FrequencyGroup
+
+
+class _FrequencyGroup:
+    """
+    All LFU entries with the same use count, most recent first.
+    """
+    __slots__ = ("freq", "entries")
+
+    def __init__(self, freq):
+        self.freq = freq
+        self.entries = DoublyLinkedList()
+
+
+# ============================================================
+# Base cache: lookup table, size limits and counters
+# ============================================================
+
+class _Cache(ABC):
+    def __init__(self, max_entries=None, max_bytes=None, sizeof=sys.getsizeof):
+        if max_entries is None and max_bytes is None:
+            raise ValueError("set max_entries and/or max_bytes")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+
+        # key -> _Entry
+        self._entries = OpenAddressingHashTable()
+        self.current_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Eviction policy hooks -----------------------------------
+    @abstractmethod
+    def _link(self, entry):
+        """Adds a new entry to the policy's ordering."""
+
+    @abstractmethod
+    def _unlink(self, entry):
+        """Removes an entry from the policy's ordering."""
+
+    def _touch(self, entry):
+        """Records a read of an entry."""
+
+    def _refresh(self, entry):
+        """Records a write to an existing entry (counts as a use)."""
+        self._touch(entry)
+
+    @abstractmethod
+    def _victim(self):
+        """Returns the entry that should be evicted next."""
+
+    def _is_expired(self, entry):
+        return False
+
+    # Public API ----------------------------------------------
+    def get(self, key, default=None):
+        """
+        Returns the cached value for key, or default on a miss.
+        """
+        entry = self._entries.get_item(key)
+
+        if entry is None:
+            self.misses += 1
+            return default
+
+        if self._is_expired(entry):
+            self._remove(entry)
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def put(self, key, value):
+        """
+        Inserts or updates key, then evicts entries until the cache is
+        back within its limits.
+
+        A new key makes room before it is linked in, so it can never
+        be chosen as its own victim. Returns False if the value ends
+        up not cached: it is larger than max_bytes on its own (any
+        older value for key is dropped too), or an updated entry was
+        itself the only thing left to evict.
+        """
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        entry = self._entries.get_item(key)
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            if entry is not None:
+                self._remove(entry)
+            return False
+
+        if entry is None:
+            # Case 1: New key -> evict until it fits, then link it
+            while len(self._entries) and self._over_limit(1, size):
+                self._remove(self._victim())
+                self.evictions += 1
+
+            entry = _Entry(key, value, size)
+            self._entries.set_item(key, entry)
+            self.current_bytes += size
+            self._link(entry)
+            return True
+
+        # Case 2: Existing key -> update in place, then evict
+        self.current_bytes += size - entry.size
+        entry.value = value
+        entry.size = size
+        self._refresh(entry)
+
+        while self._over_limit():
+            self._remove(self._victim())
+            self.evictions += 1
+
+        return self._entries.get_item(key) is entry
+
+    def delete(self, key):
+        """
+        Removes key from the cache. Returns True if it was present.
+        """
+        entry = self._entries.get_item(key)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    def clear(self):
+        while len(self._entries):
+            self._remove(self._victim())
+
+    def stats(self):
+        """
+        Returns the hit/miss/eviction counters and current usage.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        entry = self._entries.get_item(key)
+        return entry is not None and not self._is_expired(entry)
+
+    # Internals -----------------------------------------------
+    def _over_limit(self, extra_entries=0, extra_bytes=0):
+        """
+        True if the cache, plus extra_entries / extra_bytes about to be
+        added, would exceed a limit.
+        """
+        if (self.max_entries is not None
+                and len(self._entries) + extra_entries > self.max_entries):
+            return True
+        return (self.max_bytes is not None
+                and self.current_bytes + extra_bytes > self.max_bytes)
+
+    def _remove(self, entry):
+        self._unlink(entry)
+        self._entries.delete(entry.key)
+        self.current_bytes -= entry.size
+
+
+# ============================================================
+# LRU: evict the least recently used entry
+# ============================================================
+
+class LRUCache(_Cache):
+    """
+    Entries are kept most recently used first; the tail is evicted.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, sizeof=sys.getsizeof):
+        super().__init__(max_entries, max_bytes, sizeof)
+        self._order = DoublyLinkedList()
+
+    def _link(self, entry):
+        self._order.prepend(entry)
+        entry.node = self._order.head
+
+    def _unlink(self, entry):
+        self._order.unlink(entry.node)
+
+    def _touch(self, entry):
+        self._order.move_to_front(entry.node)
+
+    def _victim(self):
+        return self._order.tail.value
+
+
+# ============================================================
+# LFU: evict the least frequently used entry
+# ============================================================
+
+class LFUCache(_Cache):
+    """
+    Entries are grouped by use count. Groups form a list in
+    increasing count order and each group lists its entries most
+    recent first, so the victim (least used, then least recent) is
+    always the tail of the first group.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, sizeof=sys.getsizeof):
+        super().__init__(max_entries, max_bytes, sizeof)
+        self._groups = DoublyLinkedList()
+
+    def _link(self, entry):
+        # New entries start with a use count of 1
+        first = self._groups.head
+        if first is None or first.value.freq != 1:
+            self._groups.prepend(_FrequencyGroup(1))
+            first = self._groups.head
+
+        self._add_to_group(entry, first)
+
+    def _unlink(self, entry):
+        self._remove_from_group(entry)
+        entry.group = None
+
+    def _touch(self, entry):
+        group_node = entry.group
+        freq = group_node.value.freq + 1
+
+        # Make sure the group for freq + 1 sits right after this one
+        target = group_node.next
+        if target is None or target.value.freq != freq:
+            target = self._groups.insert_after(group_node, _FrequencyGroup(freq))
+
+        self._remove_from_group(entry)
+        self._add_to_group(entry, target)
+
+    def _victim(self):
+        return self._groups.head.value.entries.tail.value
+
+    def _add_to_group(self, entry, group_node):
+        entries = group_node.value.entries
+        entries.prepend(entry)
+        entry.node = entries.head
+        entry.group = group_node
+
+    def _remove_from_group(self, entry):
+        group_node = entry.group
+        entries = group_node.value.entries
+        entries.unlink(entry.node)
+
+        if entries.length == 0:
+            self._groups.unlink(group_node)
+
+
+# ============================================================
+# TTL: entries expire a fixed time after they were written
+# ============================================================
+
+class TTLCache(_Cache):
+    """
+    Every entry expires ttl seconds after its last put. Entries are
+    kept newest write first, which is also latest expiry first, so
+    both capacity eviction and expire() work from the tail.
+    """
+
+    def __init__(self, ttl, max_entries=None, max_bytes=None,
+                 sizeof=sys.getsizeof, timer=time.monotonic):
+        super().__init__(max_entries, max_bytes, sizeof)
+        self.ttl = ttl
+        self.timer = timer
+        self._order = DoublyLinkedList()
+
+    def _link(self, entry):
+        entry.expires = self.timer() + self.ttl
+        self._order.prepend(entry)
+        entry.node = self._order.head
+
+    def _unlink(self, entry):
+        self._order.unlink(entry.node)
+
+    def _refresh(self, entry):
+        # A rewrite restarts the entry's clock and moves it to the front
+        entry.expires = self.timer() + self.ttl
+        self._order.move_to_front(entry.node)
+
+    def _victim(self):
+        return self._order.tail.value
+
+    def _is_expired(self, entry):
+        return entry.expires <= self.timer()
+
+    def expire(self):
+        """
+        Drops every expired entry. Returns how many were removed.
+        """
+        removed = 0
+        now = self.timer()
+
+        while self._order.tail is not None and self._order.tail.value.expires <= now:
+            self._remove(self._order.tail.value)
+            removed += 1
+
+        return removed
+
+    def __len__(self):
+        self.expire()
+        return len(self._entries)
+
+
+# ============================================================
+# Memoizing decorator
+# ============================================================
+
+def memoize(max_entries=128, max_bytes=None, policy="lru", ttl=None):
+    """
+    Caches a function's return values keyed on its arguments.
+
+    Usage:
+        @memoize(max_entries=1000)
+        def factorial(n): ...
+
+    policy is "lru", "lfu" or "ttl" (ttl required). Arguments must be
+    hashable. The cache is exposed as wrapper.cache for its stats().
+
+    Only calls that go through the wrapper are cached. A recursive
+    function benefits on every level only when it is decorated where
+    it is defined, so that it calls itself through the decorated name;
+    memoize(...)(f) on an existing f caches the top-level calls only.
+    """
+    if policy == "lru":
+        def make_cache():
+            return LRUCache(max_entries, max_bytes)
+    elif policy == "lfu":
+        def make_cache():
+            return LFUCache(max_entries, max_bytes)
+    elif policy == "ttl":
+        if ttl is None:
+            raise ValueError("policy 'ttl' needs a ttl")
+
+        def make_cache():
+            return TTLCache(ttl, max_entries, max_bytes)
+    else:
+        raise ValueError(f"unknown policy {policy!r}")
+
+    def decorator(func):
+        cache = make_cache()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,309 @@
+# ============================================================
+# Chunked List (deque-grade LinkedList replacement)
+# ============================================================
+#
+# Same method names as LinkedList, but values are stored in fixed-size
+# blocks (plain Python lists of BLOCK_SIZE slots) arranged in a ring:
+#
+#   block map:  [ blk | blk | blk | None | ... ]   (power-of-two size)
+#   position p  -> block p >> BLOCK_SHIFT, slot p & BLOCK_MASK
+#   element i   -> position (head + i) % capacity
+#
+# append / prepend / pop / pop_first are O(1) (amortized when the block
+# map doubles), and there is one slot per element instead of one Node
+# object. Blocks are allocated on first use and dropped as soon as the
+# ends move past them.
+#
+# Unlike LinkedList there are no nodes to hand out, so pop, pop_first,
+# get and remove return values rather than Node objects.
+
+BLOCK_SHIFT = 6
+BLOCK_SIZE = 1 << BLOCK_SHIFT
+BLOCK_MASK = BLOCK_SIZE - 1
+
+# Smallest block map kept after shrinking
+_MIN_BLOCKS = 2
+
+_NO_VALUE = object()
+
+
+class ChunkedList:
+    def __init__(self, value=_NO_VALUE):
+        # Ring of blocks; None marks a block that is not allocated
+        self._blocks = [None] * _MIN_BLOCKS
+        self._capacity = _MIN_BLOCKS * BLOCK_SIZE
+        self._head = 0          # position of element 0
+        self.length = 0
+
+        if value is not _NO_VALUE:
+            self.append(value)
+
+    # --------------------------------------------------------
+    # Position helpers
+    def _read(self, pos):
+        return self._blocks[pos >> BLOCK_SHIFT][pos & BLOCK_MASK]
+
+    def _write(self, pos, value):
+        block = self._blocks[pos >> BLOCK_SHIFT]
+        if block is None:
+            block = self._blocks[pos >> BLOCK_SHIFT] = [None] * BLOCK_SIZE
+        block[pos & BLOCK_MASK] = value
+
+    def _release(self, pos):
+        """
+        Clears the slot at pos (an end that was just removed) and drops
+        its block if no remaining element lives in it.
+        """
+        b = pos >> BLOCK_SHIFT
+        block = self._blocks[b]
+        block[pos & BLOCK_MASK] = None
+
+        # Only the head and tail blocks can be partly filled, so a
+        # block that is neither holds no elements any more
+        if self.length == 0:
+            self._blocks[b] = None
+            return
+        tail = (self._head + self.length - 1) % self._capacity
+        if b != self._head >> BLOCK_SHIFT and b != tail >> BLOCK_SHIFT:
+            self._blocks[b] = None
+
+    def _resize(self, block_count):
+        """
+        Rebuilds the block map with block_count blocks and element 0 at
+        position 0. Only block references are copied when growing from
+        a block-aligned head; otherwise values are repacked.
+        """
+        old_blocks, old_cap, head = self._blocks, self._capacity, self._head
+        blocks = [None] * block_count
+
+        if head & BLOCK_MASK == 0 and block_count * BLOCK_SIZE >= old_cap:
+            # Fast path: move whole blocks in logical order
+            old_count = len(old_blocks)
+            first = head >> BLOCK_SHIFT
+            used = (self.length + BLOCK_MASK) >> BLOCK_SHIFT
+            for i in range(used):
+                blocks[i] = old_blocks[(first + i) % old_count]
+        else:
+            for i in range(self.length):
+                pos = (head + i) % old_cap
+                value = old_blocks[pos >> BLOCK_SHIFT][pos & BLOCK_MASK]
+                b = i >> BLOCK_SHIFT
+                if blocks[b] is None:
+                    blocks[b] = [None] * BLOCK_SIZE
+                blocks[b][i & BLOCK_MASK] = value
+
+        self._blocks = blocks
+        self._capacity = block_count * BLOCK_SIZE
+        self._head = 0
+
+    def _grow_if_full(self):
+        if self.length == self._capacity:
+            self._resize(len(self._blocks) * 2)
+
+    def _shrink_if_sparse(self):
+        count = len(self._blocks)
+        if count > _MIN_BLOCKS and self.length * 4 <= self._capacity:
+            self._resize(max(_MIN_BLOCKS, count // 2))
+
+    # --------------------------------------------------------
+    # Print all values in the list
+    def print_list(self):
+        for value in self:
+            print(value)
+
+    # --------------------------------------------------------
+    # End operations
+    #
+    # These four are the hot path, so position math and block
+    # allocation / release are written out inline. The capacity is
+    # always a power of two, so "% capacity" is "& (capacity - 1)".
+
+    # --------------------------------------------------------
+    # Add value at the end
+    def append(self, value):
+        length = self.length
+        if length == self._capacity:
+            self._resize(len(self._blocks) * 2)
+
+        pos = (self._head + length) & (self._capacity - 1)
+        blocks = self._blocks
+        block = blocks[pos >> BLOCK_SHIFT]
+        if block is None:
+            block = blocks[pos >> BLOCK_SHIFT] = [None] * BLOCK_SIZE
+        block[pos & BLOCK_MASK] = value
+
+        self.length = length + 1
+        return True
+
+    # --------------------------------------------------------
+    # Add value at the beginning
+    def prepend(self, value):
+        if self.length == self._capacity:
+            self._resize(len(self._blocks) * 2)
+
+        pos = self._head = (self._head - 1) & (self._capacity - 1)
+        blocks = self._blocks
+        block = blocks[pos >> BLOCK_SHIFT]
+        if block is None:
+            block = blocks[pos >> BLOCK_SHIFT] = [None] * BLOCK_SIZE
+        block[pos & BLOCK_MASK] = value
+
+        self.length += 1
+        return True
+
+    # --------------------------------------------------------
+    # Remove last value (pop)
+    def pop(self):
+        length = self.length
+        if length == 0:
+            return None
+
+        length -= 1
+        pos = (self._head + length) & (self._capacity - 1)
+        b = pos >> BLOCK_SHIFT
+        offset = pos & BLOCK_MASK
+        block = self._blocks[b]
+        value = block[offset]
+        block[offset] = None
+        self.length = length
+
+        # Vacated the first slot: the block is empty unless the head
+        # has wrapped around into it
+        if offset == 0 and (length == 0 or b != self._head >> BLOCK_SHIFT):
+            self._blocks[b] = None
+
+        if length * 4 <= self._capacity and len(self._blocks) > _MIN_BLOCKS:
+            self._shrink_if_sparse()
+        return value
+
+    # --------------------------------------------------------
+    # Remove first value
+    def pop_first(self):
+        length = self.length
+        if length == 0:
+            return None
+
+        mask = self._capacity - 1
+        pos = self._head
+        b = pos >> BLOCK_SHIFT
+        offset = pos & BLOCK_MASK
+        block = self._blocks[b]
+        value = block[offset]
+        block[offset] = None
+
+        length -= 1
+        self.length = length
+        head = self._head = (pos + 1) & mask
+
+        # Vacated the last slot: the block is empty unless the tail
+        # has wrapped around into it
+        if offset == BLOCK_MASK and (
+            length == 0 or b != ((head + length - 1) & mask) >> BLOCK_SHIFT
+        ):
+            self._blocks[b] = None
+
+        if length * 4 <= self._capacity and len(self._blocks) > _MIN_BLOCKS:
+            self._shrink_if_sparse()
+        return value
+
+    # --------------------------------------------------------
+    # Get value at specific index (O(1))
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        return self._read((self._head + index) % self._capacity)
+
+    # --------------------------------------------------------
+    # Update value at specific index (O(1))
+    def set_value(self, index, value):
+        if index < 0 or index >= self.length:
+            return False
+        self._write((self._head + index) % self._capacity, value)
+        return True
+
+    # --------------------------------------------------------
+    # Insert value at specific index
+    # Shifts whichever side of index is shorter: O(min(i, n - i))
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:
+            return self.append(value)
+
+        self._grow_if_full()
+        head, cap = self._head, self._capacity
+
+        if index < self.length // 2:
+            # Shift the first `index` values one slot to the left
+            self._head = (head - 1) % cap
+            for i in range(index):
+                self._write((self._head + i) % cap, self._read((head + i) % cap))
+        else:
+            # Shift values from index onwards one slot to the right
+            for i in range(self.length, index, -1):
+                self._write((head + i) % cap, self._read((head + i - 1) % cap))
+
+        self._write((self._head + index) % cap, value)
+        self.length += 1
+        return True
+
+    # --------------------------------------------------------
+    # Remove value at specific index
+    # Shifts whichever side of index is shorter: O(min(i, n - i))
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+
+        if index == 0:
+            return self.pop_first()
+        if index == self.length - 1:
+            return self.pop()
+
+        head, cap = self._head, self._capacity
+        value = self._read((head + index) % cap)
+
+        if index < self.length // 2:
+            # Close the gap by moving the first `index` values right
+            for i in range(index, 0, -1):
+                self._write((head + i) % cap, self._read((head + i - 1) % cap))
+            self._head = (head + 1) % cap
+            self.length -= 1
+            self._release(head)
+        else:
+            # Close the gap by moving the later values left
+            for i in range(index, self.length - 1):
+                self._write((head + i) % cap, self._read((head + i + 1) % cap))
+            self.length -= 1
+            self._release((head + self.length) % cap)
+
+        self._shrink_if_sparse()
+        return value
+
+    # --------------------------------------------------------
+    # Reverse the list in place
+    def reverse(self):
+        head, cap = self._head, self._capacity
+        i, j = 0, self.length - 1
+
+        while i < j:
+            pos_i = (head + i) % cap
+            pos_j = (head + j) % cap
+            value = self._read(pos_i)
+            self._write(pos_i, self._read(pos_j))
+            self._write(pos_j, value)
+            i += 1
+            j -= 1
+
+    # --------------------------------------------------------
+    # Python protocol
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        blocks, head, cap = self._blocks, self._head, self._capacity
+        for i in range(self.length):
+            pos = (head + i) % cap
+            yield blocks[pos >> BLOCK_SHIFT][pos & BLOCK_MASK]
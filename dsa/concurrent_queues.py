@@ -0,0 +1,307 @@
+# ============================================================
+# Thread-Safe and asyncio Queues
+# ============================================================
+#
+# ConcurrentQueue: a linked queue shared between threads. It uses two
+# locks, one per end (the "two-lock queue" of Michael & Scott):
+#
+#   head_lock                                   tail_lock
+#      |                                            |
+#   [dummy] -> [a] -> [b] -> [c] -> None    <- last node
+#
+# The list always starts with a dummy node, so producers (which only
+# touch the last node) and consumers (which only touch the dummy and
+# the node after it) never need the same lock, except for the brief
+# wake-up hand-off when the queue goes from empty to non-empty or from
+# full to not full.
+#
+# AsyncQueue: the same idea for coroutines on one event loop. There are
+# no locks; enqueue waits while the queue is full (backpressure) and
+# dequeue waits while it is empty.
+#
+# Both keep enqueue / dequeue and count how often callers had to wait
+# (stats()).
+
+import asyncio
+import collections
+import threading
+import time
+from queue import Empty, Full
+
+from .node import SinglyNode as Node
+from .ring_queue import RingQueue
+
+
+def _remaining(deadline):
+    return None if deadline is None else deadline - time.monotonic()
+
+
+# ============================================================
+# ConcurrentQueue (threads)
+# ============================================================
+
+class ConcurrentQueue:
+    def __init__(self, maxsize=0):
+        """
+        maxsize <= 0 means unbounded; otherwise put blocks (or
+        raises queue.Full) while maxsize values are queued.
+        """
+        dummy = Node(None)
+        self._head = dummy      # dummy; the front value is _head.next
+        self._tail = dummy      # last node
+        self.maxsize = maxsize
+
+        # Written by both ends, so it has its own small lock
+        self._count = 0
+        self._count_lock = threading.Lock()
+
+        self._head_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._head_lock)
+        self._tail_lock = threading.Lock()
+        self._not_full = threading.Condition(self._tail_lock)
+
+        # Contention counters
+        self.head_lock_waits = 0    # dequeuers that found head_lock taken
+        self.tail_lock_waits = 0    # enqueuers that found tail_lock taken
+        self.empty_waits = 0        # get calls that slept on an empty queue
+        self.full_waits = 0         # put calls that slept on a full queue
+
+    # --------------------------------------------------------
+    # Locking helpers
+    # (put and get inline the same try-then-wait acquire, since they
+    # are the hot path)
+    def _lock_head(self):
+        if not self._head_lock.acquire(blocking=False):
+            self._head_lock.acquire()
+            self.head_lock_waits += 1
+
+    def _lock_tail(self):
+        if not self._tail_lock.acquire(blocking=False):
+            self._tail_lock.acquire()
+            self.tail_lock_waits += 1
+
+    def _signal_not_empty(self):
+        self._lock_head()
+        try:
+            self._not_empty.notify()
+        finally:
+            self._head_lock.release()
+
+    def _signal_not_full(self):
+        self._lock_tail()
+        try:
+            self._not_full.notify()
+        finally:
+            self._tail_lock.release()
+
+    # --------------------------------------------------------
+    # Put (blocking enqueue)
+    def put(self, value, block=True, timeout=None):
+        """
+        Adds value at the back.
+
+        On a bounded, full queue: waits (up to timeout seconds) for
+        room, or raises queue.Full right away if block is False.
+        """
+        new_node = Node(value)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        tail_lock = self._tail_lock
+        if not tail_lock.acquire(blocking=False):
+            tail_lock.acquire()
+            self.tail_lock_waits += 1
+        try:
+            if self.maxsize > 0:
+                while self._count >= self.maxsize:
+                    remaining = _remaining(deadline)
+                    if not block or (remaining is not None and remaining <= 0):
+                        raise Full
+                    self.full_waits += 1
+                    self._not_full.wait(remaining)
+
+            # Link first, then publish through the count
+            self._tail.next = new_node
+            self._tail = new_node
+            with self._count_lock:
+                before = self._count
+                self._count = before + 1
+
+            # Room left: pass the signal on to the next waiting producer
+            if self.maxsize > 0 and before + 1 < self.maxsize:
+                self._not_full.notify()
+        finally:
+            tail_lock.release()
+
+        if before == 0:
+            self._signal_not_empty()
+
+    # --------------------------------------------------------
+    # Get (blocking dequeue)
+    def get(self, block=True, timeout=None):
+        """
+        Removes and returns the front value.
+
+        On an empty queue: waits (up to timeout seconds) for a value,
+        or raises queue.Empty right away if block is False.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        head_lock = self._head_lock
+        if not head_lock.acquire(blocking=False):
+            head_lock.acquire()
+            self.head_lock_waits += 1
+        try:
+            while self._count == 0:
+                remaining = _remaining(deadline)
+                if not block or (remaining is not None and remaining <= 0):
+                    raise Empty
+                self.empty_waits += 1
+                self._not_empty.wait(remaining)
+
+            # The first real node becomes the new dummy
+            first = self._head.next
+            value = first.value
+            first.value = None
+            self._head = first
+            with self._count_lock:
+                before = self._count
+                self._count = before - 1
+
+            # Values left: pass the signal on to the next waiting consumer
+            if before > 1:
+                self._not_empty.notify()
+        finally:
+            head_lock.release()
+
+        if self.maxsize > 0 and before == self.maxsize:
+            self._signal_not_full()
+        return value
+
+    # --------------------------------------------------------
+    # Queue method names
+    def enqueue(self, value):
+        """
+        Same as put(value): waits for room if the queue is bounded.
+        """
+        self.put(value)
+
+    def dequeue(self):
+        """
+        Removes and returns the front value, or None if empty
+        (does not wait).
+        """
+        try:
+            return self.get(block=False)
+        except Empty:
+            return None
+
+    def stats(self):
+        return {
+            "head_lock_waits": self.head_lock_waits,
+            "tail_lock_waits": self.tail_lock_waits,
+            "empty_waits": self.empty_waits,
+            "full_waits": self.full_waits,
+        }
+
+    def __len__(self):
+        # A snapshot: other threads may change it right away
+        return self._count
+
+
+# ============================================================
+# AsyncQueue (asyncio)
+# ============================================================
+
+class AsyncQueue:
+    def __init__(self, maxsize=0):
+        """
+        maxsize <= 0 means unbounded; otherwise enqueue waits while
+        maxsize values are queued.
+        """
+        self.maxsize = maxsize
+        self._items = RingQueue(maxsize if maxsize > 0 else 16)
+
+        # Futures of coroutines waiting for a value / for room
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+
+        # Contention counters
+        self.empty_waits = 0
+        self.full_waits = 0
+
+    def _full(self):
+        return 0 < self.maxsize <= len(self._items)
+
+    @staticmethod
+    def _wake_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, ready):
+        """
+        Parks the caller until ready() is true. If it is cancelled
+        after being woken, the wake-up goes to the next waiter.
+        """
+        loop = asyncio.get_running_loop()
+        while not ready():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if ready() and not waiter.cancelled():
+                    self._wake_next(waiters)
+                raise
+
+    # --------------------------------------------------------
+    # Enqueue (await while full)
+    async def enqueue(self, value):
+        if self._full():
+            self.full_waits += 1
+            await self._wait(self._putters, lambda: not self._full())
+        self.enqueue_nowait(value)
+
+    def enqueue_nowait(self, value):
+        """
+        Adds value at the back, or raises asyncio.QueueFull.
+        """
+        if self._full():
+            raise asyncio.QueueFull
+        self._items.enqueue(value)
+        self._wake_next(self._getters)
+
+    # --------------------------------------------------------
+    # Dequeue (await while empty)
+    async def dequeue(self):
+        if len(self._items) == 0:
+            self.empty_waits += 1
+            await self._wait(self._getters, lambda: len(self._items) > 0)
+        return self.dequeue_nowait()
+
+    def dequeue_nowait(self):
+        """
+        Removes and returns the front value, or raises
+        asyncio.QueueEmpty.
+        """
+        if len(self._items) == 0:
+            raise asyncio.QueueEmpty
+        value = self._items.dequeue()
+        self._wake_next(self._putters)
+        return value
+
+    def stats(self):
+        return {
+            "empty_waits": self.empty_waits,
+            "full_waits": self.full_waits,
+        }
+
+    def __len__(self):
+        return len(self._items)
@@ -0,0 +1,389 @@
+# ============================================================
+# Doubly Linked List - Complete Implementation
+# ============================================================
+
+from .list_view import ListView
+
+# Node: value + next/prev pointers (shared __slots__ node, see dsa/node.py)
+from .node import DoublyNode as Node
+
+# Default for the constructor, so DoublyLinkedList(None) still stores None
+_NO_VALUE = object()
+
+
+class DoublyLinkedList:
+    """
+    Doubly Linked List with head, tail, and length tracking.
+    """
+
+    def __init__(self, value=_NO_VALUE):
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+        if value is not _NO_VALUE:
+            self.append(value)
+
+    # --------------------------------------------------------
+    # Utility
+    def print_list(self):
+        temp = self.head
+        values = []
+        while temp:
+            values.append(str(temp.value))
+            temp = temp.next
+        print(" <-> ".join(values))
+
+    # --------------------------------------------------------
+    # Append
+    def append(self, value):
+        new_node = Node(value)
+
+        if self.length == 0:
+            self.head = new_node
+            self.tail = new_node
+        else:
+            self.tail.next = new_node
+            new_node.prev = self.tail
+            self.tail = new_node
+
+        self.length += 1
+        return True
+
+    # --------------------------------------------------------
+    # Pop (remove last)
+    def pop(self):
+        if self.length == 0:
+            return None
+
+        temp = self.tail
+
+        if self.length == 1:
+            self.head = None
+            self.tail = None
+        else:
+            self.tail = self.tail.prev
+            self.tail.next = None
+            temp.prev = None
+
+        self.length -= 1
+        return temp
+
+    # --------------------------------------------------------
+    # Prepend
+    def prepend(self, value):
+        new_node = Node(value)
+
+        if self.length == 0:
+            self.head = new_node
+            self.tail = new_node
+        else:
+            new_node.next = self.head
+            self.head.prev = new_node
+            self.head = new_node
+
+        self.length += 1
+        return True
+
+    # --------------------------------------------------------
+    # Pop First
+    def pop_first(self):
+        if self.length == 0:
+            return None
+
+        temp = self.head
+
+        if self.length == 1:
+            self.head = None
+            self.tail = None
+        else:
+            self.head = self.head.next
+            self.head.prev = None
+            temp.next = None
+
+        self.length -= 1
+        return temp
+
+    # --------------------------------------------------------
+    # Get (optimized)
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+
+        if index < self.length // 2:
+            temp = self.head
+            for _ in range(index):
+                temp = temp.next
+        else:
+            temp = self.tail
+            for _ in range(self.length - 1, index, -1):
+                temp = temp.prev
+
+        return temp
+
+    # --------------------------------------------------------
+    # Set Value
+    def set_value(self, index, value):
+        temp = self.get(index)
+        if temp:
+            temp.value = value
+            return True
+        return False
+
+    # --------------------------------------------------------
+    # Insert (middle only)
+    def insert(self, index, value):
+        if index < 0 or index >= self.length:
+            return False
+
+        if index == 0:
+            return self.prepend(value)
+
+        if index == self.length - 1:
+            return self.append(value)
+
+        new_node = Node(value)
+        before = self.get(index - 1)
+        after = before.next
+
+        new_node.prev = before
+        new_node.next = after
+        before.next = new_node
+        after.prev = new_node
+
+        self.length += 1
+        return True
+
+    # --------------------------------------------------------
+    # Remove
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+
+        if index == 0:
+            return self.pop_first()
+
+        if index == self.length - 1:
+            return self.pop()
+
+        temp = self.get(index)
+
+        temp.prev.next = temp.next
+        temp.next.prev = temp.prev
+
+        temp.next = None
+        temp.prev = None
+
+        self.length -= 1
+        return temp
+
+    # --------------------------------------------------------
+    # Node-handle operations
+    #
+    # These take a Node that belongs to this list (from get(), head,
+    # tail, or a previous insert_before / insert_after) and rewire
+    # its neighbours directly, so they are O(1) with no index walk.
+    # Passing a node from another list corrupts both lists.
+
+    # --------------------------------------------------------
+    # Unlink (remove a known node)
+    def unlink(self, node):
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.next = None
+        node.prev = None
+
+        self.length -= 1
+        return node
+
+    # --------------------------------------------------------
+    # Insert Before / Insert After (returns the new node)
+    def insert_before(self, node, value):
+        new_node = Node(value)
+
+        new_node.prev = node.prev
+        new_node.next = node
+
+        if node.prev is None:
+            self.head = new_node
+        else:
+            node.prev.next = new_node
+        node.prev = new_node
+
+        self.length += 1
+        return new_node
+
+    def insert_after(self, node, value):
+        new_node = Node(value)
+
+        new_node.prev = node
+        new_node.next = node.next
+
+        if node.next is None:
+            self.tail = new_node
+        else:
+            node.next.prev = new_node
+        node.next = new_node
+
+        self.length += 1
+        return new_node
+
+    # --------------------------------------------------------
+    # Move To Front / Move To Back
+    def move_to_front(self, node):
+        if node is self.head:
+            return node
+
+        self.unlink(node)
+
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+
+        self.length += 1
+        return node
+
+    def move_to_back(self, node):
+        if node is self.tail:
+            return node
+
+        self.unlink(node)
+
+        node.prev = self.tail
+        self.tail.next = node
+        self.tail = node
+
+        self.length += 1
+        return node
+
+    # --------------------------------------------------------
+    # Splice (move every node of other onto the end, O(1))
+    def splice(self, other):
+        if other is self:
+            raise ValueError("cannot splice a list onto itself")
+
+        if other.length == 0:
+            return True
+
+        if self.length == 0:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self.length += other.length
+
+        # other keeps no references to the moved nodes
+        other.head = None
+        other.tail = None
+        other.length = 0
+        return True
+
+    # --------------------------------------------------------
+    # Bulk construction
+    # Each call links the new values into a separate chain in one pass,
+    # then attaches it and updates head/tail/length once.
+    def extend(self, iterable):
+        dummy = Node(None)
+        tail = dummy
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            new_node.prev = tail
+            tail.next = new_node
+            tail = new_node
+            count += 1
+
+        if count == 0:
+            return True
+
+        first = dummy.next
+        if self.tail is None:
+            first.prev = None
+            self.head = first
+        else:
+            first.prev = self.tail
+            self.tail.next = first
+        self.tail = tail
+        self.length += count
+        return True
+
+    # Like deque.extendleft: each value is prepended in turn, so they
+    # end up in reverse order at the front
+    def extendleft(self, iterable):
+        first = None
+        last = None
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            if first is None:
+                last = new_node
+            else:
+                new_node.next = first
+                first.prev = new_node
+            first = new_node
+            count += 1
+
+        if count == 0:
+            return True
+
+        if self.head is None:
+            self.tail = last
+        else:
+            last.next = self.head
+            self.head.prev = last
+        self.head = first
+        self.length += count
+        return True
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        dll = cls()
+        dll.extend(iterable)
+        return dll
+
+    def to_list(self):
+        return list(self)
+
+    # --------------------------------------------------------
+    # Python list protocol
+    # Iteration yields values, not nodes; lst[i:j] is a lazy ListView
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return self._values_from(0)
+
+    def __reversed__(self):
+        return self._values_back_from(self.length - 1)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ListView(self, range(self.length)[index])
+
+        if index < 0:
+            index += self.length
+        node = self.get(index)
+        if node is None:
+            raise IndexError("DoublyLinkedList index out of range")
+        return node.value
+
+    def _values_from(self, index):
+        temp = self.get(index)
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
+    def _values_back_from(self, index):
+        temp = self.get(index)
+        while temp is not None:
+            yield temp.value
+            temp = temp.prev
@@ -0,0 +1,207 @@
+# ============================================================
+# Hash Table Implementation (Separate Chaining)
+# ============================================================
+
+from .hashers import BuiltinHasher
+
+
+class HashTable:
+    def __init__(self, size=7, hasher=None):
+        """
+        Initializes the hash table with a fixed number of buckets.
+
+        Each bucket will either contain:
+        - None
+        - A list of [key, value] pairs (separate chaining)
+
+        hasher is any object from dsa.hashers (or with the same
+        hash/hash_many methods). Defaults to Python's built-in hash().
+        """
+        self.data_map = [None] * size
+        self.hasher = hasher if hasher is not None else BuiltinHasher()
+
+        # Bound once so every lookup is a single call
+        self._hash_key = self.hasher.hash
+
+    def __hash(self, key):
+        """
+        Hash function to convert a key into a valid index.
+
+        Hash Strategy:
+        - Let the hasher turn the whole key into an integer
+        - Apply modulo to keep index within bounds
+        """
+        return self._hash_key(key) % len(self.data_map)
+
+    def hash_many(self, keys):
+        """
+        Returns the bucket index of every key in keys.
+
+        Hashers that support it (FNV1aHasher, SipHasher) compute the
+        whole batch at once with NumPy instead of key by key.
+        """
+        return self.hasher.hash_many(keys, len(self.data_map))
+
+    def set_item(self, key, value):
+        """
+        Inserts a key-value pair into the hash table.
+        If the key already exists its value is updated in place.
+
+        Collision Handling:
+        - Uses separate chaining (list at each index)
+        """
+        index = self.__hash(key)
+
+        # Case 1: No bucket exists yet
+        if self.data_map[index] is None:
+            self.data_map[index] = []
+
+        # Case 2: Key already in the bucket -> overwrite its value
+        for pair in self.data_map[index]:
+            if pair[0] == key:
+                pair[1] = value
+                return
+
+        # Case 3: New key -> append key-value pair to the bucket
+        self.data_map[index].append([key, value])
+
+    def increment(self, key, delta=1):
+        """
+        Adds delta to the value stored at key and returns the new value.
+
+        Missing keys start at 0. The key is hashed once and its bucket
+        scanned once, unlike a get_item followed by a set_item.
+        """
+        index = self.__hash(key)
+
+        if self.data_map[index] is None:
+            self.data_map[index] = []
+
+        for pair in self.data_map[index]:
+            if pair[0] == key:
+                pair[1] += delta
+                return pair[1]
+
+        self.data_map[index].append([key, delta])
+        return delta
+
+    def setdefault(self, key, default=None):
+        """
+        Returns the value for key, inserting default first if the key
+        is not present. Hashes and scans the bucket only once.
+        """
+        index = self.__hash(key)
+
+        if self.data_map[index] is None:
+            self.data_map[index] = []
+
+        for pair in self.data_map[index]:
+            if pair[0] == key:
+                return pair[1]
+
+        self.data_map[index].append([key, default])
+        return default
+
+    def get_item(self, key):
+        """
+        Retrieves the value associated with a given key.
+
+        Returns:
+        - Value if key exists
+        - None if key is not found
+        """
+        index = self.__hash(key)
+
+        # Traverse bucket if it exists
+        if self.data_map[index] is not None:
+            for pair in self.data_map[index]:
+                if pair[0] == key:
+                    return pair[1]
+
+        return None
+
+    @classmethod
+    def from_items(cls, items, expected_size=None, hasher=None):
+        """
+        Builds a hash table from an iterable of (key, value) pairs.
+
+        The bucket array is sized once up front (about one bucket per
+        key) instead of starting at 7, then every pair is inserted in
+        a single set_many pass. expected_size defaults to len(items).
+        """
+        items = list(items)
+        if expected_size is None:
+            expected_size = len(items)
+
+        table = cls(size=max(7, expected_size), hasher=hasher)
+        table.set_many(items)
+        return table
+
+    def set_many(self, pairs):
+        """
+        Inserts or updates every (key, value) pair in pairs.
+
+        Bucket indexes for the whole batch come from one hash_many
+        call, and the bucket array is looked up once for the batch
+        rather than once per key.
+        """
+        pairs = list(pairs)
+        indexes = self.hash_many([pair[0] for pair in pairs])
+        data_map = self.data_map
+
+        for (key, value), index in zip(pairs, indexes):
+            bucket = data_map[index]
+
+            if bucket is None:
+                data_map[index] = [[key, value]]
+                continue
+
+            for pair in bucket:
+                if pair[0] == key:
+                    pair[1] = value
+                    break
+            else:
+                bucket.append([key, value])
+
+    def get_many(self, keys):
+        """
+        Returns a list with the value of every key in keys
+        (None for keys that are not found).
+        """
+        keys = list(keys)
+        indexes = self.hash_many(keys)
+        data_map = self.data_map
+        values = []
+
+        for key, index in zip(keys, indexes):
+            value = None
+            bucket = data_map[index]
+            if bucket is not None:
+                for pair in bucket:
+                    if pair[0] == key:
+                        value = pair[1]
+                        break
+            values.append(value)
+
+        return values
+
+    def keys(self):
+        """
+        Returns a list of all keys present in the hash table.
+        """
+        all_keys = []
+
+        for bucket in self.data_map:
+            if bucket is not None:
+                for pair in bucket:
+                    all_keys.append(pair[0])
+
+        return all_keys
+
+    def print_table(self):
+        """
+        Prints the internal structure of the hash table.
+        Useful for debugging and visualization.
+        """
+        for index, bucket in enumerate(self.data_map):
+            print(index, ":", bucket)
@@ -0,0 +1,267 @@
+# ============================================================
+# Pluggable Hash Functions for HashTable
+# ============================================================
+#
+# A hasher turns any hashable key into an integer via hash(key), and
+# hashes a whole batch of keys at once via hash_many(keys, size).
+# When size is given, hash_many returns bucket indexes (hash % size)
+# instead of raw hashes.
+#
+# FNV1aHasher and SipHasher work on the key's bytes, so str, bytes and
+# int keys hash the same way in every process. Their hash_many vectorizes
+# over the batch with NumPy when it is installed.
+
+import secrets
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+
+# NumPy is optional and only imported the first time a batch is hashed
+_np = None
+_np_checked = False
+
+
+def _numpy():
+    global _np, _np_checked
+    if not _np_checked:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+        _np_checked = True
+    return _np
+
+
+def _key_bytes(key):
+    """
+    Returns the bytes a byte-oriented hasher should consume for key.
+
+    str and bytes-like keys are hashed by content. Any other hashable
+    key is reduced through the built-in hash() first, which keeps
+    equal keys (1, 1.0, True) hashing the same.
+    """
+    if isinstance(key, str):
+        return key.encode("utf-8", "surrogatepass")
+    if isinstance(key, (bytes, bytearray, memoryview)):
+        return bytes(key)
+    return hash(key).to_bytes(8, "little", signed=True)
+
+
+def _pack(np, data):
+    """
+    Packs a list of byte strings into a zero-padded 2-D uint8 array.
+
+    Returns (buffer, lengths). buffer has one row per key; its width is
+    the longest key rounded down to a multiple of 8 plus one extra
+    8-byte word, so every row ends with a (possibly empty) partial word.
+    """
+    n = len(data)
+    lengths = np.fromiter(map(len, data), dtype=np.int64, count=n)
+    width = (int(lengths.max()) // 8 + 1) * 8
+
+    buffer = np.zeros((n, width), dtype=np.uint8)
+    flat = np.frombuffer(b"".join(data), dtype=np.uint8)
+    if flat.size:
+        starts = np.cumsum(lengths) - lengths
+        rows = np.repeat(np.arange(n), lengths)
+        cols = np.arange(flat.size) - np.repeat(starts, lengths)
+        buffer[rows, cols] = flat
+
+    return buffer, lengths
+
+
+def _sip_round(v0, v1, v2, v3):
+    v0 = (v0 + v1) & _MASK64
+    v1 = ((v1 << 13) | (v1 >> 51)) & _MASK64
+    v1 ^= v0
+    v0 = ((v0 << 32) | (v0 >> 32)) & _MASK64
+    v2 = (v2 + v3) & _MASK64
+    v3 = ((v3 << 16) | (v3 >> 48)) & _MASK64
+    v3 ^= v2
+    v0 = (v0 + v3) & _MASK64
+    v3 = ((v3 << 21) | (v3 >> 43)) & _MASK64
+    v3 ^= v0
+    v2 = (v2 + v1) & _MASK64
+    v1 = ((v1 << 17) | (v1 >> 47)) & _MASK64
+    v1 ^= v2
+    v2 = ((v2 << 32) | (v2 >> 32)) & _MASK64
+    return v0, v1, v2, v3
+
+
+class Hasher:
+    """
+    Base class for hashers.
+
+    Subclasses implement hash(key). The default hash_many simply
+    calls hash for every key.
+    """
+
+    def hash(self, key):
+        raise NotImplementedError
+
+    def hash_many(self, keys, size=None):
+        hash_key = self.hash
+        if size is None:
+            return [hash_key(key) for key in keys]
+        return [hash_key(key) % size for key in keys]
+
+
+class BuiltinHasher(Hasher):
+    """
+    Python's built-in hash().
+
+    Fastest option: str hashes are computed in C and cached on the
+    string object. String hashes are randomized per process.
+    """
+
+    hash = staticmethod(hash)
+
+    def hash_many(self, keys, size=None):
+        if size is None:
+            return [hash(key) for key in keys]
+        return [hash(key) % size for key in keys]
+
+
+class FNV1aHasher(Hasher):
+    """
+    64-bit FNV-1a over the key's bytes.
+
+    Logic:
+    1. Start from the FNV offset basis.
+    2. For each byte: XOR it into the hash, then multiply by the
+       FNV prime (mod 2^64).
+    """
+
+    def hash(self, key):
+        h = _FNV_OFFSET
+        for byte in _key_bytes(key):
+            h = ((h ^ byte) * _FNV_PRIME) & _MASK64
+        return h
+
+    def hash_many(self, keys, size=None):
+        np = _numpy()
+        if np is None or len(keys) == 0:
+            return super().hash_many(keys, size)
+
+        # One row per key; each column step hashes one byte of every
+        # key that is still long enough
+        buffer, lengths = _pack(np, [_key_bytes(key) for key in keys])
+        h = np.full(len(keys), _FNV_OFFSET, dtype=np.uint64)
+        prime = np.uint64(_FNV_PRIME)
+
+        for j in range(int(lengths.max())):
+            h = np.where(lengths > j, (h ^ buffer[:, j]) * prime, h)
+
+        if size is not None:
+            h %= np.uint64(size)
+        return h.tolist()
+
+
+class SipHasher(Hasher):
+    """
+    Seeded SipHash-2-4 over the key's bytes.
+
+    The 128-bit seed makes bucket positions unpredictable to anyone
+    who does not know it. Pass a fixed seed to get the same hashes
+    across processes; by default a random one is drawn.
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = secrets.randbits(128)
+        self.seed = seed
+        self._k0 = seed & _MASK64
+        self._k1 = (seed >> 64) & _MASK64
+
+    def hash(self, key):
+        data = _key_bytes(key)
+        k0, k1 = self._k0, self._k1
+
+        v0 = k0 ^ 0x736F6D6570736575
+        v1 = k1 ^ 0x646F72616E646F6D
+        v2 = k0 ^ 0x6C7967656E657261
+        v3 = k1 ^ 0x7465646279746573
+
+        # Compression: 8-byte little-endian words, 2 rounds each
+        n = len(data)
+        end = n - n % 8
+        for offset in range(0, end, 8):
+            m = int.from_bytes(data[offset:offset + 8], "little")
+            v3 ^= m
+            v0, v1, v2, v3 = _sip_round(v0, v1, v2, v3)
+            v0, v1, v2, v3 = _sip_round(v0, v1, v2, v3)
+            v0 ^= m
+
+        # Final word: leftover bytes with the length in the top byte
+        b = ((n & 0xFF) << 56) | int.from_bytes(data[end:], "little")
+        v3 ^= b
+        v0, v1, v2, v3 = _sip_round(v0, v1, v2, v3)
+        v0, v1, v2, v3 = _sip_round(v0, v1, v2, v3)
+        v0 ^= b
+
+        # Finalization: 4 rounds
+        v2 ^= 0xFF
+        for _ in range(4):
+            v0, v1, v2, v3 = _sip_round(v0, v1, v2, v3)
+
+        return v0 ^ v1 ^ v2 ^ v3
+
+    def hash_many(self, keys, size=None):
+        np = _numpy()
+        if np is None or len(keys) == 0:
+            return super().hash_many(keys, size)
+
+        buffer, lengths = _pack(np, [_key_bytes(key) for key in keys])
+        words = buffer.view("<u8")
+        n = len(keys)
+        blocks = lengths // 8
+
+        def rotl(x, b):
+            return (x << np.uint64(b)) | (x >> np.uint64(64 - b))
+
+        def sip_round(v0, v1, v2, v3):
+            v0 = v0 + v1
+            v1 = rotl(v1, 13) ^ v0
+            v0 = rotl(v0, 32)
+            v2 = v2 + v3
+            v3 = rotl(v3, 16) ^ v2
+            v0 = v0 + v3
+            v3 = rotl(v3, 21) ^ v0
+            v2 = v2 + v1
+            v1 = rotl(v1, 17) ^ v2
+            v2 = rotl(v2, 32)
+            return v0, v1, v2, v3
+
+        v0 = np.full(n, self._k0 ^ 0x736F6D6570736575, dtype=np.uint64)
+        v1 = np.full(n, self._k1 ^ 0x646F72616E646F6D, dtype=np.uint64)
+        v2 = np.full(n, self._k0 ^ 0x6C7967656E657261, dtype=np.uint64)
+        v3 = np.full(n, self._k1 ^ 0x7465646279746573, dtype=np.uint64)
+
+        # Compression: column c only applies to keys with > c full words
+        for c in range(int(blocks.max())):
+            active = blocks > c
+            m = words[:, c]
+            u0, u1, u2, u3 = sip_round(v0, v1, v2, v3 ^ m)
+            u0, u1, u2, u3 = sip_round(u0, u1, u2, u3)
+            v0 = np.where(active, u0 ^ m, v0)
+            v1 = np.where(active, u1, v1)
+            v2 = np.where(active, u2, v2)
+            v3 = np.where(active, u3, v3)
+
+        # Final word is zero-padded by _pack, so only the length is added
+        b = words[np.arange(n), blocks] | ((lengths & 0xFF).astype(np.uint64) << np.uint64(56))
+        v0, v1, v2, v3 = sip_round(v0, v1, v2, v3 ^ b)
+        v0, v1, v2, v3 = sip_round(v0, v1, v2, v3)
+        v0 ^= b
+
+        v2 ^= np.uint64(0xFF)
+        for _ in range(4):
+            v0, v1, v2, v3 = sip_round(v0, v1, v2, v3)
+
+        h = v0 ^ v1 ^ v2 ^ v3
+        if size is not None:
+            h %= np.uint64(size)
+        return h.tolist()
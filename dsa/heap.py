@@ -0,0 +1,427 @@
+class MaxHeap:
+    """
+    Max Heap implementation using a list (array-based binary heap).
+
+    Heap Property:
+    - Every parent node is greater than or equal to its children.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty heap.
+        """
+        self.heap = []
+
+    def _left_child(self, index):
+        """
+        Calculate the index of the left child.
+
+        Formula:
+        left_child = 2 * index + 1
+        """
+        return 2 * index + 1
+
+    def _right_child(self, index):
+        """
+        Calculate the index of the right child.
+
+        Formula:
+        right_child = 2 * index + 2
+        """
+        return 2 * index + 2
+
+    def _parent(self, index):
+        """
+        Calculate the index of the parent node.
+
+        Formula:
+        parent = (index - 1) // 2
+        """
+        return (index - 1) // 2
+
+    def _swap(self, index1, index2):
+        """
+        Swap two elements in the heap by index.
+        """
+        self.heap[index1], self.heap[index2] = self.heap[index2], self.heap[index1]
+
+    def insert(self, value):
+        """
+        Insert a value into the heap.
+
+        Logic:
+        1. Append value at the end of the array.
+        2. Bubble the value up until heap property is restored.
+        """
+
+        # Step 1: Insert value at the end
+        self.heap.append(value)
+
+        # Step 2: Track the index of the newly inserted value
+        current = len(self.heap) - 1
+
+        # Step 3: Bubble up while heap property is violated
+        while current > 0 and self.heap[current] > self.heap[self._parent(current)]:
+            self._swap(current, self._parent(current))
+            current = self._parent(current)
+
+    def remove(self):
+        """
+        Remove and return the maximum value (root) from the heap.
+
+        Logic:
+        1. Handle empty heap.
+        2. Handle single-element heap.
+        3. Replace root with last element.
+        4. Sink down to restore heap property.
+        """
+
+        # Case 1: Empty heap
+        if len(self.heap) == 0:
+            return None
+
+        # Case 2: Single element heap
+        if len(self.heap) == 1:
+            return self.heap.pop()
+
+        # Case 3: Multiple elements
+        max_value = self.heap[0]
+
+        # Move last element to root
+        self.heap[0] = self.heap.pop()
+
+        # Restore heap property
+        self._sink_down(0)
+
+        return max_value
+
+    def _sink_down(self, index):
+        """
+        Restore heap property by sinking the value at index downward.
+
+        Logic:
+        1. Compare node with left and right children.
+        2. Swap with the larger child if violation occurs.
+        3. Repeat until heap property is restored.
+        """
+
+        max_index = index
+
+        while True:
+            left_index = self._left_child(index)
+            right_index = self._right_child(index)
+
+            # Compare with left child
+            if left_index < len(self.heap) and self.heap[left_index] > self.heap[max_index]:
+                max_index = left_index
+
+            # Compare with right child
+            if right_index < len(self.heap) and self.heap[right_index] > self.heap[max_index]:
+                max_index = right_index
+
+            # If a swap is needed, perform it
+            if max_index != index:
+                self._swap(index, max_index)
+                index = max_index
+            else:
+                # Heap property is satisfied
+                return
+
+    def _heapify(self):
+        """
+        Restore the heap property over the whole list (bottom-up).
+
+        Logic:
+        1. The second half of the list is leaves: already heaps.
+        2. Sink down every other index, the last one first, so both
+           subtrees below it are heaps by the time it is reached.
+
+        Half the nodes are leaves and most of the rest sink only a
+        level or two, so the total work is O(n), not O(n log n).
+        """
+        heap = self.heap
+        size = len(heap)
+
+        for start in range(size // 2 - 1, -1, -1):
+            # Same as _sink_down, inlined for speed: the value is held
+            # aside and a hole moves down instead of swapping
+            value = heap[start]
+            index = start
+            child = 2 * index + 1
+            while child < size:
+                if child + 1 < size and heap[child + 1] > heap[child]:
+                    child += 1
+                if not heap[child] > value:
+                    break
+                heap[index] = heap[child]
+                index = child
+                child = 2 * index + 1
+            heap[index] = value
+
+    @classmethod
+    def from_iterable(cls, values):
+        """
+        Build a heap from any iterable in O(n) (one _heapify pass
+        instead of n inserts).
+        """
+        heap = cls()
+        heap.heap = list(values)
+        heap._heapify()
+        return heap
+
+    def insert_many(self, values):
+        """
+        Insert every value.
+
+        A batch larger than the heap is appended and the whole list
+        re-heapified (O(n + k)); a small batch is inserted one by one
+        (O(k log n)).
+        """
+        values = list(values)
+        if len(values) > len(self.heap):
+            self.heap.extend(values)
+            self._heapify()
+        else:
+            for value in values:
+                self.insert(value)
+
+    def pop_many(self, k):
+        """
+        Remove and return up to k values, largest first.
+        """
+        return [self.remove() for _ in range(min(k, len(self.heap)))]
+
+    def pushpop(self, value):
+        """
+        Insert value, then remove and return the maximum, with at most
+        one sink down.
+
+        If value is at least the current maximum it would come straight
+        back out, so the heap is not touched at all.
+        """
+        if len(self.heap) == 0 or value >= self.heap[0]:
+            return value
+
+        max_value = self.heap[0]
+        self.heap[0] = value
+        self._sink_down(0)
+        return max_value
+
+    def replace(self, value):
+        """
+        Remove and return the maximum, then insert value (one sink
+        down). On an empty heap value is just inserted and None is
+        returned.
+        """
+        if len(self.heap) == 0:
+            self.heap.append(value)
+            return None
+
+        max_value = self.heap[0]
+        self.heap[0] = value
+        self._sink_down(0)
+        return max_value
+
+    def _largest_indexes(self, k):
+        """
+        Indexes of the k largest entries, largest first, without
+        changing the heap.
+
+        Logic:
+        1. The maximum is at index 0.
+        2. The next largest is always a child of an index already
+           taken, so keep those children in a small candidate heap.
+        3. Take the best candidate k times: O(k log k), however big
+           the heap is.
+        """
+        heap = self.heap
+        if k <= 0 or len(heap) == 0:
+            return []
+
+        candidates = MaxHeap()
+        candidates.insert((heap[0], 0))
+        indexes = []
+
+        while len(indexes) < k and len(candidates.heap) > 0:
+            _, index = candidates.remove()
+            indexes.append(index)
+            for child in (self._left_child(index), self._right_child(index)):
+                if child < len(heap):
+                    candidates.insert((heap[child], child))
+        return indexes
+
+    def nlargest(self, k):
+        """
+        Return the k largest values, largest first, leaving the heap
+        unchanged.
+        """
+        return [self.heap[index] for index in self._largest_indexes(k)]
+
+    def __len__(self):
+        return len(self.heap)
+
+
+class IndexedMaxHeap(MaxHeap):
+    """
+    Max heap of keys ordered by priority, with a position map so any
+    queued key can be found, re-prioritized or removed in O(log n).
+
+    Internal representation:
+    - self.heap     -> priorities in heap order (what MaxHeap compares)
+    - self.keys     -> the key stored at the same index
+    - self.position -> key -> its current index in both lists
+
+    Every swap updates the position map, so it always points at the
+    key's current slot.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty heap with an empty position map.
+        """
+        super().__init__()
+        self.keys = []
+        self.position = {}
+
+    def _swap(self, index1, index2):
+        """
+        Swap two entries (priority and key) and record their new
+        positions.
+        """
+        super()._swap(index1, index2)
+        keys = self.keys
+        keys[index1], keys[index2] = keys[index2], keys[index1]
+        self.position[keys[index1]] = index1
+        self.position[keys[index2]] = index2
+
+    def _bubble_up(self, index):
+        """
+        Move the entry at index up while it beats its parent.
+        """
+        while index > 0 and self.heap[index] > self.heap[self._parent(index)]:
+            self._swap(index, self._parent(index))
+            index = self._parent(index)
+
+    def insert(self, key, priority):
+        """
+        Add key with the given priority.
+
+        Returns False (and changes nothing) if key is already queued;
+        use update_priority for that.
+        """
+        if key in self.position:
+            return False
+
+        self.heap.append(priority)
+        self.keys.append(key)
+        self.position[key] = len(self.heap) - 1
+        self._bubble_up(len(self.heap) - 1)
+        return True
+
+    def update_priority(self, key, priority):
+        """
+        Raise or lower the priority of a queued key.
+
+        Logic:
+        1. Look up the key's index in the position map (O(1)).
+        2. Overwrite its priority.
+        3. Bubble up if it grew, sink down if it shrank.
+
+        Returns False if key is not queued.
+        """
+        index = self.position.get(key)
+        if index is None:
+            return False
+
+        old_priority = self.heap[index]
+        self.heap[index] = priority
+
+        if priority > old_priority:
+            self._bubble_up(index)
+        elif priority < old_priority:
+            self._sink_down(index)
+        return True
+
+    def _remove_at(self, index):
+        """
+        Remove the entry at index and return (key, priority).
+
+        The last entry fills the hole and is moved up or down,
+        whichever its priority calls for.
+        """
+        last = len(self.heap) - 1
+        if index != last:
+            self._swap(index, last)
+
+        priority = self.heap.pop()
+        key = self.keys.pop()
+        del self.position[key]
+
+        if index < len(self.heap):
+            self._bubble_up(index)
+            self._sink_down(index)
+        return key, priority
+
+    def remove(self):
+        """
+        Remove and return (key, priority) of the maximum, or None if
+        the heap is empty.
+        """
+        if len(self.heap) == 0:
+            return None
+        return self._remove_at(0)
+
+    def remove_key(self, key):
+        """
+        Remove key wherever it is in the heap.
+        Returns its priority, or None if key is not queued.
+        """
+        index = self.position.get(key)
+        if index is None:
+            return None
+        return self._remove_at(index)[1]
+
+    def peek(self):
+        """
+        Return (key, priority) of the maximum without removing it,
+        or None if the heap is empty.
+        """
+        if len(self.heap) == 0:
+            return None
+        return self.keys[0], self.heap[0]
+
+    def contains(self, key):
+        return key in self.position
+
+    def get_priority(self, key):
+        """
+        Return the priority of a queued key, or None.
+        """
+        index = self.position.get(key)
+        return None if index is None else self.heap[index]
+
+    def nlargest(self, k):
+        """
+        Return (key, priority) of the k highest priorities, highest
+        first, leaving the heap unchanged.
+        """
+        return [(self.keys[index], self.heap[index])
+                for index in self._largest_indexes(k)]
+
+    # MaxHeap's value-only batch methods do not apply: every entry
+    # here needs a key
+    @classmethod
+    def from_iterable(cls, values):
+        raise TypeError("IndexedMaxHeap entries need a key; use insert(key, priority)")
+
+    def insert_many(self, values):
+        raise TypeError("IndexedMaxHeap entries need a key; use insert(key, priority)")
+
+    def pushpop(self, value):
+        raise TypeError("IndexedMaxHeap entries need a key; use insert(key, priority)")
+
+    def replace(self, value):
+        raise TypeError("IndexedMaxHeap entries need a key; use insert(key, priority)")
+
+    def __contains__(self, key):
+        return key in self.position
@@ -0,0 +1,268 @@
+# -------------------------------
+# Singly Linked List Implementation (Cheatsheet)
+# -------------------------------
+
+from itertools import islice
+
+from .list_view import ListView
+
+# Node class: represents a single element in the linked list
+# (shared __slots__ node, see dsa/node.py)
+from .node import SinglyNode as Node
+
+# Default for the constructor, so LinkedList(None) still stores None
+_NO_VALUE = object()
+
+
+# LinkedList class: manages nodes and provides operations
+class LinkedList:
+    def __init__(self, value=_NO_VALUE):
+        # Start empty, or with one node when a value is given
+        self.head = None       # first node in the list
+        self.tail = None       # last node in the list
+        self.length = 0        # number of nodes
+
+        if value is not _NO_VALUE:
+            self.append(value)
+
+    # -------------------------------
+    # Add node at the end
+    def append(self, value):
+        new_node = Node(value)
+        if self.head is None:  # empty list case
+            self.head = new_node
+            self.tail = new_node
+        else:                  # attach new node at the tail
+            self.tail.next = new_node
+            self.tail = new_node
+        self.length += 1
+        return True
+
+    # -------------------------------
+    # Print all values in the list
+    def print_list(self):
+        temp = self.head
+        while temp is not None:
+            print(temp.value)
+            temp = temp.next
+
+    # -------------------------------
+    # Remove last node (pop)
+    def pop(self):
+        if self.length == 0:   # empty list
+            return None
+        
+        temp = self.head
+        pre = self.head
+        # Traverse until the last node
+        while temp.next:
+            pre = temp
+            temp = temp.next
+        
+        self.tail = pre        # update tail
+        self.tail.next = None  # disconnect last node
+        self.length -= 1
+
+        # If list becomes empty
+        if self.length == 0:
+            self.head = None
+            self.tail = None
+
+        return temp.value      # return removed node's value
+
+    # -------------------------------
+    # Add node at the beginning
+    def prepend(self, value):
+        new_node = Node(value)
+        if self.length == 0:   # empty list case
+            self.head = new_node
+            self.tail = new_node
+        else:                  # attach before head
+            new_node.next = self.head
+            self.head = new_node
+        self.length += 1
+        return True
+
+    # -------------------------------
+    # Remove first node
+    def pop_first(self):
+        if self.length == 0:
+            return None
+        
+        temp = self.head
+        self.head = self.head.next  # move head forward
+        temp.next = None            # disconnect old head
+        self.length -= 1
+
+        if self.length == 0:        # if list becomes empty
+            self.tail = None
+        return temp
+
+    # -------------------------------
+    # Get node at specific index
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        temp = self.head
+        for _ in range(index):      # traverse until index
+            temp = temp.next
+        return temp
+
+    # -------------------------------
+    # Update value at specific index
+    def set_value(self, index, value):
+        temp = self.get(index)
+        if temp is not None:
+            temp.value = value
+            return True
+        return False
+
+    # -------------------------------
+    # Insert node at specific index
+    def insert(self, index, value):
+        if index < 0 or index > self.length:   
+            return False
+        
+        if index == 0:
+            return self.prepend(value)
+        if index == self.length:               
+            return self.append(value)
+        
+        new_node = Node(value)
+        temp = self.get(index - 1)             # node before insertion point
+        new_node.next = temp.next
+        temp.next = new_node
+        self.length += 1
+        return True
+
+    # -------------------------------
+    # Remove node at specific index
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        
+        if index == 0:
+            return self.pop_first()
+        if index == self.length - 1:
+            return self.pop()
+        
+        prev = self.get(index - 1)
+        temp = prev.next
+        prev.next = temp.next
+        temp.next = None
+        self.length -= 1   
+        return temp
+
+    # -------------------------------
+    # Reverse the linked list
+    def reverse(self):
+        temp = self.head
+        self.head = self.tail
+        self.tail = temp
+
+        after = None
+        before = None
+
+        # Standard reversal loop
+        while temp is not None:
+            after = temp.next
+            temp.next = before
+            before = temp
+            temp = after
+
+    # -------------------------------
+    # Bulk construction
+    # Each call links the new values into a separate chain in one pass,
+    # then attaches it and updates tail/length once.
+    def extend(self, iterable):
+        dummy = Node(None)
+        tail = dummy
+        count = 0
+        for value in iterable:
+            tail.next = tail = Node(value)
+            count += 1
+
+        if count == 0:
+            return True
+
+        if self.head is None:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = tail
+        self.length += count
+        return True
+
+    # Like deque.extendleft: each value is prepended in turn, so they
+    # end up in reverse order at the front
+    def extendleft(self, iterable):
+        first = self.head
+        last = None
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            new_node.next = first
+            first = new_node
+            if last is None:
+                last = new_node
+            count += 1
+
+        if count == 0:
+            return True
+
+        self.head = first
+        if self.tail is None:
+            self.tail = last
+        self.length += count
+        return True
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        linked = cls()
+        linked.extend(iterable)
+        return linked
+
+    def to_list(self):
+        return list(self)
+
+    # -------------------------------
+    # Python list protocol
+    # Iteration yields values, not nodes; lst[i:j] is a lazy ListView
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return self._values_from(0)
+
+    def __reversed__(self):
+        return self._values_back_from(self.length - 1)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ListView(self, range(self.length)[index])
+
+        if index < 0:
+            index += self.length
+        node = self.get(index)
+        if node is None:
+            raise IndexError("LinkedList index out of range")
+        return node.value
+
+    def _values_from(self, index):
+        temp = self.head
+        for _ in range(index):
+            # The list may have shrunk since a view was made
+            if temp is None:
+                return
+            temp = temp.next
+        while temp is not None:
+            yield temp.value
+            temp = temp.next
+
+    def _values_back_from(self, index):
+        # No prev pointers: collect values 0..index, then walk them backwards
+        values = list(islice(self._values_from(0), index + 1))
+        if len(values) <= index:
+            # index is past the end now (the list shrank)
+            return iter(())
+        return reversed(values)
@@ -0,0 +1,55 @@
+# ============================================================
+# Lazy Slice Views for LinkedList / DoublyLinkedList
+# ============================================================
+#
+# lst[2:10:2] returns a ListView instead of a new list. The view only
+# stores the list and the range of indexes it covers; values are read
+# from the nodes each time the view is iterated, so no nodes are
+# copied and later set_value calls show through.
+#
+# Like a memoryview slice, the index range is fixed when the view is
+# made. If the list shrinks afterwards, iteration stops at its end.
+#
+# The list provides two generators for the view to walk with:
+#   _values_from(i)       values at i, i + 1, ..., end
+#   _values_back_from(i)  values at i, i - 1, ..., 0
+
+from itertools import islice
+
+
+class ListView:
+    def __init__(self, source, indexes):
+        self._source = source
+        self._indexes = indexes     # range of list indexes
+
+    def __len__(self):
+        return len(self._indexes)
+
+    def __iter__(self):
+        indexes = self._indexes
+        if not indexes:
+            return iter(())
+
+        step = indexes.step
+        if step > 0:
+            values = self._source._values_from(indexes.start)
+        else:
+            values = self._source._values_back_from(indexes.start)
+            step = -step
+
+        # Every step-th value, len(indexes) of them
+        return islice(values, 0, (len(indexes) - 1) * step + 1, step)
+
+    def __reversed__(self):
+        return iter(ListView(self._source, self._indexes[::-1]))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ListView(self._source, self._indexes[index])
+        return self._source[self._indexes[index]]
+
+    def to_list(self):
+        return list(self)
+
+    def __repr__(self):
+        return f"ListView({self.to_list()!r})"
@@ -0,0 +1,443 @@
+# ============================================================
+# Hash Table Implementation (Memory-Mapped, On Disk)
+# ============================================================
+#
+# Persistent variant of HashTable for key sets larger than RAM.
+# Everything lives in one memory-mapped file:
+#
+#   [ header | slot array | records ... | newer slot array | records ... ]
+#
+# - header:     magic, where the current slot array starts, counters
+# - slot array: fixed-width (hash, record offset) pairs, open addressing
+# - records:    append-only heap of key/value records
+#
+# Opening a table only reads the header; slots and records are read
+# straight out of the page cache on demand. When the slot array fills
+# up, a larger one is appended to the end of the file and the old one
+# is simply abandoned, so records never move.
+#
+# Hashes must be stable between processes, so keys are hashed with
+# BLAKE2b (from hashlib) rather than the per-process hash().
+# Keys are str or bytes; values that are not bytes or str are pickled,
+# so only open files you trust.
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import sys
+
+_MAGIC = b"DSAHTBL1"
+
+# magic, slots_offset, slot_count, used, filled, end, byte_order
+_HEADER = struct.Struct("<8sQQQQQB")
+_HEADER_SIZE = 64
+
+# Byte order of the slot words (native uint64s). 0 is what files
+# written before this field existed hold; they came from
+# little-endian hosts.
+_ORDER_LITTLE = 1
+_ORDER_BIG = 2
+_NATIVE_ORDER = _ORDER_LITTLE if sys.byteorder == "little" else _ORDER_BIG
+
+# key_len, value_len, key_tag, value_tag
+_RECORD = struct.Struct("<IIBB")
+
+# Each slot is two native uint64 words: hash, record offset. The
+# header records which byte order that is, and a file is refused on a
+# host with the other one.
+_SLOT_SIZE = 16
+
+# Record offsets 0 and 1 fall inside the header, so they can never
+# point at a real record and are free to use as markers
+_EMPTY = 0
+_DELETED = 1
+
+# Type tags stored with each key / value
+_TAG_BYTES = 0
+_TAG_STR = 1
+_TAG_PICKLE = 2
+
+_PERTURB_SHIFT = 5
+
+
+def _encode_key(key):
+    if isinstance(key, str):
+        return _TAG_STR, key.encode("utf-8", "surrogatepass")
+    if isinstance(key, (bytes, bytearray, memoryview)):
+        return _TAG_BYTES, bytes(key)
+    raise TypeError("MmapHashTable keys must be str or bytes")
+
+
+def _encode_value(value):
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return _TAG_BYTES, bytes(value)
+    if isinstance(value, str):
+        return _TAG_STR, value.encode("utf-8", "surrogatepass")
+    return _TAG_PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(tag, data):
+    if tag == _TAG_BYTES:
+        return bytes(data)
+    if tag == _TAG_STR:
+        return str(data, "utf-8", "surrogatepass")
+    return pickle.loads(data)
+
+
+def _key_hash(tag, data):
+    digest = hashlib.blake2b(data, digest_size=8, person=bytes([tag])).digest()
+    return int.from_bytes(digest, "little")
+
+
+class MmapHashTable:
+    def __init__(self, path, slots=1024, max_load_factor=0.66, readonly=False):
+        """
+        Opens the table stored at path, creating it if it does not
+        exist or is empty.
+
+        slots is the initial slot count for a new file (rounded up to
+        a power of two). readonly maps an existing file read-only.
+        """
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+
+        self.path = path
+        self.max_load_factor = max_load_factor
+        self.readonly = readonly
+
+        # Views handed out by get_view keep an old mapping alive
+        self._retired = []
+
+        if readonly:
+            mode = "rb"
+        elif os.path.exists(path):
+            mode = "r+b"
+        else:
+            mode = "w+b"
+        self._file = open(path, mode)
+        self._mm = None
+
+        try:
+            if os.path.getsize(path) == 0:
+                if readonly:
+                    raise ValueError(f"{path!r} is empty")
+                self._create(slots)
+            else:
+                self._map()
+                self._read_header()
+        except BaseException:
+            # Not a usable table: release the mapping and the file
+            if self._mm is not None:
+                self._mm.close()
+            self._file.close()
+            raise
+
+    # --------------------------------------------------------
+    # File management
+    def _create(self, slots):
+        slot_count = 8
+        while slot_count < slots:
+            slot_count *= 2
+
+        self._file.truncate(_HEADER_SIZE + slot_count * _SLOT_SIZE)
+        self._map()
+
+        self._slots_offset = _HEADER_SIZE
+        self._slot_count = slot_count
+        self._used = 0
+        self._filled = 0
+        self._end = _HEADER_SIZE + slot_count * _SLOT_SIZE
+        self._write_header()
+        self._bind_slots()
+
+    def _map(self):
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+
+    def _read_header(self):
+        (magic, slots_offset, slot_count, used, filled, end,
+         order) = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path!r} is not an MmapHashTable file")
+        if (order or _ORDER_LITTLE) != _NATIVE_ORDER:
+            raise ValueError(
+                f"{self.path!r} was written on a host with the other byte order"
+            )
+
+        self._slots_offset = slots_offset
+        self._slot_count = slot_count
+        self._used = used
+        self._filled = filled
+        self._end = end
+        self._bind_slots()
+
+    def _write_header(self):
+        _HEADER.pack_into(
+            self._mm, 0, _MAGIC, self._slots_offset, self._slot_count,
+            self._used, self._filled, self._end, _NATIVE_ORDER,
+        )
+
+    def _bind_slots(self):
+        """
+        Views the slot array as a flat sequence of uint64 words:
+        slots[2*i] is the hash and slots[2*i + 1] the record offset
+        of slot i. No data is copied.
+        """
+        start = self._slots_offset
+        stop = start + self._slot_count * _SLOT_SIZE
+        self._slots = memoryview(self._mm)[start:stop].cast("Q")
+
+    def _reserve(self, nbytes):
+        """
+        Returns the file offset of nbytes of fresh space at the end of
+        the heap, growing the file (and remapping it) when needed.
+        """
+        offset = self._end
+        needed = offset + nbytes
+
+        if needed > len(self._mm):
+            size = len(self._mm)
+            while size < needed:
+                size *= 2
+
+            self._slots.release()
+            try:
+                self._mm.close()
+            except BufferError:
+                # A caller still holds a get_view() memoryview
+                self._retired.append(self._mm)
+            self._file.truncate(size)
+            self._map()
+            self._bind_slots()
+
+        self._end = needed
+        return offset
+
+    def _grow_slots(self):
+        """
+        Appends a slot array twice the size of the live entries and
+        re-inserts every (hash, offset) pair. Records are not touched.
+        """
+        old_slots = self._slots.tolist()
+
+        slot_count = 8
+        while slot_count * self.max_load_factor <= self._used * 2:
+            slot_count *= 2
+
+        # Keep the new array 8-byte aligned for the uint64 view
+        self._end += -self._end % 8
+        offset = self._reserve(slot_count * _SLOT_SIZE)
+        self._mm[offset:offset + slot_count * _SLOT_SIZE] = bytes(slot_count * _SLOT_SIZE)
+
+        self._slots.release()
+        self._slots_offset = offset
+        self._slot_count = slot_count
+        self._filled = self._used
+        self._bind_slots()
+
+        slots = self._slots
+        for i in range(0, len(old_slots), 2):
+            record = old_slots[i + 1]
+            if record != _EMPTY and record != _DELETED:
+                j = self._insert_slot(old_slots[i])
+                slots[2 * j] = old_slots[i]
+                slots[2 * j + 1] = record
+
+        self._write_header()
+
+    # --------------------------------------------------------
+    # Probing
+    def _probe(self, key_tag, key_bytes, key_hash):
+        """
+        Returns the slot holding the key, or -1 if it is absent.
+        """
+        slots, mm = self._slots, self._mm
+        mask = self._slot_count - 1
+        perturb = key_hash
+        i = key_hash & mask
+
+        while True:
+            record = slots[2 * i + 1]
+            if record == _EMPTY:
+                return -1
+            if record != _DELETED and slots[2 * i] == key_hash:
+                key_len, _, tag, _ = _RECORD.unpack_from(mm, record)
+                start = record + _RECORD.size
+                if tag == key_tag and mm[start:start + key_len] == key_bytes:
+                    return i
+            perturb >>= _PERTURB_SHIFT
+            i = (5 * i + 1 + perturb) & mask
+
+    def _insert_slot(self, key_hash):
+        slots = self._slots
+        mask = self._slot_count - 1
+        perturb = key_hash
+        i = key_hash & mask
+
+        while True:
+            record = slots[2 * i + 1]
+            if record == _EMPTY or record == _DELETED:
+                return i
+            perturb >>= _PERTURB_SHIFT
+            i = (5 * i + 1 + perturb) & mask
+
+    def _record_value(self, record):
+        """
+        Returns (value_tag, memoryview of the value bytes) for a record.
+        """
+        key_len, value_len, _, value_tag = _RECORD.unpack_from(self._mm, record)
+        start = record + _RECORD.size + key_len
+        return value_tag, memoryview(self._mm)[start:start + value_len]
+
+    # --------------------------------------------------------
+    # Public API
+    def set_item(self, key, value):
+        """
+        Inserts a key-value pair, or updates the value if the key
+        already exists.
+
+        The new record is always appended to the heap; an update just
+        points the key's slot at it.
+        """
+        if self.readonly:
+            raise PermissionError("table is opened read-only")
+
+        key_tag, key_bytes = _encode_key(key)
+        value_tag, value_bytes = _encode_value(value)
+        key_hash = _key_hash(key_tag, key_bytes)
+
+        i = self._probe(key_tag, key_bytes, key_hash)
+        if i == -1 and self._filled + 1 > self._slot_count * self.max_load_factor:
+            self._grow_slots()
+
+        # Append the record before touching the slot array
+        size = _RECORD.size + len(key_bytes) + len(value_bytes)
+        record = self._reserve(size)
+        _RECORD.pack_into(self._mm, record, len(key_bytes), len(value_bytes), key_tag, value_tag)
+        start = record + _RECORD.size
+        self._mm[start:start + len(key_bytes)] = key_bytes
+        start += len(key_bytes)
+        self._mm[start:start + len(value_bytes)] = value_bytes
+
+        slots = self._slots
+        if i == -1:
+            i = self._insert_slot(key_hash)
+            if slots[2 * i + 1] == _EMPTY:
+                self._filled += 1
+            self._used += 1
+            slots[2 * i] = key_hash
+        slots[2 * i + 1] = record
+
+        self._write_header()
+
+    def get_item(self, key):
+        """
+        Retrieves the value associated with a given key.
+
+        Returns:
+        - Value if key exists
+        - None if key is not found
+        """
+        key_tag, key_bytes = _encode_key(key)
+        i = self._probe(key_tag, key_bytes, _key_hash(key_tag, key_bytes))
+        if i == -1:
+            return None
+
+        value_tag, view = self._record_value(self._slots[2 * i + 1])
+        try:
+            return _decode(value_tag, view)
+        finally:
+            view.release()
+
+    def get_view(self, key):
+        """
+        Returns a zero-copy memoryview of the stored value bytes
+        (pickled bytes for values that were not bytes or str), or
+        None if the key is not found.
+        """
+        key_tag, key_bytes = _encode_key(key)
+        i = self._probe(key_tag, key_bytes, _key_hash(key_tag, key_bytes))
+        if i == -1:
+            return None
+        return self._record_value(self._slots[2 * i + 1])[1]
+
+    def delete(self, key):
+        """
+        Removes a key. Its slot becomes a tombstone; the record stays
+        in the heap until the file is rewritten.
+        Returns True if the key was removed, False if not found.
+        """
+        if self.readonly:
+            raise PermissionError("table is opened read-only")
+
+        key_tag, key_bytes = _encode_key(key)
+        i = self._probe(key_tag, key_bytes, _key_hash(key_tag, key_bytes))
+        if i == -1:
+            return False
+
+        self._slots[2 * i + 1] = _DELETED
+        self._used -= 1
+        self._write_header()
+        return True
+
+    def keys(self):
+        """
+        Returns a list of all keys present in the hash table.
+        """
+        all_keys = []
+        mm = self._mm
+        slots = self._slots
+
+        for i in range(self._slot_count):
+            record = slots[2 * i + 1]
+            if record != _EMPTY and record != _DELETED:
+                key_len, _, tag, _ = _RECORD.unpack_from(mm, record)
+                start = record + _RECORD.size
+                all_keys.append(_decode(tag, mm[start:start + key_len]))
+
+        return all_keys
+
+    def __len__(self):
+        return self._used
+
+    def __contains__(self, key):
+        key_tag, key_bytes = _encode_key(key)
+        return self._probe(key_tag, key_bytes, _key_hash(key_tag, key_bytes)) != -1
+
+    def flush(self):
+        """
+        Writes dirty pages back to the file.
+        """
+        if not self.readonly:
+            self._mm.flush()
+
+    def close(self):
+        """
+        Flushes and unmaps the file. The table cannot be used afterwards.
+
+        A mapping that a get_view() memoryview still points into stays
+        mapped until that view is released; the file is closed either
+        way.
+        """
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+            self._slots.release()
+            for mm in [self._mm] + self._retired:
+                try:
+                    mm.close()
+                except BufferError:
+                    # A caller still holds a get_view() memoryview
+                    pass
+            self._retired = []
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
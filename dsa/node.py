@@ -0,0 +1,78 @@
+# ============================================================
+# Shared Node Types
+# ============================================================
+#
+# Every linked structure in dsa is built from these classes.
+# __slots__ gives each node a fixed set of fields instead of a
+# per-instance __dict__, which is most of the memory a node takes.
+# The flip side: no extra attributes can be set on a node.
+
+class SinglyNode:
+    """
+    Node of a singly linked list, stack or queue.
+    """
+    __slots__ = ("value", "next")
+
+    def __init__(self, value):
+        self.value = value   # stores the data
+        self.next = None     # pointer to the next node
+
+
+class DoublyNode:
+    """
+    Node of a doubly linked list.
+    """
+    __slots__ = ("value", "next", "prev")
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+        self.prev = None
+
+
+class TreeNode:
+    """
+    Node of a binary tree.
+    """
+    __slots__ = ("value", "left", "right", "size")
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None     # values < current node
+        self.right = None    # values > current node
+        self.size = 1        # nodes in this subtree (for rank / select)
+
+
+class AVLNode(TreeNode):
+    """
+    Node of an AVL tree: also stores the height of its subtree.
+    """
+    __slots__ = ("height",)
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.height = 1      # a leaf has height 1
+
+
+class RedBlackNode(TreeNode):
+    """
+    Node of a red-black tree: also stores its color.
+    """
+    __slots__ = ("red",)
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.red = True      # new nodes start red
+
+
+class SkipNode:
+    """
+    Node of a skip list: one forward link per level it is promoted to,
+    and how many positions each link jumps over.
+    """
+    __slots__ = ("value", "next", "span")
+
+    def __init__(self, value, level):
+        self.value = value
+        self.next = [None] * level
+        self.span = [0] * level
@@ -0,0 +1,343 @@
+# ============================================================
+# Hash Table Implementation (Open Addressing)
+# ============================================================
+#
+# Storage engine for large key sets. Instead of a list of buckets,
+# entries live in three flat parallel lists (hashes, keys, values)
+# and collisions are resolved by probing for the next free slot.
+# The table grows once it passes a configurable load factor and
+# moves old entries across a few slots at a time, so no single
+# set_item call pays for a full rehash.
+
+from .hashers import BuiltinHasher
+
+# Marks a slot that has never held an entry (ends a probe sequence)
+_EMPTY = object()
+
+# Marks a slot whose entry was deleted (probing continues past it)
+_DELETED = object()
+
+# Number of old slots migrated on every write while resizing
+_REHASH_STEP = 8
+
+# Bits of the hash mixed into the probe sequence on each step
+_PERTURB_SHIFT = 5
+
+
+class OpenAddressingHashTable:
+    def __init__(self, size=8, max_load_factor=0.66, hasher=None):
+        """
+        Initializes an empty table with at least `size` slots.
+
+        The slot count is rounded up to a power of two so that the
+        probe sequence can use a bit mask instead of a modulo.
+        max_load_factor is the fraction of slots (live entries plus
+        tombstones) allowed to be filled before the table grows.
+        hasher is any object from dsa.hashers; defaults to hash().
+        """
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+
+        self.max_load_factor = max_load_factor
+        self.hasher = hasher if hasher is not None else BuiltinHasher()
+        self._hash_key = self.hasher.hash
+
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+
+        # Active table: flat parallel arrays indexed by slot
+        self._hashes = [None] * capacity
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self._used = 0      # live entries
+        self._filled = 0    # live entries + tombstones
+
+        # Table being drained during an incremental resize
+        self._old = None
+        self._old_used = 0
+        self._migrate_pos = 0
+
+    # --------------------------------------------------------
+    # Probing
+    def _probe(self, hashes, keys, key, key_hash):
+        """
+        Returns the slot holding `key`, or -1 if it is absent.
+
+        Probe sequence is the same one CPython's dict uses:
+        i = 5*i + 1 + perturb, with perturb shifted right each step,
+        so every slot is eventually visited.
+        """
+        mask = len(keys) - 1
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+        i = key_hash & mask
+
+        while True:
+            slot_key = keys[i]
+            if slot_key is _EMPTY:
+                return -1
+            if slot_key is not _DELETED and hashes[i] == key_hash and (
+                slot_key is key or slot_key == key
+            ):
+                return i
+            perturb >>= _PERTURB_SHIFT
+            i = (5 * i + 1 + perturb) & mask
+
+    def _insert_slot(self, hashes, keys, key_hash):
+        """
+        Returns the first empty or deleted slot for `key_hash`.
+        Caller must already know the key is not in the table.
+        """
+        mask = len(keys) - 1
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+        i = key_hash & mask
+
+        while True:
+            slot_key = keys[i]
+            if slot_key is _EMPTY or slot_key is _DELETED:
+                return i
+            perturb >>= _PERTURB_SHIFT
+            i = (5 * i + 1 + perturb) & mask
+
+    # --------------------------------------------------------
+    # Resizing
+    def _start_resize(self):
+        """
+        Allocates a larger table and starts draining the current one.
+
+        Logic:
+        1. Finish any resize that is still in progress.
+        2. Size the new table for twice the live entries, so that
+           tombstones are dropped and there is room for the inserts
+           that happen while the old table is drained.
+        3. Keep the old arrays around; _rehash_step moves their
+           entries over a few slots per write.
+        """
+        if self._old is not None:
+            self._finish_resize()
+
+        capacity = 8
+        while capacity * self.max_load_factor <= self._used * 2:
+            capacity *= 2
+
+        self._old = (self._hashes, self._keys, self._values)
+        self._old_used = self._used
+        self._migrate_pos = 0
+
+        self._hashes = [None] * capacity
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self._used = 0
+        self._filled = 0
+
+    def _rehash_step(self, steps=_REHASH_STEP):
+        """
+        Moves up to `steps` slots from the old table into the new one.
+        """
+        old_hashes, old_keys, old_values = self._old
+        hashes, keys, values = self._hashes, self._keys, self._values
+        pos = self._migrate_pos
+        end = min(pos + steps, len(old_keys))
+
+        while pos < end:
+            key = old_keys[pos]
+            if key is not _EMPTY and key is not _DELETED:
+                key_hash = old_hashes[pos]
+                i = self._insert_slot(hashes, keys, key_hash)
+                hashes[i] = key_hash
+                keys[i] = key
+                values[i] = old_values[pos]
+                self._used += 1
+                self._filled += 1
+                self._old_used -= 1
+
+                # Leave a tombstone so stale copies are never found
+                old_keys[pos] = _DELETED
+                old_values[pos] = None
+            pos += 1
+
+        self._migrate_pos = pos
+        if pos == len(old_keys):
+            self._old = None
+            self._old_used = 0
+
+    def _finish_resize(self):
+        while self._old is not None:
+            self._rehash_step(len(self._old[1]))
+
+    # --------------------------------------------------------
+    # Public API
+    def _write_slot(self, key):
+        """
+        Returns (slot, found) for `key` in the active table.
+
+        If the key is absent a slot is claimed for it (growing the
+        table first if needed) and found is False. A key still in the
+        old table is moved over with its value, so found is True and
+        the caller can read the current value from the slot.
+        """
+        key_hash = self._hash_key(key)
+
+        if self._old is not None:
+            self._rehash_step()
+
+        hashes, keys = self._hashes, self._keys
+
+        # Case 1: Key already in the active table
+        i = self._probe(hashes, keys, key, key_hash)
+        if i != -1:
+            return i, True
+
+        # Case 2: Key still waiting in the old table -> take it out
+        found = False
+        value = None
+        if self._old is not None:
+            old_hashes, old_keys, old_values = self._old
+            j = self._probe(old_hashes, old_keys, key, key_hash)
+            if j != -1:
+                value = old_values[j]
+                old_keys[j] = _DELETED
+                old_values[j] = None
+                self._old_used -= 1
+                found = True
+
+        # Case 3: Claim a slot, growing first if the table is too full
+        if self._filled + 1 > len(keys) * self.max_load_factor:
+            self._start_resize()
+            self._rehash_step()
+            hashes, keys = self._hashes, self._keys
+
+        i = self._insert_slot(hashes, keys, key_hash)
+        if keys[i] is _EMPTY:
+            self._filled += 1
+        hashes[i] = key_hash
+        keys[i] = key
+        self._values[i] = value
+        self._used += 1
+        return i, found
+
+    def set_item(self, key, value):
+        """
+        Inserts a key-value pair, or updates the value if the key
+        already exists.
+        """
+        i, _ = self._write_slot(key)
+        self._values[i] = value
+
+    def increment(self, key, delta=1):
+        """
+        Adds delta to the value stored at key (missing keys start at 0)
+        with a single hash and probe. Returns the new value.
+        """
+        i, found = self._write_slot(key)
+        value = self._values[i] + delta if found else delta
+        self._values[i] = value
+        return value
+
+    def setdefault(self, key, default=None):
+        """
+        Returns the value for key, inserting default first if the key
+        is not present.
+        """
+        i, found = self._write_slot(key)
+        if not found:
+            self._values[i] = default
+        return self._values[i]
+
+    def get_item(self, key):
+        """
+        Retrieves the value associated with a given key.
+
+        Returns:
+        - Value if key exists
+        - None if key is not found
+        """
+        key_hash = self._hash_key(key)
+
+        i = self._probe(self._hashes, self._keys, key, key_hash)
+        if i != -1:
+            return self._values[i]
+
+        if self._old is not None:
+            old_hashes, old_keys, old_values = self._old
+            j = self._probe(old_hashes, old_keys, key, key_hash)
+            if j != -1:
+                return old_values[j]
+
+        return None
+
+    def delete(self, key):
+        """
+        Removes a key from the table.
+
+        The slot is marked with a tombstone rather than emptied so
+        that probe sequences passing through it keep working.
+        Returns True if the key was removed, False if not found.
+        """
+        key_hash = self._hash_key(key)
+
+        if self._old is not None:
+            self._rehash_step()
+
+        i = self._probe(self._hashes, self._keys, key, key_hash)
+        if i != -1:
+            self._keys[i] = _DELETED
+            self._hashes[i] = None
+            self._values[i] = None
+            self._used -= 1
+            return True
+
+        if self._old is not None:
+            old_hashes, old_keys, old_values = self._old
+            j = self._probe(old_hashes, old_keys, key, key_hash)
+            if j != -1:
+                old_keys[j] = _DELETED
+                old_hashes[j] = None
+                old_values[j] = None
+                self._old_used -= 1
+                return True
+
+        return False
+
+    def keys(self):
+        """
+        Returns a list of all keys present in the hash table.
+        """
+        all_keys = [
+            key for key in self._keys
+            if key is not _EMPTY and key is not _DELETED
+        ]
+
+        if self._old is not None:
+            all_keys.extend(
+                key for key in self._old[1]
+                if key is not _EMPTY and key is not _DELETED
+            )
+
+        return all_keys
+
+    def __len__(self):
+        return self._used + self._old_used
+
+    def __contains__(self, key):
+        key_hash = self._hash_key(key)
+
+        if self._probe(self._hashes, self._keys, key, key_hash) != -1:
+            return True
+
+        if self._old is not None:
+            old_hashes, old_keys, _ = self._old
+            return self._probe(old_hashes, old_keys, key, key_hash) != -1
+
+        return False
+
+    def print_table(self):
+        """
+        Prints every occupied slot of the active table.
+        Useful for debugging and visualization.
+        """
+        for index, key in enumerate(self._keys):
+            if key is _DELETED:
+                print(index, ": <deleted>")
+            elif key is not _EMPTY:
+                print(index, ":", [key, self._values[index]])
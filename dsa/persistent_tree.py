@@ -0,0 +1,261 @@
+# ============================================================
+# Persistent (Path-Copying) Binary Search Tree
+# ============================================================
+#
+# PersistentTree is an immutable version of a BST. insert and delete
+# never touch an existing node; they copy the nodes on the path from
+# the root to the change and return a new tree that shares every
+# other node with the old one:
+#
+#   old:      8                new:      8'
+#            / \                        /  \
+#           4   12      insert 5       4'   12   <- shared
+#          / \                        /  \
+#         2   6                      2    6'     <- 2 shared
+#                                        /
+#                                       5
+#
+# Each version costs O(log n) new nodes, and any version that is
+# still referenced stays valid forever. The tree is kept AVL-balanced
+# (rebalancing also builds new nodes) so paths stay O(log n) even on
+# sorted input.
+#
+# ConcurrentTree publishes versions to threads: readers grab the
+# current version with one attribute read and search it without any
+# lock; writers build the next version under a writer-only lock and
+# publish it with one attribute assignment (atomic in CPython), so a
+# reader sees either the old version or the new one, never a mix.
+
+import threading
+
+from .node import AVLNode as Node
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _node(value, left, right):
+    """
+    Creates a new node over existing (shared) subtrees.
+    """
+    node = Node(value)
+    node.left = left
+    node.right = right
+    node.size = _size(left) + _size(right) + 1
+    node.height = max(_height(left), _height(right)) + 1
+    return node
+
+
+def _balanced(value, left, right):
+    """
+    Like _node, but rotates (by building new nodes) when the two
+    subtree heights differ by 2.
+    """
+    left_height = _height(left)
+    right_height = _height(right)
+
+    # Left-heavy
+    if left_height > right_height + 1:
+        if _height(left.left) < _height(left.right):
+            inner = left.right
+            return _node(inner.value,
+                         _node(left.value, left.left, inner.left),
+                         _node(value, inner.right, right))
+        return _node(left.value, left.left, _node(value, left.right, right))
+
+    # Right-heavy
+    if right_height > left_height + 1:
+        if _height(right.right) < _height(right.left):
+            inner = right.left
+            return _node(inner.value,
+                         _node(value, left, inner.left),
+                         _node(right.value, inner.right, right.right))
+        return _node(right.value, _node(value, left, right.left), right.right)
+
+    return _node(value, left, right)
+
+
+def _rebuild(path, subtree):
+    """
+    Copies the recorded path bottom-up on top of a new subtree.
+    path holds (node, went_left) pairs from the root down.
+    """
+    for node, went_left in reversed(path):
+        if went_left:
+            subtree = _balanced(node.value, subtree, node.right)
+        else:
+            subtree = _balanced(node.value, node.left, subtree)
+    return subtree
+
+
+# ============================================================
+# PersistentTree (one immutable version)
+# ============================================================
+
+class PersistentTree:
+    __slots__ = ("root",)
+
+    def __init__(self, root=None):
+        # Never modified after construction
+        self.root = root
+
+    # --------------------------------------------------------
+    # Insert (returns a new version)
+    def insert(self, value):
+        """
+        Returns a tree that also contains value. Returns this same
+        tree if value is already present.
+        """
+        path = []
+        temp = self.root
+
+        while temp is not None:
+            # Duplicate value check
+            if value == temp.value:
+                return self
+            went_left = value < temp.value
+            path.append((temp, went_left))
+            temp = temp.left if went_left else temp.right
+
+        return PersistentTree(_rebuild(path, _node(value, None, None)))
+
+    # --------------------------------------------------------
+    # Delete (returns a new version)
+    def delete(self, value):
+        """
+        Returns a tree without value. Returns this same tree if value
+        is not present.
+        """
+        path = []
+        temp = self.root
+
+        while temp is not None and value != temp.value:
+            went_left = value < temp.value
+            path.append((temp, went_left))
+            temp = temp.left if went_left else temp.right
+
+        # Case 1: Value not in the tree
+        if temp is None:
+            return self
+
+        # Case 2: At most one child -> the child takes its place
+        if temp.left is None or temp.right is None:
+            subtree = temp.left if temp.left is not None else temp.right
+
+        # Case 3: Two children -> the successor (minimum of the right
+        # subtree) moves up, and the right subtree is copied without it
+        else:
+            right_path = []
+            successor = temp.right
+            while successor.left is not None:
+                right_path.append((successor, True))
+                successor = successor.left
+            right = _rebuild(right_path, successor.right)
+            subtree = _balanced(successor.value, temp.left, right)
+
+        return PersistentTree(_rebuild(path, subtree))
+
+    # --------------------------------------------------------
+    # Reads (safe from any thread, no locking)
+    def contains(self, value):
+        temp = self.root
+        while temp is not None:
+            if value < temp.value:
+                temp = temp.left
+            elif value > temp.value:
+                temp = temp.right
+            else:
+                return True
+        return False
+
+    def min(self):
+        temp = self.root
+        if temp is None:
+            return None
+        while temp.left is not None:
+            temp = temp.left
+        return temp.value
+
+    def max(self):
+        temp = self.root
+        if temp is None:
+            return None
+        while temp.right is not None:
+            temp = temp.right
+        return temp.value
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def __iter__(self):
+        # In-order (ascending) with an explicit stack
+        stack = []
+        temp = self.root
+        while stack or temp is not None:
+            while temp is not None:
+                stack.append(temp)
+                temp = temp.left
+            temp = stack.pop()
+            yield temp.value
+            temp = temp.right
+
+
+# ============================================================
+# ConcurrentTree (publishes versions to reader threads)
+# ============================================================
+
+class ConcurrentTree:
+    def __init__(self):
+        self._current = PersistentTree()
+
+        # Only writers take this; readers never lock
+        self._write_lock = threading.Lock()
+
+    def snapshot(self):
+        """
+        Returns the current version. It never changes, so a reader
+        can run any number of queries on it for a consistent view.
+        """
+        return self._current
+
+    # --------------------------------------------------------
+    # Writers: build the next version, then swap it in
+    def insert(self, value):
+        """
+        Returns True if value was added, False if already present.
+        """
+        with self._write_lock:
+            current = self._current
+            updated = current.insert(value)
+            if updated is current:
+                return False
+            self._current = updated
+            return True
+
+    def delete(self, value):
+        """
+        Returns True if value was removed, False if not present.
+        """
+        with self._write_lock:
+            current = self._current
+            updated = current.delete(value)
+            if updated is current:
+                return False
+            self._current = updated
+            return True
+
+    # --------------------------------------------------------
+    # Readers
+    def contains(self, value):
+        return self._current.contains(value)
+
+    def __len__(self):
+        return len(self._current)
@@ -0,0 +1,253 @@
+# ============================================================
+# Ring-Buffer Queue (bounded, preallocated)
+# ============================================================
+#
+# Same enqueue / dequeue names as Queue, but values live in one
+# preallocated list used as a circular buffer instead of one Node per
+# value:
+#
+#   buffer:  [ c | d | . | . | a | b ]      head = 4, length = 4
+#                          ^ tail   ^ head
+#
+# element i is at (head + i) % capacity. Nothing is allocated per
+# enqueue, and dequeue returns the value itself (its slot is cleared so
+# the queue holds no stale references).
+#
+# enqueue_many / dequeue_many move a whole batch with at most two slice
+# copies (one on each side of the wrap point).
+#
+# on_full decides what happens when a value does not fit:
+#   "grow"         double the buffer (default)
+#   "raise"        raise queue.Full; nothing is enqueued
+#   "drop_oldest"  discard values from the front to make room
+#   "block"        wait until a consumer thread dequeues; every
+#                  operation then takes an internal lock
+
+import threading
+import time
+from queue import Full
+
+ON_FULL_POLICIES = ("grow", "raise", "drop_oldest", "block")
+
+
+class RingQueue:
+    def __init__(self, capacity=16, on_full="grow"):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if on_full not in ON_FULL_POLICIES:
+            raise ValueError(f"on_full must be one of {ON_FULL_POLICIES}")
+
+        self._buffer = [None] * capacity
+        self._head = 0          # index of the first (oldest) value
+        self.length = 0
+        self.on_full = on_full
+
+        # Values discarded by the "drop_oldest" policy
+        self.dropped = 0
+
+        # Only the "block" policy is meant to be shared between threads
+        if on_full == "block":
+            self._lock = threading.Lock()
+            self._not_full = threading.Condition(self._lock)
+        else:
+            self._lock = None
+
+    @property
+    def capacity(self):
+        return len(self._buffer)
+
+    # --------------------------------------------------------
+    # Buffer helpers (no locking)
+    def _write(self, values):
+        """
+        Copies values in after the last element. The caller makes sure
+        they fit.
+        """
+        buffer = self._buffer
+        capacity = len(buffer)
+        n = len(values)
+
+        start = (self._head + self.length) % capacity
+        first = min(n, capacity - start)
+        buffer[start:start + first] = values[:first]
+        if first < n:
+            buffer[:n - first] = values[first:]
+
+        self.length += n
+
+    def _read(self, n):
+        """
+        Removes and returns the first n values (n <= length).
+        """
+        buffer = self._buffer
+        capacity = len(buffer)
+        head = self._head
+
+        first = min(n, capacity - head)
+        values = buffer[head:head + first]
+        buffer[head:head + first] = [None] * first
+        if first < n:
+            values += buffer[:n - first]
+            buffer[:n - first] = [None] * (n - first)
+
+        self._head = (head + n) % capacity
+        self.length -= n
+        return values
+
+    def _resize(self, capacity):
+        values = self._read(self.length)
+        self._buffer = values + [None] * (capacity - len(values))
+        self._head = 0
+        self.length = len(values)
+
+    def _make_room(self, n):
+        """
+        Frees space for n more values (n <= capacity for drop_oldest)
+        using the grow / raise / drop_oldest policy.
+        """
+        capacity = len(self._buffer)
+
+        if self.on_full == "grow":
+            new_capacity = capacity * 2
+            while new_capacity < self.length + n:
+                new_capacity *= 2
+            self._resize(new_capacity)
+        elif self.on_full == "raise":
+            raise Full(f"queue is full (capacity {capacity})")
+        else:
+            excess = self.length + n - capacity
+            self._read(excess)
+            self.dropped += excess
+
+    # --------------------------------------------------------
+    # Print all values, front to back
+    def print_queue(self):
+        for value in self:
+            print(value)
+
+    # --------------------------------------------------------
+    # Enqueue (add at the back)
+    def enqueue(self, value, timeout=None):
+        """
+        Adds value at the back. Returns True.
+
+        timeout (seconds) only applies to the "block" policy: if the
+        queue is still full when it runs out, queue.Full is raised.
+        """
+        if self._lock is not None:
+            return self._put_blocking([value], timeout)
+
+        buffer = self._buffer
+        capacity = len(buffer)
+        if self.length == capacity:
+            self._make_room(1)
+            buffer = self._buffer
+            capacity = len(buffer)
+
+        i = self._head + self.length
+        if i >= capacity:
+            i -= capacity
+        buffer[i] = value
+        self.length += 1
+        return True
+
+    # --------------------------------------------------------
+    # Dequeue (remove from the front)
+    def dequeue(self):
+        """
+        Removes and returns the front value, or None if empty.
+        """
+        if self._lock is not None:
+            with self._lock:
+                if self.length == 0:
+                    return None
+                value = self._read(1)[0]
+                self._not_full.notify()
+                return value
+
+        if self.length == 0:
+            return None
+
+        buffer = self._buffer
+        head = self._head
+        value = buffer[head]
+        buffer[head] = None
+
+        head += 1
+        self._head = 0 if head == len(buffer) else head
+        self.length -= 1
+        return value
+
+    # --------------------------------------------------------
+    # Batch operations
+    def enqueue_many(self, values, timeout=None):
+        """
+        Adds every value in order, copying them in as slices.
+        Returns True.
+
+        Under "raise" nothing is added unless all values fit. Under
+        "drop_oldest" a batch longer than the capacity keeps only its
+        last capacity values. Under "block", values that fit are
+        added as space frees up; if timeout runs out, queue.Full is
+        raised and the values already added stay queued.
+        """
+        values = list(values)
+
+        if self._lock is not None:
+            return self._put_blocking(values, timeout)
+
+        n = len(values)
+        capacity = len(self._buffer)
+
+        if n > capacity - self.length:
+            if self.on_full == "drop_oldest" and n > capacity:
+                self.dropped += n - capacity
+                values = values[n - capacity:]
+                n = capacity
+            self._make_room(n)
+
+        self._write(values)
+        return True
+
+    def dequeue_many(self, n=None):
+        """
+        Removes and returns up to n values from the front as a list
+        (all of them if n is None).
+        """
+        if self._lock is not None:
+            with self._lock:
+                values = self._read(self.length if n is None else min(n, self.length))
+                if values:
+                    self._not_full.notify_all()
+                return values
+
+        return self._read(self.length if n is None else min(n, self.length))
+
+    def _put_blocking(self, values, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        capacity = len(self._buffer)
+        pos = 0
+
+        with self._not_full:
+            while pos < len(values):
+                while self.length == capacity:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise Full(f"queue is full (capacity {capacity})")
+                    self._not_full.wait(remaining)
+
+                count = min(len(values) - pos, capacity - self.length)
+                self._write(values[pos:pos + count])
+                pos += count
+
+        return True
+
+    # --------------------------------------------------------
+    # Python protocol
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        buffer, head, capacity = self._buffer, self._head, len(self._buffer)
+        for i in range(self.length):
+            yield buffer[(head + i) % capacity]
@@ -0,0 +1,418 @@
+# ============================================================
+# Shared-Memory Ring Queues (between processes)
+# ============================================================
+#
+# A fixed-size ring of slots in one multiprocessing.shared_memory
+# block, so messages move between processes without a pipe:
+#
+#   [ header | head cursor | tail cursor | slot 0 | slot 1 | ... ]
+#
+# - cursors are ever-increasing uint64 counters; message k lives in
+#   slot k % capacity. The queue is empty when head == tail and full
+#   when tail - head == capacity. Each cursor sits on its own 64-byte
+#   line so producer and consumer do not write the same cache line.
+# - a slot is (length, kind) followed by up to slot_size - 8 bytes of
+#   payload.
+#
+# Payloads:
+#   bytes-like  -> copied straight into the slot (no pickling); any
+#                  buffer (bytearray, memoryview, array, ...) comes
+#                  back out as bytes
+#   any object  -> pickled into the slot (a slot only holds bytes, so
+#                  objects without a buffer are always pickled)
+#   too big     -> written to a separate SharedMemory block; the slot
+#                  holds its name and the consumer unlinks it
+#
+# SPSCQueue: one producer process, one consumer process, no locks.
+# Each side only writes its own cursor, and the payload is written
+# before the tail cursor is bumped. This relies on stores becoming
+# visible in program order, which x86-64 guarantees; on weaker memory
+# models use MPMCQueue.
+#
+# MPMCQueue: any number of producers and consumers, with one
+# multiprocessing lock per end (like ConcurrentQueue).
+#
+# Share a queue with a child process by passing it in the Process
+# args; the child attaches to the same block by name. The creating
+# process calls unlink() once everyone is done.
+
+import multiprocessing
+import pickle
+import struct
+import time
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Full
+
+_MAGIC = b"DSARING1"
+
+# magic, capacity, slot_size
+_HEADER = struct.Struct("<8sQQ")
+
+# Cursor positions as uint64 word indexes (byte offsets 64 and 128)
+_HEAD = 8
+_TAIL = 16
+_DATA_OFFSET = 192
+
+# length, kind (padded to 8 bytes)
+_SLOT = struct.Struct("<IB3x")
+
+# Payload kinds
+_RAW = 0
+_PICKLE = 1
+_OVERFLOW = 2           # flag added to _RAW / _PICKLE
+
+# length of the overflow block, followed by its name
+_OVERFLOW_REF = struct.Struct("<Q")
+
+# Longest sleep between checks while waiting on a full / empty queue
+_MAX_BACKOFF = 0.001
+
+
+def _encode(obj):
+    if isinstance(obj, (bytes, bytearray)):
+        return _RAW, obj
+
+    # Anything else with a buffer (memoryview, array, mmap, ...) is
+    # sent as its raw bytes (strided views are copied out first)
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return _PICKLE, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    if view.c_contiguous:
+        return _RAW, view.cast("B")
+    return _RAW, view.tobytes()
+
+
+def _decode(kind, data):
+    if kind == _PICKLE:
+        return pickle.loads(data)
+    return bytes(data)
+
+
+def _backoff(delay, deadline):
+    """
+    Sleeps for delay (capped at the deadline) and returns the next
+    delay, or returns None once the deadline has passed.
+    """
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        delay = min(delay, remaining)
+    time.sleep(delay)
+    return min(delay * 2, _MAX_BACKOFF) if delay else 1e-6
+
+
+class SPSCQueue:
+    def __init__(self, capacity=1024, slot_size=256, name=None, create=True):
+        """
+        Creates a new queue (create=True) or attaches to an existing
+        one by name (create=False; capacity and slot_size are then
+        read from the block).
+        """
+        if create:
+            if capacity < 1:
+                raise ValueError("capacity must be at least 1")
+            if slot_size < _SLOT.size + _OVERFLOW_REF.size + 32:
+                raise ValueError("slot_size is too small")
+
+            self._shm = SharedMemory(name=name, create=True,
+                                     size=_DATA_OFFSET + capacity * slot_size)
+            self._shm.buf[:_DATA_OFFSET] = bytes(_DATA_OFFSET)
+            _HEADER.pack_into(self._shm.buf, 0, _MAGIC, capacity, slot_size)
+        else:
+            self._shm = SharedMemory(name=name)
+
+        self._owner = create
+        self._bind()
+
+    def _bind(self):
+        buf = self._shm.buf
+        magic, capacity, slot_size = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self._shm.name!r} is not a ring queue")
+
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self._payload_max = slot_size - _SLOT.size
+        self._buf = buf
+        self._words = buf[:_DATA_OFFSET].cast("Q")
+
+        # Each side caches the cursor it owns, and the last value it
+        # saw of the other side's (only re-read when the ring looks
+        # full / empty)
+        self._tail = self._words[_TAIL]
+        self._head = self._words[_HEAD]
+        self._seen_head = self._head
+        self._seen_tail = self._tail
+
+        # Slot still lent out by dequeue(copy=False)
+        self._lent = False
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    # --------------------------------------------------------
+    # Pickling: attach to the same block in the other process
+    def __getstate__(self):
+        return {"name": self._shm.name}
+
+    def __setstate__(self, state):
+        self._shm = SharedMemory(name=state["name"])
+        self._owner = False
+        self._bind()
+
+    # --------------------------------------------------------
+    # Slot helpers
+    def _pack(self, obj):
+        """
+        Returns (kind, payload) ready to be copied into a slot.
+        """
+        kind, data = _encode(obj)
+        size = data.nbytes if isinstance(data, memoryview) else len(data)
+        if size <= self._payload_max:
+            return kind, data
+
+        block = SharedMemory(create=True, size=max(size, 1))
+        block.buf[:size] = data
+        ref = _OVERFLOW_REF.pack(size) + block.name.encode()
+        block.close()
+        return kind | _OVERFLOW, ref
+
+    @staticmethod
+    def _discard(kind, payload):
+        # An overflow block that was never enqueued
+        if kind & _OVERFLOW:
+            block = SharedMemory(name=bytes(payload[_OVERFLOW_REF.size:]).decode())
+            block.close()
+            block.unlink()
+
+    def _write_slot(self, position, kind, payload):
+        offset = _DATA_OFFSET + (position % self.capacity) * self.slot_size
+        size = payload.nbytes if isinstance(payload, memoryview) else len(payload)
+        start = offset + _SLOT.size
+        self._buf[start:start + size] = payload
+        _SLOT.pack_into(self._buf, offset, size, kind)
+
+    def _slot_view(self, position):
+        """
+        Returns (kind, memoryview of the payload) for a slot.
+        """
+        offset = _DATA_OFFSET + (position % self.capacity) * self.slot_size
+        size, kind = _SLOT.unpack_from(self._buf, offset)
+        start = offset + _SLOT.size
+        return kind, self._buf[start:start + size]
+
+    def _read_slot(self, position):
+        kind, view = self._slot_view(position)
+        try:
+            if kind & _OVERFLOW:
+                size = _OVERFLOW_REF.unpack_from(view, 0)[0]
+                block = SharedMemory(name=bytes(view[_OVERFLOW_REF.size:]).decode())
+                try:
+                    return _decode(kind & ~_OVERFLOW, block.buf[:size])
+                finally:
+                    block.close()
+                    block.unlink()
+            return _decode(kind, view)
+        finally:
+            view.release()
+
+    def _release_lent(self):
+        if self._lent:
+            self._lent = False
+            self._head += 1
+            self._words[_HEAD] = self._head
+
+    # --------------------------------------------------------
+    # Enqueue (producer side)
+    def enqueue(self, obj, timeout=None):
+        """
+        Adds obj at the back. Waits while the ring is full; raises
+        queue.Full if timeout (seconds) runs out first.
+        """
+        kind, payload = self._pack(obj)
+        tail = self._tail
+
+        if tail - self._seen_head >= self.capacity:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            delay = 0
+            while True:
+                self._seen_head = self._words[_HEAD]
+                if tail - self._seen_head < self.capacity:
+                    break
+                delay = _backoff(delay, deadline)
+                if delay is None:
+                    self._discard(kind, payload)
+                    raise Full
+
+        # Payload first, then publish it by moving the tail
+        self._write_slot(tail, kind, payload)
+        self._tail = tail + 1
+        self._words[_TAIL] = tail + 1
+        return True
+
+    # --------------------------------------------------------
+    # Dequeue (consumer side)
+    def dequeue(self, timeout=None, copy=True):
+        """
+        Removes and returns the front message. Waits while the ring
+        is empty; raises queue.Empty if timeout runs out first.
+
+        Bytes payloads come back as bytes. With copy=False they come
+        back as a memoryview straight into the slot instead; the slot
+        stays reserved (and the view valid) until the next dequeue or
+        release() call.
+        """
+        self._release_lent()
+        head = self._head
+
+        if head == self._seen_tail:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            delay = 0
+            while True:
+                self._seen_tail = self._words[_TAIL]
+                if head != self._seen_tail:
+                    break
+                delay = _backoff(delay, deadline)
+                if delay is None:
+                    raise Empty
+
+        if not copy:
+            kind, view = self._slot_view(head)
+            if kind == _RAW:
+                self._lent = True
+                return view
+            view.release()
+
+        value = self._read_slot(head)
+        self._head = head + 1
+        self._words[_HEAD] = head + 1
+        return value
+
+    def release(self):
+        """
+        Frees the slot lent out by dequeue(copy=False).
+        """
+        self._release_lent()
+
+    # --------------------------------------------------------
+    # Housekeeping
+    def __len__(self):
+        # A snapshot: the other side may change it right away
+        return self._words[_TAIL] - self._words[_HEAD]
+
+    def close(self):
+        """
+        Detaches this process from the block (views must be released).
+        """
+        if self._shm is None:
+            return
+        self._release_lent()
+        self._words.release()
+        self._buf = None
+        self._shm.close()
+        self._shm = None
+
+    def unlink(self):
+        """
+        Destroys the block. Call once, from the creating process,
+        after every process has stopped using the queue.
+        """
+        shm = self._shm
+        self.close()
+        shm.unlink()
+
+    def __del__(self):
+        # Release our views first so SharedMemory can close its mapping
+        try:
+            self.close()
+        except (AttributeError, BufferError):
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+
+class MPMCQueue(SPSCQueue):
+    """
+    Ring queue safe for many producers and many consumers.
+
+    Producers serialize on one lock and consumers on another; cursors
+    are always read from shared memory. dequeue(copy=False) is not
+    supported, since a lent slot would block every other consumer.
+    """
+
+    def __init__(self, capacity=1024, slot_size=256, name=None, create=True,
+                 locks=None, ctx=None):
+        """
+        locks is the (producer_lock, consumer_lock) pair of the queue
+        being attached to; it is filled in automatically when the
+        queue is passed to a child process.
+
+        ctx is the multiprocessing context the child processes will be
+        started from (e.g. get_context("spawn")); the locks must come
+        from the same context. None means the default context.
+        """
+        super().__init__(capacity, slot_size, name, create)
+        if locks is None:
+            if not create:
+                raise ValueError("attaching an MPMCQueue by name needs its locks")
+            ctx = ctx or multiprocessing
+            locks = (ctx.Lock(), ctx.Lock())
+        self._put_lock, self._get_lock = locks
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["locks"] = (self._put_lock, self._get_lock)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._put_lock, self._get_lock = state["locks"]
+
+    def enqueue(self, obj, timeout=None):
+        kind, payload = self._pack(obj)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        words = self._words
+        delay = 0
+
+        while True:
+            with self._put_lock:
+                tail = words[_TAIL]
+                if tail - words[_HEAD] < self.capacity:
+                    self._write_slot(tail, kind, payload)
+                    words[_TAIL] = tail + 1
+                    return True
+
+            delay = _backoff(delay, deadline)
+            if delay is None:
+                self._discard(kind, payload)
+                raise Full
+
+    def dequeue(self, timeout=None, copy=True):
+        if not copy:
+            raise ValueError("MPMCQueue always copies payloads out")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        words = self._words
+        delay = 0
+
+        while True:
+            with self._get_lock:
+                head = words[_HEAD]
+                if head != words[_TAIL]:
+                    value = self._read_slot(head)
+                    words[_HEAD] = head + 1
+                    return value
+
+            delay = _backoff(delay, deadline)
+            if delay is None:
+                raise Empty
@@ -0,0 +1,329 @@
+# ============================================================
+# Indexable Skip List (O(log n) positional LinkedList)
+# ============================================================
+#
+# Same method names as LinkedList, but every node also sits on a
+# random number of "express lanes" above the base list. Each link
+# records its span: how many positions it jumps over.
+#
+#   level 2:  head ---------------4---------------> 40
+#   level 1:  head ------2------> 20 ------2------> 40
+#   level 0:  head -1-> 10 -1-> 20 -1-> 30 -1-> 40
+#
+# To reach index i, move right on the highest level while the spans
+# add up to no more than i + 1, then drop a level. Expected cost is
+# O(log n) for get, set_value, insert and remove (and so for the end
+# operations too). A link that runs off the end has span
+# length - position, which keeps the span bookkeeping uniform.
+#
+# SortedSkipList keeps its values in sorted order and adds
+# insert_sorted and bisect.
+#
+# Like ChunkedList, pop, pop_first, get and remove return values.
+
+import random
+
+from .node import SkipNode as Node
+
+MAX_LEVEL = 32
+
+_NO_VALUE = object()
+
+
+def _random_level():
+    # Promote to each next level with probability 1/4
+    level = 1
+    while level < MAX_LEVEL and random.getrandbits(2) == 0:
+        level += 1
+    return level
+
+
+class SkipList:
+    def __init__(self, value=_NO_VALUE):
+        self._head = Node(None, MAX_LEVEL)
+        self._levels = 1        # levels currently in use
+        self.length = 0
+
+        if value is not _NO_VALUE:
+            self._rebuild([value])
+
+    # --------------------------------------------------------
+    # Search helpers
+    def _path(self, index):
+        """
+        Finds the last node before position index on every level.
+
+        Returns (update, ranks): update[lvl] is that node and
+        ranks[lvl] its position (head = 0, element i = i + 1).
+        """
+        update = [None] * self._levels
+        ranks = [0] * self._levels
+        node, pos = self._head, 0
+
+        for lvl in range(self._levels - 1, -1, -1):
+            nxt = node.next[lvl]
+            while nxt is not None and pos + node.span[lvl] <= index:
+                pos += node.span[lvl]
+                node = nxt
+                nxt = node.next[lvl]
+            update[lvl] = node
+            ranks[lvl] = pos
+
+        return update, ranks
+
+    def _node_at(self, index):
+        node, pos = self._head, 0
+        target = index + 1
+
+        for lvl in range(self._levels - 1, -1, -1):
+            nxt = node.next[lvl]
+            while nxt is not None and pos + node.span[lvl] <= target:
+                pos += node.span[lvl]
+                node = nxt
+                if pos == target:
+                    return node
+                nxt = node.next[lvl]
+
+        return node
+
+    def _link(self, update, ranks, value):
+        """
+        Inserts value right after update[0] (at position ranks[0] + 1).
+        """
+        level = _random_level()
+        head = self._head
+
+        if level > self._levels:
+            for lvl in range(self._levels, level):
+                update.append(head)
+                ranks.append(0)
+                head.next[lvl] = None
+                head.span[lvl] = self.length
+            self._levels = level
+
+        node = Node(value, level)
+        rank = ranks[0]
+
+        for lvl in range(level):
+            prev = update[lvl]
+            node.next[lvl] = prev.next[lvl]
+            prev.next[lvl] = node
+            node.span[lvl] = prev.span[lvl] - (rank - ranks[lvl])
+            prev.span[lvl] = rank - ranks[lvl] + 1
+
+        # Links passing over the new node now jump one more position
+        for lvl in range(level, self._levels):
+            update[lvl].span[lvl] += 1
+
+        self.length += 1
+        return node
+
+    def _unlink(self, update):
+        """
+        Removes the node right after update[0] and returns its value.
+        """
+        node = update[0].next[0]
+
+        for lvl in range(self._levels):
+            prev = update[lvl]
+            if prev.next[lvl] is node:
+                prev.span[lvl] += node.span[lvl] - 1
+                prev.next[lvl] = node.next[lvl]
+            else:
+                prev.span[lvl] -= 1
+
+        while self._levels > 1 and self._head.next[self._levels - 1] is None:
+            self._levels -= 1
+
+        self.length -= 1
+        return node.value
+
+    def _rebuild(self, values):
+        """
+        Replaces the contents with values in one left-to-right pass.
+        """
+        head = self._head
+        head.next = [None] * MAX_LEVEL
+        head.span = [0] * MAX_LEVEL
+
+        last = [head] * MAX_LEVEL
+        last_pos = [0] * MAX_LEVEL
+        levels = 1
+        pos = 0
+
+        for value in values:
+            pos += 1
+            level = _random_level()
+            node = Node(value, level)
+            for lvl in range(level):
+                last[lvl].next[lvl] = node
+                last[lvl].span[lvl] = pos - last_pos[lvl]
+                last[lvl] = node
+                last_pos[lvl] = pos
+            if level > levels:
+                levels = level
+
+        # Links that run off the end span to the end
+        for lvl in range(levels):
+            last[lvl].span[lvl] = pos - last_pos[lvl]
+
+        self._levels = levels
+        self.length = pos
+
+    # --------------------------------------------------------
+    # Print all values in the list
+    def print_list(self):
+        for value in self:
+            print(value)
+
+    # --------------------------------------------------------
+    # Add value at the end
+    def append(self, value):
+        return self.insert(self.length, value)
+
+    # --------------------------------------------------------
+    # Add value at the beginning
+    def prepend(self, value):
+        return self.insert(0, value)
+
+    # --------------------------------------------------------
+    # Remove last value (pop)
+    def pop(self):
+        if self.length == 0:
+            return None
+        return self.remove(self.length - 1)
+
+    # --------------------------------------------------------
+    # Remove first value
+    def pop_first(self):
+        if self.length == 0:
+            return None
+        return self.remove(0)
+
+    # --------------------------------------------------------
+    # Get value at specific index
+    def get(self, index):
+        if index < 0 or index >= self.length:
+            return None
+        return self._node_at(index).value
+
+    # --------------------------------------------------------
+    # Update value at specific index
+    def set_value(self, index, value):
+        if index < 0 or index >= self.length:
+            return False
+        self._node_at(index).value = value
+        return True
+
+    # --------------------------------------------------------
+    # Insert value at specific index
+    def insert(self, index, value):
+        if index < 0 or index > self.length:
+            return False
+
+        update, ranks = self._path(index)
+        self._link(update, ranks, value)
+        return True
+
+    # --------------------------------------------------------
+    # Remove value at specific index
+    def remove(self, index):
+        if index < 0 or index >= self.length:
+            return None
+
+        update, _ = self._path(index)
+        return self._unlink(update)
+
+    # --------------------------------------------------------
+    # Reverse the list (rebuilds the towers in O(n))
+    def reverse(self):
+        self._rebuild(list(self)[::-1])
+
+    # --------------------------------------------------------
+    # Python protocol
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        node = self._head.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+
+# ============================================================
+# Sorted mode: values kept in order, found by value
+# ============================================================
+
+class SortedSkipList(SkipList):
+    """
+    Skip list whose values are always in ascending order.
+
+    Positional reads (get, pop, pop_first, remove) still work, but
+    writes go through insert_sorted so the order cannot be broken;
+    append, prepend, insert, set_value and reverse raise TypeError.
+    """
+
+    def _value_path(self, value, right):
+        """
+        Like _path, but stops before the first value > value (right)
+        or >= value (not right). ranks[0] is then the bisect index.
+        """
+        update = [None] * self._levels
+        ranks = [0] * self._levels
+        node, pos = self._head, 0
+
+        for lvl in range(self._levels - 1, -1, -1):
+            nxt = node.next[lvl]
+            while nxt is not None and (nxt.value <= value if right else nxt.value < value):
+                pos += node.span[lvl]
+                node = nxt
+                nxt = node.next[lvl]
+            update[lvl] = node
+            ranks[lvl] = pos
+
+        return update, ranks
+
+    def insert_sorted(self, value):
+        """
+        Inserts value after any equal values. Returns its index.
+        """
+        update, ranks = self._value_path(value, right=True)
+        self._link(update, ranks, value)
+        return ranks[0]
+
+    def bisect(self, value):
+        """
+        Returns the index where value would be inserted to keep the
+        list sorted, after any equal values (like bisect.bisect_right).
+        """
+        return self._value_path(value, right=True)[1][0]
+
+    def bisect_left(self, value):
+        """
+        Same as bisect, but before any equal values.
+        """
+        return self._value_path(value, right=False)[1][0]
+
+    def remove_value(self, value):
+        """
+        Removes the first occurrence of value.
+        Returns True if it was removed, False if not found.
+        """
+        update, _ = self._value_path(value, right=False)
+        node = update[0].next[0]
+        if node is None or node.value != value:
+            return False
+        self._unlink(update)
+        return True
+
+    def __contains__(self, value):
+        node = self._value_path(value, right=False)[0][0].next[0]
+        return node is not None and node.value == value
+
+    # --------------------------------------------------------
+    # Positional writes would break the ordering
+    def _unordered(self, *args):
+        raise TypeError("SortedSkipList is kept in sorted order; use insert_sorted")
+
+    append = prepend = insert = set_value = reverse = _unordered
@@ -0,0 +1,235 @@
+# ============================================================
+# Sorted Chunks (cache-friendly ordered set)
+# ============================================================
+#
+# The same insert / contains / delete as BinarySearchTree, but values
+# live in a list of sorted chunks instead of one node per value:
+#
+#   maxes:   [   9     |    31    |     58     ]
+#   chunks:  [1 4 7 9] [12 20 31] [40 44 51 58]
+#
+# A lookup is two binary searches: one over maxes (the last value of
+# each chunk) to pick the chunk, then one inside the chunk. Both run
+# over contiguous arrays in C (bisect), so there is no pointer chasing
+# and no per-value node object.
+#
+# fanout sets the chunk size. A chunk splits in half when it grows past
+# 2 * fanout values and merges with a neighbour when it drops below
+# fanout / 2. Inserting or deleting inside a chunk shifts at most
+# 2 * fanout slots, which is a single memmove.
+#
+# Chunks are Python lists, or array.array when a typecode is given
+# (typed mode: numbers stored unboxed, 8 bytes per value for 'q' / 'd').
+#
+# Positions (bisect) need the number of values before each chunk.
+# Those prefix sums are rebuilt lazily, in O(number of chunks), on the
+# first bisect after a change.
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+DEFAULT_FANOUT = 1000
+
+
+class SortedChunks:
+    def __init__(self, fanout=DEFAULT_FANOUT, typecode=None):
+        if fanout < 4:
+            raise ValueError("fanout must be at least 4")
+
+        self.fanout = fanout
+        self.typecode = typecode
+        self._chunks = []       # sorted, non-empty chunks
+        self._maxes = []        # last value of each chunk
+        self._offsets = None    # values before each chunk (lazy)
+        self.length = 0
+
+    def _new_chunk(self, values):
+        if self.typecode is None:
+            return list(values)
+        return array(self.typecode, values)
+
+    # --------------------------------------------------------
+    # Chunk maintenance
+    def _split(self, i):
+        chunk = self._chunks[i]
+        half = len(chunk) // 2
+        self._chunks[i:i + 1] = [chunk[:half], chunk[half:]]
+        self._maxes.insert(i, chunk[half - 1])
+
+    def _merge(self, i):
+        """
+        Merges chunk i with the chunk after it (splitting the result
+        again if it came out too big).
+        """
+        self._chunks[i] += self._chunks[i + 1]
+        del self._chunks[i + 1]
+        self._maxes[i] = self._maxes[i + 1]
+        del self._maxes[i + 1]
+
+        if len(self._chunks[i]) > 2 * self.fanout:
+            self._split(i)
+
+    def _offset(self, i):
+        if self._offsets is None:
+            self._offsets = list(accumulate(map(len, self._chunks), initial=0))
+        return self._offsets[i]
+
+    # --------------------------------------------------------
+    # Insert
+    def insert(self, value):
+        """
+        Inserts value.
+        Returns False if it is already present, otherwise True.
+        """
+        maxes = self._maxes
+
+        # Case 1: Empty container
+        if not maxes:
+            self._chunks.append(self._new_chunk([value]))
+            maxes.append(value)
+            self.length = 1
+            self._offsets = None
+            return True
+
+        i = bisect_left(maxes, value)
+
+        # Case 2: Larger than everything -> end of the last chunk
+        if i == len(maxes):
+            i -= 1
+            chunk = self._chunks[i]
+            chunk.append(value)
+            maxes[i] = value
+
+        # Case 3: Inside chunk i (duplicate check first)
+        else:
+            chunk = self._chunks[i]
+            j = bisect_left(chunk, value)
+            if chunk[j] == value:
+                return False
+            chunk.insert(j, value)
+
+        self.length += 1
+        self._offsets = None
+        if len(chunk) > 2 * self.fanout:
+            self._split(i)
+        return True
+
+    # --------------------------------------------------------
+    # Delete
+    def delete(self, value):
+        """
+        Removes value.
+        Returns True if it was found, otherwise False.
+        """
+        maxes = self._maxes
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            return False
+
+        chunk = self._chunks[i]
+        j = bisect_left(chunk, value)
+        if chunk[j] != value:
+            return False
+
+        del chunk[j]
+        self.length -= 1
+        self._offsets = None
+
+        # Case 1: Chunk is now empty -> drop it
+        if not chunk:
+            del self._chunks[i]
+            del maxes[i]
+            return True
+
+        maxes[i] = chunk[-1]
+
+        # Case 2: Chunk is too small -> merge with a neighbour
+        if len(chunk) < self.fanout // 2 and len(self._chunks) > 1:
+            self._merge(i - 1 if i > 0 else i)
+        return True
+
+    # --------------------------------------------------------
+    # Lookups
+    def contains(self, value):
+        maxes = self._maxes
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            return False
+        chunk = self._chunks[i]
+        return chunk[bisect_left(chunk, value)] == value
+
+    def bisect_left(self, value):
+        """
+        Returns the number of values < value (the position value has,
+        or would have, in sorted order).
+        """
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return self.length
+        return self._offset(i) + bisect_left(self._chunks[i], value)
+
+    def bisect(self, value):
+        """
+        Returns the number of values <= value.
+        """
+        i = bisect_right(self._maxes, value)
+        if i == len(self._maxes):
+            return self.length
+        return self._offset(i) + bisect_right(self._chunks[i], value)
+
+    def min(self):
+        return self._chunks[0][0] if self._chunks else None
+
+    def max(self):
+        return self._maxes[-1] if self._maxes else None
+
+    # --------------------------------------------------------
+    # Range iteration
+    def items(self, lo=None, hi=None):
+        """
+        Yields the values v with lo <= v < hi in ascending order
+        (a missing bound means unbounded on that side).
+        """
+        maxes = self._maxes
+        chunks = self._chunks
+        if not maxes:
+            return
+
+        # First chunk / slot at or after lo
+        if lo is None:
+            first, start = 0, 0
+        else:
+            first = bisect_left(maxes, lo)
+            if first == len(maxes):
+                return
+            start = bisect_left(chunks[first], lo)
+
+        # Last chunk / slot before hi
+        if hi is None:
+            last = len(maxes) - 1
+            stop = len(chunks[last])
+        else:
+            last = min(bisect_left(maxes, hi), len(maxes) - 1)
+            stop = bisect_left(chunks[last], hi)
+
+        if first == last:
+            yield from chunks[first][start:stop]
+            return
+        if first < last:
+            yield from chunks[first][start:]
+            for i in range(first + 1, last):
+                yield from chunks[i]
+            yield from chunks[last][:stop]
+
+    # --------------------------------------------------------
+    # Python protocol
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
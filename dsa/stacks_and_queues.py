@@ -0,0 +1,239 @@
+# ============================================================
+# Node class (shared by Stack and Queue)
+# ============================================================
+
+# value + next pointer (shared __slots__ node, see dsa/node.py)
+from .node import SinglyNode as Node
+
+# Default for the constructors, so Stack(None) still stores None
+_NO_VALUE = object()
+
+
+# ============================================================
+# Stack Implementation (LIFO) using Linked List
+# ============================================================
+
+class Stack:
+    def __init__(self, value=_NO_VALUE):
+        # Top always points to the latest inserted node
+        self.top = None
+
+        # Height tracks number of elements in stack
+        self.height = 0
+
+        # Start with one node when a value is given
+        if value is not _NO_VALUE:
+            self.push(value)
+
+    def print_stack(self):
+        # Start traversal from the top
+        temp = self.top
+        
+        # Traverse until the end
+        while temp is not None:
+            print(temp.value)
+            temp = temp.next
+
+    def push(self, value):
+        # Create a new node for the value
+        new_node = Node(value)
+
+        # If stack is empty
+        if self.height == 0:
+            self.top = new_node
+        else:
+            # Link new node to current top
+            new_node.next = self.top
+            
+            # Move top to new node
+            self.top = new_node
+
+        # Increment stack height
+        self.height += 1
+
+    def pop(self):
+        # If stack is empty, nothing to pop
+        if self.height == 0:
+            return None
+
+        # Store the current top node
+        temp = self.top
+
+        # Move top pointer to next node
+        self.top = self.top.next
+
+        # Disconnect popped node from stack
+        temp.next = None
+
+        # Decrement stack height
+        self.height -= 1
+
+        # Return popped node
+        return temp
+
+    def extend(self, iterable):
+        # Push every value in order (the last one ends up on top),
+        # linking the nodes in one pass and updating top/height once
+        top = self.top
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            new_node.next = top
+            top = new_node
+            count += 1
+
+        self.top = top
+        self.height += count
+
+    def extendleft(self, iterable):
+        # Slide values in underneath the bottom node, each one below
+        # the previous (like deque.extendleft). Finding the bottom is
+        # one O(height) walk; the new nodes are linked in one pass.
+        dummy = Node(None)
+        tail = dummy
+        count = 0
+        for value in iterable:
+            tail.next = tail = Node(value)
+            count += 1
+
+        if count == 0:
+            return
+
+        # The chain runs top-down with the last value at its end, so
+        # it hangs directly below the current bottom
+        if self.top is None:
+            self.top = dummy.next
+        else:
+            bottom = self.top
+            while bottom.next is not None:
+                bottom = bottom.next
+            bottom.next = dummy.next
+
+        self.height += count
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        # The last value of iterable becomes the top
+        stack = cls()
+        stack.extend(iterable)
+        return stack
+
+
+# ============================================================
+# Queue Implementation (FIFO) using Linked List
+# ============================================================
+
+class Queue:
+    def __init__(self, value=_NO_VALUE):
+        # First points to front of queue
+        self.first = None
+
+        # Last points to rear of queue
+        self.last = None
+
+        # Length tracks number of elements
+        self.length = 0
+
+        # Start with one node when a value is given
+        if value is not _NO_VALUE:
+            self.enqueue(value)
+
+    def print_queue(self):
+        # Start traversal from the front
+        temp = self.first
+
+        # Traverse until the end
+        while temp is not None:
+            print(temp.value)
+            temp = temp.next
+
+    def enqueue(self, value):
+        # Create a new node
+        new_node = Node(value)
+
+        # If queue is empty
+        if self.first is None:
+            self.first = new_node
+            self.last = new_node
+        else:
+            # Attach new node at the rear
+            self.last.next = new_node
+            
+            # Move last pointer
+            self.last = new_node
+
+        # Increment queue length
+        self.length += 1
+
+    def dequeue(self):
+        # If queue is empty, nothing to remove
+        if self.length == 0:
+            return None
+
+        # Store the front node
+        temp = self.first
+
+        # If only one element exists
+        if self.length == 1:
+            self.first = None
+            self.last = None
+        else:
+            # Move front pointer
+            self.first = self.first.next
+            
+            # Disconnect dequeued node
+            temp.next = None
+
+        # Decrement queue length
+        self.length -= 1
+
+        # Return removed node
+        return temp
+
+    def extend(self, iterable):
+        # Enqueue every value in order, linking the nodes in one pass
+        # and updating last/length once
+        dummy = Node(None)
+        tail = dummy
+        count = 0
+        for value in iterable:
+            tail.next = tail = Node(value)
+            count += 1
+
+        if count == 0:
+            return
+
+        if self.first is None:
+            self.first = dummy.next
+        else:
+            self.last.next = dummy.next
+        self.last = tail
+        self.length += count
+
+    def extendleft(self, iterable):
+        # Put values at the front, each one ahead of the previous
+        # (like deque.extendleft), so they come out in reverse order
+        first = self.first
+        last = None
+        count = 0
+        for value in iterable:
+            new_node = Node(value)
+            new_node.next = first
+            first = new_node
+            if last is None:
+                last = new_node
+            count += 1
+
+        if count == 0:
+            return
+
+        self.first = first
+        if self.last is None:
+            self.last = last
+        self.length += count
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        queue = cls()
+        queue.extend(iterable)
+        return queue
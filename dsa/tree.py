@@ -0,0 +1,708 @@
+# ============================================================
+# Node class for Binary Search Tree
+# ============================================================
+
+from collections import deque
+
+# value + left/right children + subtree size (shared __slots__ node,
+# see dsa/node.py). The balanced modes use subclasses that also keep
+# a height (AVL) or a color (red-black).
+from .node import TreeNode as Node
+from .node import AVLNode, RedBlackNode
+
+# Accepted values for BinarySearchTree(balance=...)
+BALANCE_MODES = (None, "avl", "red-black")
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _is_red(node):
+    # Missing children count as black
+    return node is not None and node.red
+
+
+def _sorted_unique(iterable):
+    """
+    Returns the values as a list, dropping repeats. Raises ValueError
+    if they are not in ascending order.
+    """
+    values = []
+    for value in iterable:
+        if values:
+            if value == values[-1]:
+                continue
+            if value < values[-1]:
+                raise ValueError("values must be sorted in ascending order")
+        values.append(value)
+    return values
+
+
+# ============================================================
+# Binary Search Tree (BST) Implementation
+# ============================================================
+#
+# balance=None        : plain BST, shape depends on insertion order
+#                       (sorted input degenerates into a linked list)
+# balance="avl"       : heights of sibling subtrees differ by <= 1,
+#                       height <= 1.44 log2(n)
+# balance="red-black" : no red node has a red child and every path
+#                       has the same number of black nodes,
+#                       height <= 2 log2(n); fewer rotations than AVL
+#
+# Nodes have no parent pointer: insert and delete record the path
+# from the root on a stack and walk back up it to fix sizes, heights
+# and colors. Every node stores the size of its subtree, which gives
+# rank / select in O(height).
+
+class BinarySearchTree:
+    def __init__(self, balance=None):
+        if balance not in BALANCE_MODES:
+            raise ValueError(f"balance must be one of {BALANCE_MODES}")
+
+        # Root of the BST (initially empty)
+        self.root = None
+        self.balance = balance
+
+        if balance == "avl":
+            self._node_class = AVLNode
+        elif balance == "red-black":
+            self._node_class = RedBlackNode
+        else:
+            self._node_class = Node
+
+    # --------------------------------------------------------
+    # Bulk build from sorted values (O(n))
+    @classmethod
+    def from_sorted(cls, iterable, balance=None):
+        """
+        Builds a perfectly balanced tree from values in ascending
+        order (repeats are dropped). Each node is created once and
+        nothing is compared against the root.
+        """
+        tree = cls(balance)
+        values = _sorted_unique(iterable)
+        # Only the deepest level can be partly filled; in red-black
+        # mode it is colored red and every other level black
+        bottom = len(values).bit_length() - 1
+        tree.root = tree._build(values, 0, len(values), 0, bottom)
+        return tree
+
+    def _build(self, values, lo, hi, depth, bottom):
+        """
+        Returns the root of a subtree holding values[lo:hi], with the
+        middle value on top. Recursion depth is only log2(n).
+        """
+        if lo >= hi:
+            return None
+
+        mid = (lo + hi) // 2
+        node = self._node_class(values[mid])
+        node.left = self._build(values, lo, mid, depth + 1, bottom)
+        node.right = self._build(values, mid + 1, hi, depth + 1, bottom)
+        node.size = hi - lo
+
+        if self.balance == "avl":
+            node.height = max(_height(node.left), _height(node.right)) + 1
+        elif self.balance == "red-black":
+            node.red = depth == bottom and depth > 0
+        return node
+
+    # --------------------------------------------------------
+    # Rotation helpers
+    #
+    #       node                 pivot
+    #      /    \    left       /     \
+    #     a    pivot  --->    node     c
+    #         /    \         /    \
+    #        b      c       a      b
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        return self._after_rotation(node, pivot)
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        return self._after_rotation(node, pivot)
+
+    def _after_rotation(self, node, pivot):
+        # node moved below pivot: fix node first, then pivot
+        pivot.size = node.size
+        node.size = _size(node.left) + _size(node.right) + 1
+        if self.balance == "avl":
+            node.height = max(_height(node.left), _height(node.right)) + 1
+            pivot.height = max(_height(pivot.left), _height(pivot.right)) + 1
+        return pivot
+
+    def _relink(self, parent, old, new):
+        """
+        Puts new where old was below parent (or at the root).
+        """
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    # --------------------------------------------------------
+    # AVL rebalancing
+    def _avl_fix(self, node):
+        """
+        Updates node's height and rotates it back into balance.
+        Returns the new root of this subtree.
+        """
+        left_height = _height(node.left)
+        right_height = _height(node.right)
+        node.height = max(left_height, right_height) + 1
+
+        # Left-heavy (rotate the left child first if it leans right)
+        if left_height - right_height > 1:
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+
+        # Right-heavy (mirror image)
+        if right_height - left_height > 1:
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+
+        return node
+
+    def _avl_rebalance(self, path, inserting):
+        """
+        Fixes heights bottom-up along the recorded path (sizes are
+        already updated), stopping as soon as nothing above can change:
+        - once a subtree's height is the same as before, or
+        - after an insert, once a rotation has happened (it restores
+          the height the subtree had before the insert).
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            top = self._avl_fix(node)
+            if top is not node:
+                self._relink(path[i - 1] if i else None, node, top)
+                if inserting:
+                    return
+            if top.height == old_height:
+                return
+
+    # --------------------------------------------------------
+    # Red-black fix-ups
+    def _red_black_insert_fix(self, node, path):
+        """
+        Restores the red-black rules after node (red) was attached;
+        path holds its ancestors, parent last.
+        """
+        while path and path[-1].red:
+            # A red parent is never the root, so the grandparent exists
+            parent = path.pop()
+            grand = path.pop()
+
+            if parent is grand.left:
+                uncle = grand.right
+
+                # Case 1: red uncle -> recolor and continue from grand
+                if _is_red(uncle):
+                    parent.red = uncle.red = False
+                    grand.red = True
+                    node = grand
+                    continue
+
+                # Case 2: inner child -> rotate it to the outside
+                if node is parent.right:
+                    grand.left = self._rotate_left(parent)
+                    parent = grand.left
+
+                # Case 3: outer child -> rotate the grandparent
+                parent.red = False
+                grand.red = True
+                self._relink(path[-1] if path else None, grand, self._rotate_right(grand))
+            else:
+                uncle = grand.left
+
+                if _is_red(uncle):
+                    parent.red = uncle.red = False
+                    grand.red = True
+                    node = grand
+                    continue
+
+                if node is parent.left:
+                    grand.right = self._rotate_right(parent)
+                    parent = grand.right
+
+                parent.red = False
+                grand.red = True
+                self._relink(path[-1] if path else None, grand, self._rotate_left(grand))
+            break
+
+        self.root.red = False
+
+    def _red_black_delete_fix(self, node, path):
+        """
+        Restores the red-black rules after a black node was removed;
+        node (possibly None) took its place and path holds node's
+        ancestors, parent last.
+        """
+        while path and not _is_red(node):
+            parent = path[-1]
+            grand = path[-2] if len(path) > 1 else None
+
+            if node is parent.left:
+                sibling = parent.right
+
+                # Case 1: red sibling -> rotate so the sibling is black
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    top = self._rotate_left(parent)
+                    self._relink(grand, parent, top)
+                    path.insert(len(path) - 1, top)
+                    grand = top
+                    sibling = parent.right
+
+                # Case 2: both nephews black -> recolor, move up
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.red = True
+                    node = path.pop()
+                    continue
+
+                # Case 3: far nephew black -> rotate the sibling
+                if not _is_red(sibling.right):
+                    sibling.left.red = False
+                    sibling.red = True
+                    parent.right = self._rotate_right(sibling)
+                    sibling = parent.right
+
+                # Case 4: far nephew red -> rotate the parent, done
+                sibling.red = parent.red
+                parent.red = False
+                sibling.right.red = False
+                self._relink(grand, parent, self._rotate_left(parent))
+            else:
+                sibling = parent.left
+
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    top = self._rotate_right(parent)
+                    self._relink(grand, parent, top)
+                    path.insert(len(path) - 1, top)
+                    grand = top
+                    sibling = parent.left
+
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.red = True
+                    node = path.pop()
+                    continue
+
+                if not _is_red(sibling.left):
+                    sibling.right.red = False
+                    sibling.red = True
+                    parent.left = self._rotate_left(sibling)
+                    sibling = parent.left
+
+                sibling.red = parent.red
+                parent.red = False
+                sibling.left.red = False
+                self._relink(grand, parent, self._rotate_right(parent))
+            return
+
+        if node is not None:
+            node.red = False
+
+    # --------------------------------------------------------
+    # Insert
+    def insert(self, value):
+        """
+        Inserts a value into the BST.
+        Returns True if insertion is successful.
+        Returns False if duplicate value is found.
+        """
+
+        # Case 1: Empty tree
+        if self.root is None:
+            self.root = self._node_class(value)
+            if self.balance == "red-black":
+                self.root.red = False
+            return True
+
+        # Walk down, remembering the path (the node is only created
+        # once we know the value is new)
+        path = []
+        temp = self.root
+
+        while temp is not None:
+            # Duplicate value check
+            if value == temp.value:
+                return False
+
+            path.append(temp)
+
+            # Go left if value is smaller, right if larger
+            if value < temp.value:
+                temp = temp.left
+            else:
+                temp = temp.right
+
+        new_node = self._node_class(value)
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        for node in path:
+            node.size += 1
+
+        if self.balance == "avl":
+            self._avl_rebalance(path, inserting=True)
+        elif self.balance == "red-black":
+            self._red_black_insert_fix(new_node, path)
+        return True
+
+    # --------------------------------------------------------
+    # Delete
+    def delete(self, value):
+        """
+        Removes a value from the BST.
+        Returns True if it was found, otherwise False.
+        """
+        path = []
+        temp = self.root
+
+        while temp is not None:
+            if value < temp.value:
+                path.append(temp)
+                temp = temp.left
+            elif value > temp.value:
+                path.append(temp)
+                temp = temp.right
+            else:
+                break
+
+        # Case 1: Value not in the tree
+        if temp is None:
+            return False
+
+        # Case 2: Two children -> take the successor's value and
+        # remove the successor instead (it has no left child)
+        if temp.left is not None and temp.right is not None:
+            path.append(temp)
+            successor = temp.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            temp.value = successor.value
+            temp = successor
+
+        # Case 3: At most one child -> splice it into temp's place
+        child = temp.left if temp.left is not None else temp.right
+        self._relink(path[-1] if path else None, temp, child)
+
+        for node in path:
+            node.size -= 1
+
+        if self.balance == "avl":
+            self._avl_rebalance(path, inserting=False)
+        elif self.balance == "red-black" and not temp.red:
+            self._red_black_delete_fix(child, path)
+        return True
+
+    # --------------------------------------------------------
+    # Contains (search)
+    def contains(self, value):
+        """
+        Searches for a value in the BST.
+        Returns True if found, otherwise False.
+        """
+
+        temp = self.root
+
+        # Traverse until node is found or tree ends
+        while temp is not None:
+            if value < temp.value:
+                temp = temp.left
+            elif value > temp.value:
+                temp = temp.right
+            else:
+                return True
+
+        return False
+
+    # --------------------------------------------------------
+    # Ordered queries (None when there is no such value)
+    def min(self):
+        temp = self.root
+        if temp is None:
+            return None
+        while temp.left is not None:
+            temp = temp.left
+        return temp.value
+
+    def max(self):
+        temp = self.root
+        if temp is None:
+            return None
+        while temp.right is not None:
+            temp = temp.right
+        return temp.value
+
+    def floor(self, value):
+        """
+        Returns the largest value <= value.
+        """
+        best = None
+        temp = self.root
+        while temp is not None:
+            if value < temp.value:
+                temp = temp.left
+            elif value > temp.value:
+                best = temp.value
+                temp = temp.right
+            else:
+                return temp.value
+        return best
+
+    def ceiling(self, value):
+        """
+        Returns the smallest value >= value.
+        """
+        best = None
+        temp = self.root
+        while temp is not None:
+            if value < temp.value:
+                best = temp.value
+                temp = temp.left
+            elif value > temp.value:
+                temp = temp.right
+            else:
+                return temp.value
+        return best
+
+    def rank(self, value):
+        """
+        Returns how many values in the tree are smaller than value.
+        """
+        rank = 0
+        temp = self.root
+        while temp is not None:
+            if value < temp.value:
+                temp = temp.left
+            elif value > temp.value:
+                rank += _size(temp.left) + 1
+                temp = temp.right
+            else:
+                return rank + _size(temp.left)
+        return rank
+
+    def select(self, k):
+        """
+        Returns the k-th smallest value (k = 0 is the minimum), or
+        None if k is out of range.
+        """
+        if k < 0 or k >= _size(self.root):
+            return None
+
+        temp = self.root
+        while True:
+            left_size = _size(temp.left)
+            if k < left_size:
+                temp = temp.left
+            elif k > left_size:
+                k -= left_size + 1
+                temp = temp.right
+            else:
+                return temp.value
+
+    # --------------------------------------------------------
+    # Range queries
+    def range(self, lo=None, hi=None):
+        """
+        Yields the values v with lo <= v < hi in ascending order
+        (a missing bound means unbounded on that side). Subtrees
+        entirely below lo are never visited.
+        """
+        stack = []
+        temp = self.root
+        while stack or temp is not None:
+            while temp is not None:
+                if lo is not None and temp.value < lo:
+                    temp = temp.right
+                else:
+                    stack.append(temp)
+                    temp = temp.left
+            if not stack:
+                return
+            temp = stack.pop()
+            if hi is not None and temp.value >= hi:
+                return
+            yield temp.value
+            temp = temp.right
+
+    def count_range(self, lo, hi):
+        """
+        Returns how many values v satisfy lo <= v < hi, in O(height)
+        through the subtree sizes.
+        """
+        return max(0, self.rank(hi) - self.rank(lo))
+
+    # --------------------------------------------------------
+    # Traversals (generators with an explicit stack / queue, so a
+    # degenerate tree deeper than the recursion limit is fine)
+    def inorder(self):
+        """
+        Yields values in ascending order: left, node, right.
+        """
+        stack = []
+        temp = self.root
+        while stack or temp is not None:
+            while temp is not None:
+                stack.append(temp)
+                temp = temp.left
+            temp = stack.pop()
+            yield temp.value
+            temp = temp.right
+
+    def preorder(self):
+        """
+        Yields values node first, then left subtree, then right.
+        """
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            temp = stack.pop()
+            yield temp.value
+            # Right goes on the stack first so left comes out first
+            if temp.right is not None:
+                stack.append(temp.right)
+            if temp.left is not None:
+                stack.append(temp.left)
+
+    def postorder(self):
+        """
+        Yields values left subtree, then right subtree, then node.
+        """
+        stack = []
+        last = None         # node yielded most recently
+        temp = self.root
+        while stack or temp is not None:
+            if temp is not None:
+                stack.append(temp)
+                temp = temp.left
+                continue
+
+            top = stack[-1]
+            # Visit the right subtree first, unless we just came back
+            # from it
+            if top.right is not None and top.right is not last:
+                temp = top.right
+            else:
+                yield top.value
+                last = stack.pop()
+
+    def level_order(self):
+        """
+        Yields values level by level, left to right (breadth-first).
+        """
+        queue = deque([self.root] if self.root is not None else [])
+        while queue:
+            temp = queue.popleft()
+            yield temp.value
+            if temp.left is not None:
+                queue.append(temp.left)
+            if temp.right is not None:
+                queue.append(temp.right)
+
+    # --------------------------------------------------------
+    # Shape
+    def height(self):
+        """
+        Number of levels (0 for an empty tree). Counted level by
+        level, so a degenerate tree does not hit the recursion limit.
+        """
+        height = 0
+        level = [self.root] if self.root is not None else []
+        while level:
+            height += 1
+            level = [child for node in level
+                     for child in (node.left, node.right) if child is not None]
+        return height
+
+    # --------------------------------------------------------
+    # Set operations (linear merge of the sorted values + rebuild)
+    def union(self, other):
+        """
+        Returns a new tree with the values in either tree.
+        """
+        a, b = list(self), list(other)
+        merged = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                merged.append(a[i])
+                i += 1
+            elif b[j] < a[i]:
+                merged.append(b[j])
+                j += 1
+            else:
+                merged.append(a[i])
+                i += 1
+                j += 1
+        merged.extend(a[i:])
+        merged.extend(b[j:])
+        return type(self).from_sorted(merged, self.balance)
+
+    def intersection(self, other):
+        """
+        Returns a new tree with the values in both trees.
+        """
+        a, b = list(self), list(other)
+        common = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                i += 1
+            elif b[j] < a[i]:
+                j += 1
+            else:
+                common.append(a[i])
+                i += 1
+                j += 1
+        return type(self).from_sorted(common, self.balance)
+
+    def difference(self, other):
+        """
+        Returns a new tree with the values in this tree but not in
+        other.
+        """
+        a, b = list(self), list(other)
+        kept = []
+        i = j = 0
+        while i < len(a):
+            if j == len(b) or a[i] < b[j]:
+                kept.append(a[i])
+                i += 1
+            elif b[j] < a[i]:
+                j += 1
+            else:
+                i += 1
+                j += 1
+        return type(self).from_sorted(kept, self.balance)
+
+    # --------------------------------------------------------
+    # Python protocol
+    def __len__(self):
+        return _size(self.root)
+
+    def __iter__(self):
+        return self.inorder()